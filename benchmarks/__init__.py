@@ -0,0 +1,10 @@
+"""Benchmarks of interface definition, conformance checks and their caches.
+
+Run the whole suite with `python -m benchmarks`, see `--help` for options. Results
+are compared with the stored `baseline.json` using `--compare`, or with other stored
+results using `--compare --baseline PATH`, and a new baseline is written with
+`--output benchmarks/baseline.json`.
+
+The `*_bench.py` scripts are focused comparisons runnable on their own;
+`threads_bench.py` stress-tests the caches from many threads and reports scaling.
+"""
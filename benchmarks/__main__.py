@@ -0,0 +1,72 @@
+import argparse
+import json
+import pathlib
+import platform
+import sys
+import typing
+
+from . import suite
+
+
+BASELINE = pathlib.Path(__file__).with_name('baseline.json')
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('cases', nargs='*', help=f"any of {', '.join(suite.CASES)}")
+    parser.add_argument('--output', type=pathlib.Path, help='write results as JSON')
+    parser.add_argument(
+        '--compare', action='store_true', help='compare with the baseline results'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=pathlib.Path,
+        default=BASELINE,
+        help=f'stored results to compare with, {BASELINE.name} by default',
+    )
+    args = parser.parse_args(argv)
+
+    unknown = set(args.cases) - suite.CASES.keys()
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.cases or suite.CASES:
+        results[name] = suite.CASES[name]()
+
+    reference = json.loads(args.baseline.read_text())['results'] if args.compare else {}
+
+    for name, measurements in results.items():
+        print(name)
+        for params, value in measurements.items():
+            line = f'  {params:<40} {_format(params, value):>12}'
+            previous = reference.get(name, {}).get(params)
+            if previous:
+                line += f'  {value / previous:6.2f}x'
+            print(line)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    'python': sys.version,
+                    'platform': platform.platform(),
+                    'results': results,
+                },
+                indent=2,
+                sort_keys=True,
+            )
+            + '\n'
+        )
+
+
+def _format(params: str, value: float) -> str:
+    if params.endswith(('bytes_per_pair', 'bytes_per_spec')):
+        return f'{value / 1024:.1f} KiB'
+    if value < 1e-3:
+        return f'{value * 1e6:.2f} us'
+    return f'{value * 1e3:.2f} ms'
+
+
+if __name__ == '__main__':
+    main()
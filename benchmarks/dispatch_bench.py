@@ -0,0 +1,75 @@
+"""Compare `interfaces.dispatch` with `functools.singledispatch` on ABCs.
+
+Run with `python benchmarks/dispatch_bench.py [handlers]`.
+"""
+import abc
+import functools
+import pathlib
+import sys
+import timeit
+import typing
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
+
+import interfaces  # noqa: E402
+
+
+def make_handlers(count: int) -> typing.Tuple[typing.Any, typing.Any, object]:
+    @interfaces.dispatch
+    def iface_handle(obj: object) -> int:
+        return -1
+
+    @functools.singledispatch
+    def abc_handle(obj: object) -> int:
+        return -1
+
+    for index in range(count):
+        method_name = f'method_{index}'
+        members = {method_name: lambda self: None}
+        iface = type(interfaces.interface)(
+            f'Interface{index}', (interfaces.interface,), members
+        )
+        abc_class = abc.ABCMeta(
+            f'ABC{index}',
+            (abc.ABC,),
+            {
+                '__subclasshook__': classmethod(
+                    lambda cls, sub, name=method_name: hasattr(sub, name)
+                    or NotImplemented
+                )
+            },
+        )
+        iface_handle.register(iface, functools.partial(lambda index, obj: index, index))
+        abc_handle.register(
+            abc_class, functools.partial(lambda index, obj: index, index)
+        )
+
+    target_class = type('Target', (), {f'method_{count - 1}': lambda self: None})
+    return iface_handle, abc_handle, target_class()
+
+
+def main(count: int = 50, number: int = 200_000) -> None:
+    iface_handle, abc_handle, target = make_handlers(count)
+    assert iface_handle(target) == abc_handle(target) == count - 1
+
+    cases = (
+        ('interfaces.dispatch', iface_handle, iface_handle.cache_clear),
+        ('functools.singledispatch', abc_handle, abc_handle._clear_cache),
+    )
+
+    print(f'registered handlers: {count}')
+    for name, handle, _ in cases:
+        elapsed = min(timeit.repeat(lambda: handle(target), number=number))
+        print(f'{name:<26} {elapsed / number * 1e9:8.0f} ns per warm call')
+
+    cold_number = number // 100
+    for name, handle, cache_clear in cases:
+        elapsed = min(
+            timeit.repeat(lambda: (cache_clear(), handle(target)), number=cold_number)
+        )
+        print(f'{name:<26} {elapsed / cold_number * 1e6:8.1f} us per cold call')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
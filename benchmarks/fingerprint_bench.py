@@ -0,0 +1,70 @@
+"""Compare live `inspect.signature` conformance checks with precomputed fingerprints.
+
+Run with `python benchmarks/fingerprint_bench.py [width]`.
+"""
+import inspect
+import pathlib
+import sys
+import timeit
+import typing
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
+
+import interfaces  # noqa: E402
+
+
+def make_interface_and_class(width: int) -> typing.Tuple[type, type]:
+    namespace: typing.Dict[str, typing.Any] = {}
+    source = '\n'.join(
+        f'def method_{i}(self, arg: int, *, flag: bool = False) -> str:\n    pass'
+        for i in range(width)
+    )
+    exec(source, namespace)
+    members = {f'method_{i}': namespace[f'method_{i}'] for i in range(width)}
+    iface = type(interfaces.interface)(
+        'BenchInterface', (interfaces.interface,), dict(members)
+    )
+
+    exec(source, namespace)
+    members = {f'method_{i}': namespace[f'method_{i}'] for i in range(width)}
+    klass = type('BenchClass', (), members)
+    return iface, klass
+
+
+def live_signature_check(cls: type, iface: type) -> bool:
+    for attr_name, iface_attr in interfaces.interface_spec(iface).items():
+        cls_attr = inspect.getattr_static(cls, attr_name)
+        if not (
+            inspect.isfunction(iface_attr)
+            and inspect.isfunction(cls_attr)
+            and inspect.signature(cls_attr) == inspect.signature(iface_attr)
+        ):
+            return False
+    return True
+
+
+def fingerprint_check(cls: type, iface: type) -> bool:
+    return (
+        interfaces.util._find_unimplemented(cls, interfaces.interface_spec(iface))
+        is None
+    )
+
+
+def main(width: int = 60, number: int = 200) -> None:
+    iface, klass = make_interface_and_class(width)
+    assert live_signature_check(klass, iface) and fingerprint_check(klass, iface)
+
+    live = min(timeit.repeat(lambda: live_signature_check(klass, iface), number=number))
+    fingerprint = min(
+        timeit.repeat(lambda: fingerprint_check(klass, iface), number=number)
+    )
+
+    print(f'interface width: {width} methods')
+    print(f'live inspect.signature: {live / number * 1e6:10.1f} us per check')
+    print(f'fingerprints:           {fingerprint / number * 1e6:10.1f} us per check')
+    print(f'speedup:                {live / fingerprint:10.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,192 @@
+"""Synthetic interfaces and implementations of configurable shape."""
+from __future__ import annotations
+
+import types
+import typing
+
+import interfaces
+
+
+_counter = 0
+
+
+def _unique(prefix: str) -> str:
+    global _counter
+    _counter += 1
+    return f'{prefix}{_counter}'
+
+
+def _method(name: str) -> types.FunctionType:
+    namespace: typing.Dict[str, typing.Any] = {}
+    exec(
+        f'def {name}(self, arg: int, *args: str, flag: bool = False) -> str:\n'
+        '    pass',
+        namespace,
+    )
+    return namespace[name]
+
+
+def _clone(func: types.FunctionType) -> types.FunctionType:
+    """Return a distinct function object with the same signature."""
+    clone = types.FunctionType(
+        func.__code__, func.__globals__, func.__name__, func.__defaults__
+    )
+    clone.__kwdefaults__ = func.__kwdefaults__
+    clone.__annotations__ = dict(func.__annotations__)
+    return clone
+
+
+def _clone_member(member: typing.Any) -> typing.Any:
+    """Return a copy of `member` around distinct function objects."""
+    if isinstance(member, types.FunctionType):
+        return _clone(member)
+    if isinstance(member, (classmethod, staticmethod)):
+        return type(member)(_clone(member.__func__))
+    if isinstance(member, property) and isinstance(member.fget, types.FunctionType):
+        return property(_clone(member.fget), member.fset, member.fdel)
+    return member
+
+
+def _typed_property(name: str) -> property:
+    namespace: typing.Dict[str, typing.Any] = {}
+    exec(f'def {name}(self) -> int:\n    pass', namespace)
+    return property(namespace[name])
+
+
+def interface_namespaces(
+    width: int = 10, depth: int = 1, descriptors: int = 0, kinds: int = 0
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Members of `depth` interface levels adding `width` methods each.
+
+    Every level also adds `descriptors` properties and `kinds` members of each
+    other kind: class methods, static methods, typed properties and annotated
+    attributes.
+    """
+    namespaces = []
+    for level in range(depth):
+        members: typing.Dict[str, typing.Any] = {
+            f'method_{level}_{index}': _method(f'method_{level}_{index}')
+            for index in range(width)
+        }
+        members.update(
+            (f'value_{level}_{index}', property(lambda self: None))
+            for index in range(descriptors)
+        )
+        for index in range(kinds):
+            members[f'cls_{level}_{index}'] = classmethod(
+                _method(f'cls_{level}_{index}')
+            )
+            members[f'static_{level}_{index}'] = staticmethod(
+                _method(f'static_{level}_{index}')
+            )
+            members[f'prop_{level}_{index}'] = _typed_property(f'prop_{level}_{index}')
+        if kinds:
+            members['__annotations__'] = {
+                f'attr_{level}_{index}': int for index in range(kinds)
+            }
+        namespaces.append(members)
+    return namespaces
+
+
+def make_interface(
+    width: int = 10,
+    depth: int = 1,
+    descriptors: int = 0,
+    kinds: int = 0,
+    namespaces: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None,
+    base: interfaces.typing.InterfaceType = interfaces.interface,
+) -> interfaces.typing.InterfaceType:
+    """Build a chain of interfaces on top of `base`, see `interface_namespaces`.
+
+    Prebuilt `namespaces` are cloned so every interface gets its own functions.
+    """
+    if namespaces is None:
+        namespaces = interface_namespaces(width, depth, descriptors, kinds)
+
+    iface = base
+    for members in namespaces:
+        iface = type(interfaces.interface)(
+            _unique('BenchInterface'),
+            (iface,),
+            {
+                attr_name: _clone_member(attr)
+                if attr_name != '__annotations__'
+                else dict(attr)
+                for attr_name, attr in members.items()
+            },
+        )
+    return iface
+
+
+def implementation_namespace(
+    iface: interfaces.typing.InterfaceType,
+) -> typing.Dict[str, typing.Any]:
+    """Members implementing `iface`, attributes as annotated class values."""
+    namespace: typing.Dict[str, typing.Any] = {}
+    annotations: typing.Dict[str, typing.Any] = {}
+    for attr_name, attr in interfaces.interface_spec(iface).items():
+        if isinstance(attr, interfaces.spec.Attribute):
+            annotations[attr_name] = attr.annotation
+            namespace[attr_name] = None
+        else:
+            namespace[attr_name] = _clone_member(attr)
+    if annotations:
+        namespace['__annotations__'] = annotations
+    return namespace
+
+
+def make_implementation(
+    iface: interfaces.typing.InterfaceType, explicit: bool = False
+) -> type:
+    namespace = implementation_namespace(iface)
+    if explicit:
+        return types.new_class(
+            _unique('BenchClass'),
+            (interfaces.object,),
+            {'implements': iface},
+            lambda ns: ns.update(namespace),
+        )
+    return type(_unique('BenchClass'), (), namespace)
+
+
+def make_generic_interface(
+    width: int = 10, variance: bool = True
+) -> typing.Tuple[interfaces.typing.InterfaceType, type]:
+    """Build an interface of methods with string generic annotations.
+
+    The returned implementation narrows every return type, so it only conforms
+    in variance mode.
+    """
+    iface_namespace: typing.Dict[str, typing.Any] = {'typing': typing}
+    cls_namespace: typing.Dict[str, typing.Any] = {'typing': typing}
+    for index in range(width):
+        params = (
+            "self, items: 'typing.Sequence[typing.Mapping[str, int]]',"
+            " *, key: 'typing.Optional[str]' = None"
+        )
+        exec(
+            f'def method_{index}({params})'
+            " -> 'typing.Iterable[typing.Tuple[str, int]]':\n    pass",
+            iface_namespace,
+        )
+        exec(
+            f'def method_{index}({params})'
+            " -> 'typing.List[typing.Tuple[str, bool]]':\n    pass",
+            cls_namespace,
+        )
+
+    members = {
+        f'method_{index}': iface_namespace[f'method_{index}'] for index in range(width)
+    }
+    iface = types.new_class(
+        _unique('BenchInterface'),
+        (interfaces.interface,),
+        {'variance': variance},
+        lambda ns: ns.update(members),
+    )
+    cls = type(
+        _unique('BenchClass'),
+        (),
+        {f'method_{index}': cls_namespace[f'method_{index}'] for index in range(width)},
+    )
+    return iface, cls
@@ -0,0 +1,74 @@
+"""Compare `isinstance` against an interface, an ABC and a runtime checkable Protocol.
+
+Run with `python benchmarks/instancecheck_bench.py`.
+"""
+import abc
+import pathlib
+import sys
+import timeit
+import typing
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
+
+import interfaces  # noqa: E402
+
+
+class BenchInterface(interfaces.interface):
+    def method_a(self, arg: int) -> int:
+        pass
+
+    def method_b(self, arg: int) -> int:
+        pass
+
+
+class BenchABC(abc.ABC):
+    @abc.abstractmethod
+    def method_a(self, arg: int) -> int:
+        pass
+
+    @abc.abstractmethod
+    def method_b(self, arg: int) -> int:
+        pass
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> bool:
+        return all(hasattr(subclass, name) for name in ('method_a', 'method_b'))
+
+
+@typing.runtime_checkable
+class BenchProtocol(typing.Protocol):
+    def method_a(self, arg: int) -> int:
+        ...
+
+    def method_b(self, arg: int) -> int:
+        ...
+
+
+class BenchClass:
+    def method_a(self, arg: int) -> int:
+        pass
+
+    def method_b(self, arg: int) -> int:
+        pass
+
+
+def main(number: int = 200_000) -> None:
+    instance = BenchClass()
+    baseline = {BenchClass: True}
+
+    cases = {
+        'dict lookup': lambda: baseline[type(instance)],
+        'interfaces.interface': lambda: isinstance(instance, BenchInterface),
+        'abc.ABCMeta': lambda: isinstance(instance, BenchABC),
+        'typing.Protocol': lambda: isinstance(instance, BenchProtocol),
+    }
+
+    for name, case in cases.items():
+        assert case()
+        elapsed = min(timeit.repeat(case, number=number))
+        print(f'{name:<22} {elapsed / number * 1e9:8.0f} ns per call')
+
+
+if __name__ == '__main__':
+    main()
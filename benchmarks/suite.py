@@ -0,0 +1,256 @@
+"""Benchmark cases, each returning seconds per operation or bytes."""
+import gc
+import subprocess
+import sys
+import timeit
+import tracemalloc
+import typing
+
+import interfaces
+
+from . import generators
+
+
+Case = typing.Callable[[], typing.Dict[str, float]]
+
+CASES: typing.Dict[str, Case] = {}
+
+
+def case(name: str) -> typing.Callable[[Case], Case]:
+    def register(func: Case) -> Case:
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def per_op(
+    stmt: typing.Callable[[], typing.Any], number: int, repeat: int = 5
+) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+
+@case('define_interface')
+def define_interface() -> typing.Dict[str, float]:
+    results = {}
+    for width, depth in ((10, 1), (100, 1), (10, 10), (10, 50)):
+        namespaces = generators.interface_namespaces(width=width, depth=depth)
+        results[f'width={width},depth={depth}'] = per_op(
+            lambda: interfaces.interface_spec(
+                generators.make_interface(namespaces=namespaces)
+            ),
+            number=5,
+        )
+    return results
+
+
+@case('define_subinterface')
+def define_subinterface() -> typing.Dict[str, float]:
+    results = {}
+    for depth in (1, 50, 200):
+        # Only the last level is timed, on top of an existing hierarchy
+        base = generators.make_interface(width=10, depth=depth)
+        interfaces.interface_spec(base)
+        namespaces = generators.interface_namespaces(width=10, depth=depth + 1)[-1:]
+        results[f'width=10,depth={depth}'] = per_op(
+            lambda: interfaces.interface_spec(
+                generators.make_interface(namespaces=namespaces, base=base)
+            ),
+            number=20,
+        )
+    return results
+
+
+@case('define_implementation')
+def define_implementation() -> typing.Dict[str, float]:
+    results = {}
+    for width in (10, 100):
+        iface = generators.make_interface(width=width)
+        namespace = generators.implementation_namespace(iface)
+        results[f'width={width},explicit'] = per_op(
+            lambda: generators.make_implementation(iface, explicit=True), number=20
+        )
+        results[f'width={width},plain'] = per_op(
+            lambda: type('BenchClass', (), dict(namespace)), number=20
+        )
+    return results
+
+
+@case('isimplementation_cold')
+def isimplementation_cold() -> typing.Dict[str, float]:
+    results = {}
+    for width, descriptors in ((10, 0), (100, 0), (10, 10)):
+        iface = generators.make_interface(width=width, descriptors=descriptors)
+        cls = generators.make_implementation(iface)
+
+        def check() -> None:
+            interfaces.cache_clear(iface)
+            interfaces.isimplementation(cls, iface)
+
+        results[f'width={width},descriptors={descriptors}'] = per_op(check, 200)
+    return results
+
+
+@case('member_kinds')
+def member_kinds() -> typing.Dict[str, float]:
+    results = {}
+    for width in (10, 100):
+        # A fifth of each kind: methods, class and static methods, properties and
+        # attributes
+        namespaces = generators.interface_namespaces(width=width // 5, kinds=width // 5)
+        results[f'width={width},define'] = per_op(
+            lambda: interfaces.interface_spec(
+                generators.make_interface(namespaces=namespaces)
+            ),
+            number=20,
+        )
+
+        iface = generators.make_interface(namespaces=namespaces)
+        cls = generators.make_implementation(iface)
+        assert interfaces.isimplementation(cls, iface)
+
+        def check() -> None:
+            interfaces.cache_clear(iface)
+            interfaces.isimplementation(cls, iface)
+
+        results[f'width={width},cold'] = per_op(check, 200)
+    return results
+
+
+@case('issubclass_warm')
+def issubclass_warm() -> typing.Dict[str, float]:
+    results = {}
+    for width in (1, 10, 100):
+        iface = generators.make_interface(width=width)
+        cls = generators.make_implementation(iface)
+        instance = cls()
+        results[f'width={width},issubclass'] = per_op(
+            lambda: issubclass(cls, iface), 20_000
+        )
+        results[f'width={width},isinstance'] = per_op(
+            lambda: isinstance(instance, iface), 20_000
+        )
+    return results
+
+
+@case('variance')
+def variance() -> typing.Dict[str, float]:
+    results = {}
+    for width in (10, 100):
+        iface, cls = generators.make_generic_interface(width=width)
+        assert interfaces.isimplementation(cls, iface)
+
+        def check() -> None:
+            interfaces.cache_clear(iface)
+            interfaces.isimplementation(cls, iface)
+
+        results[f'width={width},cold'] = per_op(check, 200)
+        results[f'width={width},warm'] = per_op(
+            lambda: interfaces.isimplementation(cls, iface), 20_000
+        )
+    return results
+
+
+@case('implementers')
+def implementers() -> typing.Dict[str, float]:
+    results = {}
+    ifaces = [generators.make_interface(width=10) for _ in range(10)]
+    for count in (10, 100):
+        classes = [generators.make_implementation(ifaces[0]) for _ in range(count)]
+
+        def loop() -> None:
+            interfaces.cache_clear()
+            for cls in classes:
+                for iface in ifaces:
+                    interfaces.isimplementation(cls, iface)
+
+        results[f'classes={count},isimplementation'] = per_op(loop, 3)
+        results[f'classes={count},verify_matrix'] = per_op(
+            lambda: interfaces.verify_matrix(classes, ifaces), 3
+        )
+    return results
+
+
+@case('memory')
+def memory() -> typing.Dict[str, float]:
+    results = {}
+    for width in (10, 100):
+        gc.collect()
+        tracemalloc.start()
+        keep = []
+        for _ in range(20):
+            iface = generators.make_interface(width=width)
+            keep.append((iface, generators.make_implementation(iface, explicit=True)))
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f'width={width},bytes_per_pair'] = size / len(keep)
+    return results
+
+
+@case('spec_memory')
+def spec_memory() -> typing.Dict[str, float]:
+    results = {}
+    for width, depth in ((10, 10), (10, 50), (100, 10)):
+        # Interfaces and their members' fingerprints are built first so only the
+        # specs are measured
+        iface = generators.make_interface(width=width, depth=depth)
+        for klass in iface.__mro__:
+            interfaces.interface_spec.discard(klass)
+            for member in vars(klass).values():
+                interfaces.spec.member_fingerprint(member)
+        gc.collect()
+        tracemalloc.start()
+        interfaces.interface_spec(iface).fingerprints()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f'width={width},depth={depth},bytes_per_spec'] = size / depth
+    return results
+
+
+DECLARATION_SOURCE = '''
+import interfaces
+
+class Base(interfaces.interface):
+    def method(self, arg: int) -> int:
+        pass
+
+class Derived(Base):
+    def other(self) -> None:
+        pass
+'''
+
+
+@case('import_time')
+def import_time() -> typing.Dict[str, float]:
+    results = {}
+    for params, source in (
+        ('import', 'import interfaces'),
+        ('import,define', DECLARATION_SOURCE),
+    ):
+        results[params] = min(sum(imported_modules(source).values()) for _ in range(5))
+    return results
+
+
+def imported_modules(source: str) -> typing.Dict[str, float]:
+    """Run `source` with `-X importtime`, return the top-level `interfaces` imports.
+
+    Values are the cumulative import times in seconds including submodules.
+    """
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', source],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        # Nested imports are indented further
+        if name.startswith(' interfaces') and cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative) / 1e6
+    return modules
@@ -0,0 +1,156 @@
+"""Hammer conformance checks from many threads and report throughput scaling.
+
+Run with `python benchmarks/threads_bench.py [--threads 1 2 4 8] [--seconds 1]`.
+
+Every worker checks a pool of classes against a pool of interfaces with
+`isimplementation`, `issubclass` and `isinstance` and asserts every verdict. With
+`--mutate` another thread keeps redefining a method of one interface, which
+clears its caches concurrently with the readers. Throughput only scales past one
+thread on free-threaded builds; with the GIL the harness mostly shows contention
+overhead and checks correctness.
+"""
+import argparse
+import pathlib
+import sys
+import sysconfig
+import threading
+import time
+import typing
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
+
+import interfaces  # noqa: E402
+
+
+def make_pool(
+    ifaces_count: int, classes_count: int
+) -> typing.Tuple[typing.List[typing.Any], typing.List[type], typing.List[type]]:
+    ifaces = []
+    for index in range(ifaces_count):
+        namespace: typing.Dict[str, typing.Any] = {}
+        exec(
+            f'def method_{index}(self, arg: int) -> int:\n    pass\n'
+            'def shared(self) -> None:\n    pass',
+            namespace,
+        )
+        ifaces.append(
+            type(interfaces.interface)(
+                f'StressInterface{index}',
+                (interfaces.interface,),
+                {
+                    f'method_{index}': namespace[f'method_{index}'],
+                    'shared': namespace['shared'],
+                },
+            )
+        )
+
+    def implementation(name: str, implemented: int) -> type:
+        namespace: typing.Dict[str, typing.Any] = {}
+        source = 'def shared(self) -> None:\n    pass\n'
+        for index in range(implemented):
+            source += f'def method_{index}(self, arg: int) -> int:\n    pass\n'
+        exec(source, namespace)
+        return type(name, (), namespace)
+
+    # Good classes implement every interface, bad ones only the first half
+    good = [implementation(f'Good{i}', ifaces_count) for i in range(classes_count)]
+    bad = [implementation(f'Bad{i}', ifaces_count // 2) for i in range(classes_count)]
+    return ifaces, good, bad
+
+
+def worker(
+    ifaces: typing.List[typing.Any],
+    good: typing.List[type],
+    bad: typing.List[type],
+    stop: threading.Event,
+    counts: typing.List[int],
+    errors: typing.List[BaseException],
+    slot: int,
+) -> None:
+    half = len(ifaces) // 2
+    instances = [cls() for cls in good]
+    operations = 0
+    try:
+        while not stop.is_set():
+            for index, iface in enumerate(ifaces):
+                for cls, instance in zip(good, instances):
+                    assert interfaces.isimplementation(cls, iface)
+                    assert issubclass(cls, iface)
+                    assert isinstance(instance, iface)
+                for cls in bad:
+                    assert interfaces.isimplementation(cls, iface) == (index < half)
+                operations += 3 * len(good) + len(bad)
+    except BaseException as error:
+        errors.append(error)
+    counts[slot] = operations
+
+
+def mutator(iface: typing.Any, stop: threading.Event) -> None:
+    def shared(self) -> None:  # type: ignore
+        pass
+
+    while not stop.is_set():
+        # Same signature, so the verdicts do not change but caches are cleared
+        iface.shared = shared
+        time.sleep(0.0005)
+
+
+def run(
+    threads: int, seconds: float, mutate: bool, ifaces_count: int, classes_count: int
+) -> float:
+    ifaces, good, bad = make_pool(ifaces_count, classes_count)
+    stop = threading.Event()
+    counts = [0] * threads
+    errors: typing.List[BaseException] = []
+
+    workers = [
+        threading.Thread(
+            target=worker, args=(ifaces, good, bad, stop, counts, errors, slot)
+        )
+        for slot in range(threads)
+    ]
+    if mutate:
+        workers.append(threading.Thread(target=mutator, args=(ifaces[0], stop)))
+
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    if errors:
+        raise errors[0]
+    return sum(counts) / elapsed
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='threads_bench.py')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seconds', type=float, default=1.0)
+    parser.add_argument('--interfaces', type=int, default=8)
+    parser.add_argument('--classes', type=int, default=16)
+    parser.add_argument('--mutate', action='store_true')
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    free_threaded = bool(sysconfig.get_config_var('Py_GIL_DISABLED'))
+    print(f'free-threaded build: {free_threaded}, GIL enabled: {gil}')
+
+    baseline = None
+    for threads in args.threads:
+        throughput = run(
+            threads, args.seconds, args.mutate, args.interfaces, args.classes
+        )
+        baseline = baseline or throughput
+        print(
+            f'threads={threads:<3} {throughput / 1e6:8.3f} Mops/s'
+            f'  scaling {throughput / baseline:5.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
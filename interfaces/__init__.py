@@ -1,10 +1,10 @@
 """A new approach to interfaces in Python
+
+Public names and submodules are imported on first access, so declaring interfaces
+only loads the modules that are needed for it.
 """
-import interfaces.base
-import interfaces.compat
-import interfaces.exceptions
-import interfaces.spec
-import interfaces.util
+import sys
+import typing as _typing  # `typing` is the name of the `interfaces.typing` module
 
 
 __version__ = '0.1.2'
@@ -13,13 +13,153 @@ __version__ = '0.1.2'
 __all__ = ['Interface', 'Object', 'isimplementation']
 
 
-interface = Interface = interfaces.base.Interface
-object = Object = interfaces.compat.Object
+# Public name -> `submodule.attribute` it is loaded from
+_LAZY_NAMES = {
+    'interface': 'base.Interface',
+    'Interface': 'base.Interface',
+    'object': 'compat.Object',
+    'Object': 'compat.Object',
+    'InterfaceAdaptationError': 'exceptions.InterfaceAdaptationError',
+    'InterfaceContractError': 'exceptions.InterfaceContractError',
+    'InterfaceNoInstanceAllowedError': 'exceptions.InterfaceNoInstanceAllowedError',
+    'InterfaceNotImplementedError': 'exceptions.InterfaceNotImplementedError',
+    'InterfaceOverloadingError': 'exceptions.InterfaceOverloadingError',
+    'InterfaceResolutionError': 'exceptions.InterfaceResolutionError',
+    'interface_spec': 'spec.interface_spec',
+    'InterfaceSpecRegistry': 'spec.InterfaceSpecRegistry',
+    'SerializedSpec': 'serialization.SerializedSpec',
+    'dump_spec': 'serialization.dump_spec',
+    'load_spec': 'serialization.load_spec',
+    'isimplementation': 'util.isimplementation',
+    'implementations': 'registry.implementations',
+    'interfaces_of': 'registry.interfaces_of',
+    'CacheInfo': 'util.CacheInfo',
+    'cache_clear': 'util.cache_clear',
+    'cache_info': 'util.cache_info',
+    'verify_all': 'util.verify_all',
+    'enforce': 'contracts.enforce',
+    'Explanation': 'diff.Explanation',
+    'explain': 'diff.explain',
+    'dispatch': 'dispatching.dispatch',
+    'adapt': 'adapters.adapt',
+    'offload': 'proxies.offload',
+    'proxy': 'proxies.proxy',
+    'set_offload_executor': 'proxies.set_offload_executor',
+    'register_adapter': 'adapters.register_adapter',
+    'Container': 'container.Container',
+    'CheckEvent': 'instrumentation.CheckEvent',
+    'disable_instrumentation': 'instrumentation.disable_instrumentation',
+    'enable_instrumentation': 'instrumentation.enable_instrumentation',
+    'DiskCache': 'diskcache.DiskCache',
+    'disable_disk_cache': 'diskcache.disable_disk_cache',
+    'enable_disk_cache': 'diskcache.enable_disk_cache',
+    'VerificationResult': 'batch.VerificationResult',
+    'verify_matrix': 'batch.verify_matrix',
+}
+
+
+if _typing.TYPE_CHECKING:
+    import interfaces.adapters
+    import interfaces.base
+    import interfaces.batch
+    import interfaces.compat
+    import interfaces.container
+    import interfaces.contracts
+    import interfaces.diff
+    import interfaces.diskcache
+    import interfaces.dispatching
+    import interfaces.exceptions
+    import interfaces.instrumentation
+    import interfaces.proxies
+    import interfaces.registry
+    import interfaces.serialization
+    import interfaces.spec
+    import interfaces.util
+
+    interface = Interface = interfaces.base.Interface
+    object = Object = interfaces.compat.Object
+
+    InterfaceAdaptationError = interfaces.exceptions.InterfaceAdaptationError
+    InterfaceContractError = interfaces.exceptions.InterfaceContractError
+    InterfaceNoInstanceAllowedError = (
+        interfaces.exceptions.InterfaceNoInstanceAllowedError
+    )
+    InterfaceNotImplementedError = interfaces.exceptions.InterfaceNotImplementedError
+    InterfaceOverloadingError = interfaces.exceptions.InterfaceOverloadingError
+    InterfaceResolutionError = interfaces.exceptions.InterfaceResolutionError
+
+    interface_spec = interfaces.spec.interface_spec
+    InterfaceSpecRegistry = interfaces.spec.InterfaceSpecRegistry
+
+    SerializedSpec = interfaces.serialization.SerializedSpec
+    dump_spec = interfaces.serialization.dump_spec
+    load_spec = interfaces.serialization.load_spec
+
+    isimplementation = interfaces.util.isimplementation
+
+    implementations = interfaces.registry.implementations
+    interfaces_of = interfaces.registry.interfaces_of
+
+    CacheInfo = interfaces.util.CacheInfo
+    cache_clear = interfaces.util.cache_clear
+    cache_info = interfaces.util.cache_info
+
+    verify_all = interfaces.util.verify_all
+
+    enforce = interfaces.contracts.enforce
+
+    Explanation = interfaces.diff.Explanation
+    explain = interfaces.diff.explain
+
+    dispatch = interfaces.dispatching.dispatch
+
+    adapt = interfaces.adapters.adapt
+    register_adapter = interfaces.adapters.register_adapter
+
+    Container = interfaces.container.Container
+
+    offload = interfaces.proxies.offload
+    proxy = interfaces.proxies.proxy
+    set_offload_executor = interfaces.proxies.set_offload_executor
+
+    CheckEvent = interfaces.instrumentation.CheckEvent
+    disable_instrumentation = interfaces.instrumentation.disable_instrumentation
+    enable_instrumentation = interfaces.instrumentation.enable_instrumentation
+
+    DiskCache = interfaces.diskcache.DiskCache
+    disable_disk_cache = interfaces.diskcache.disable_disk_cache
+    enable_disk_cache = interfaces.diskcache.enable_disk_cache
+
+    VerificationResult = interfaces.batch.VerificationResult
+    verify_matrix = interfaces.batch.verify_matrix
+
+
+def __getattr__(name: str) -> _typing.Any:
+    try:
+        module_name, _, attr_name = _LAZY_NAMES[name].partition('.')
+    except KeyError:
+        if name.startswith('_'):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        try:
+            return _import(name)
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    value = getattr(_import(module_name), attr_name)
+    globals()[name] = value
+    return value
+
 
-InterfaceNoInstanceAllowedError = interfaces.exceptions.InterfaceNoInstanceAllowedError
-InterfaceNotImplementedError = interfaces.exceptions.InterfaceNotImplementedError
-InterfaceOverloadingError = interfaces.exceptions.InterfaceOverloadingError
+def _import(module_name: str) -> _typing.Any:
+    # Unlike `importlib.import_module` the import statement is seen by
+    # `-X importtime`
+    __import__(f'{__name__}.{module_name}')
+    return sys.modules[f'{__name__}.{module_name}']
 
-interface_spec = interfaces.spec.interface_spec
 
-isimplementation = interfaces.util.isimplementation
+def __dir__() -> _typing.List[str]:
+    return sorted(globals().keys() | _LAZY_NAMES.keys())
@@ -0,0 +1,39 @@
+import argparse
+import sys
+import typing
+
+import interfaces.checker
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m interfaces')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    check_parser = commands.add_parser(
+        'check', help='check `implements=` declarations without importing the code'
+    )
+    check_parser.add_argument('paths', nargs='+', help='source files or directories')
+    check_parser.add_argument(
+        '-j', '--jobs', type=int, help='worker processes, one per CPU by default'
+    )
+    check_parser.add_argument(
+        '--no-cache', action='store_true', help='do not read or write the file cache'
+    )
+    check_parser.add_argument(
+        '--strict', action='store_true', help='fail on checks that cannot be decided'
+    )
+    args = parser.parse_args(argv)
+
+    diagnostics = interfaces.checker.check(
+        args.paths, processes=args.jobs, cache=not args.no_cache
+    )
+    for diagnostic in diagnostics:
+        print(diagnostic)
+
+    failed = any(diagnostic.error or args.strict for diagnostic in diagnostics)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
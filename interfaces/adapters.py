@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import typing
+import weakref
+
+import interfaces.base
+import interfaces.dispatching
+import interfaces.exceptions
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['adapt', 'register_adapter']
+
+
+_Factory = typing.Callable[[typing.Any], typing.Any]
+# The factory and whether its results must be checked as it was not validated
+# at registration
+_Adapter = typing.Tuple[_Factory, bool]
+
+# Target interface -> adapted class or interface -> adapter
+_adapters: typing.Dict[
+    interfaces.typing.InterfaceType, typing.Dict[type, _Adapter]
+] = {}
+
+_resolved: weakref.WeakKeyDictionary[
+    type, typing.Dict[interfaces.typing.InterfaceType, typing.Optional[_Adapter]]
+] = weakref.WeakKeyDictionary()
+_resolved_memo = interfaces.util._Memo(_resolved)
+_adapters_version = 0
+
+_MISSING = object()
+
+
+def register_adapter(
+    from_type_or_iface: type,
+    to_iface: interfaces.typing.InterfaceType,
+    factory: typing.Optional[_Factory] = None,
+) -> typing.Any:
+    """Register `factory(obj)` adapting instances of a class or an interface.
+
+    Factories which are classes, or functions annotated to return a class, must
+    implement `to_iface` and are checked right away. Results of other factories
+    are checked when they are produced. Can be used as a decorator when
+    `factory` is omitted.
+    """
+    if factory is None:
+        return lambda factory: register_adapter(from_type_or_iface, to_iface, factory)
+
+    if not isinstance(from_type_or_iface, type):
+        raise TypeError(
+            f"Adapters can be registered for classes or interfaces, not"
+            f" `{from_type_or_iface!r}`"
+        )
+    if not isinstance(to_iface, interfaces.base._InterfaceMeta):
+        raise TypeError(f"Adapters must target an interface, not `{to_iface!r}`")
+    if not callable(factory):
+        raise TypeError(f"Adapter factory must be callable, not `{factory!r}`")
+
+    adapter_cls = _adapter_class(factory)
+    if adapter_cls is not None:
+        interfaces.util._isimplementation(adapter_cls, to_iface, raise_errors=True)
+
+    global _adapters_version
+    _adapters.setdefault(to_iface, {})[from_type_or_iface] = (
+        factory,
+        adapter_cls is None,
+    )
+    _adapters_version += 1
+    _resolved.clear()
+    return factory
+
+
+def adapt(
+    obj: typing.Any,
+    iface: interfaces.typing.InterfaceType,
+    default: typing.Any = _MISSING,
+) -> typing.Any:
+    """Return `obj` if it implements `iface` or an adapter of it otherwise.
+
+    Raises `InterfaceAdaptationError` when there is no adapter unless `default`
+    is given. The adapter factory is resolved once per class of `obj` and `iface`
+    from the registrations for the classes in the MRO first and then for the most
+    derived implemented interface.
+    """
+    cls = type(obj)
+    if interfaces.util._isimplementation(cls, iface):
+        return obj
+
+    resolved = _resolve(cls, iface)
+    if resolved is None:
+        if default is _MISSING:
+            raise interfaces.exceptions.InterfaceAdaptationError(obj=obj, iface=iface)
+        return default
+
+    factory, unchecked = resolved
+    adapter = factory(obj)
+    if unchecked:
+        interfaces.util._isimplementation(type(adapter), iface, raise_errors=True)
+    return adapter
+
+
+def _resolve(
+    cls: type, iface: interfaces.typing.InterfaceType
+) -> typing.Optional[_Adapter]:
+    token = _resolved_memo.refresh()
+    try:
+        return _resolved[cls][iface]
+    except KeyError:
+        pass
+
+    version = _adapters_version
+    adapter = interfaces.dispatching._find_impl(cls, _adapters.get(iface, {}))
+    # An adapter registered meanwhile makes it stale as well
+    if _resolved_memo.valid(token) and version == _adapters_version:
+        _resolved.setdefault(cls, {})[iface] = adapter
+    return adapter
+
+
+def _adapter_class(factory: _Factory) -> typing.Optional[type]:
+    if isinstance(factory, type):
+        return factory
+
+    try:
+        return_type = typing.get_type_hints(factory).get('return')
+    except Exception:
+        return None
+
+    return return_type if isinstance(return_type, type) else None
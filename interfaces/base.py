@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing
 
+import interfaces.cache
 import interfaces.exceptions
 import interfaces.spec
 import interfaces.util
@@ -11,19 +12,48 @@ __all__ = ['Interface']
 
 
 class _InterfaceMeta(type):
+    __interface_cache__: interfaces.cache._VerdictCache
+    __interface_variance__: bool
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        type.__setattr__(self, '__interface_cache__', interfaces.cache._VerdictCache())
+
     def __interface_spec__(self) -> interfaces.spec.InterfaceSpec:
         return interfaces.spec.InterfaceSpec(iface=self)
 
     def __subclasscheck__(self, subclass: typing.Type) -> bool:
         return interfaces.util.isimplementation(subclass, self)
 
+    def __instancecheck__(self, instance: typing.Any) -> bool:
+        # Cache hits for conforming classes skip `interfaces.util._isimplementation`
+        cls = type(instance)
+        failed_attr_name = self.__interface_cache__.get(cls)
+        return failed_attr_name is None or interfaces.util._check_verdict(
+            cls, self, failed_attr_name
+        )
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        super().__setattr__(name, value)
+        interfaces.util._invalidate(self)
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        interfaces.util._invalidate(self)
+
 
 class Interface(metaclass=_InterfaceMeta):
+    # Compare members with `interfaces.variance.compatible` when signatures differ
+    __interface_variance__ = False
+
     def __new__(cls, *args: typing.Any, **kwargs: typing.Any) -> None:
         raise interfaces.exceptions.InterfaceNoInstanceAllowedError(iface=cls)
 
-    def __init_subclass__(cls) -> None:
-        cls_method_names = interfaces.spec._PartialInterfaceSpec(cls).keys()
+    def __init_subclass__(cls, variance: typing.Optional[bool] = None) -> None:
+        if variance is not None:
+            type.__setattr__(cls, '__interface_variance__', variance)
+
+        cls_method_names = interfaces.spec.own_attr_names(cls)
 
         for cls_base in cls.__bases__:
 
@@ -34,13 +64,12 @@ class Interface(metaclass=_InterfaceMeta):
                 )
 
             base_spec = interfaces.spec.interface_spec(cls_base)
-            if cls_method_names.isdisjoint(base_spec.keys()):
+            method_names = base_spec.keys() & cls_method_names
+            if not method_names:
                 continue
 
             raise interfaces.exceptions.InterfaceOverloadingError(
-                method_names=set(base_spec).intersection(cls_method_names),
-                ancestor_iface=cls_base,
-                descendant_iface=cls,
+                method_names=method_names, ancestor_iface=cls_base, descendant_iface=cls
             )
 
         super().__init_subclass__()
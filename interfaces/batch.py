@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+import interfaces.spec
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['VerificationResult', 'verify_matrix']
+
+
+class VerificationResult(typing.NamedTuple):
+    cls: type
+    iface: interfaces.typing.InterfaceType
+    attr_name: typing.Optional[str] = None
+    # One of 'missing', 'mismatch' or 'unsupported' when `attr_name` is set
+    reason: typing.Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.attr_name is None
+
+
+# Rows are computed as `(class index, interface index, attr_name, reason)`
+_Row = typing.Tuple[int, int, typing.Optional[str], typing.Optional[str]]
+
+
+def verify_matrix(
+    classes: typing.Iterable[type],
+    ifaces: typing.Iterable[interfaces.typing.InterfaceType],
+    *,
+    processes: typing.Optional[int] = None,
+    chunksize: int = 64,
+) -> typing.Dict[
+    typing.Tuple[type, interfaces.typing.InterfaceType], VerificationResult
+]:
+    """Check every class against every interface in one pass.
+
+    Class members are looked up and fingerprinted once per class no matter how
+    many interfaces share them. With `processes` set, classes are split into
+    chunks of `chunksize` and checked in a process pool; classes and interfaces
+    must be picklable (importable by their qualified name) in that case.
+
+    Verdicts are stored in the interfaces' caches, so subsequent `issubclass` and
+    `isimplementation` calls for the checked pairs are cache hits.
+    """
+    classes = list(classes)
+    ifaces = list(ifaces)
+    generations = [iface.__interface_cache__.generation for iface in ifaces]
+
+    if processes is None or len(classes) <= chunksize:
+        rows = _verify_chunk(classes, ifaces, 0)
+    else:
+        rows = []
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            futures = [
+                executor.submit(
+                    _verify_chunk, classes[start : start + chunksize], ifaces, start
+                )
+                for start in range(0, len(classes), chunksize)
+            ]
+            for future in futures:
+                rows.extend(future.result())
+
+    matrix: typing.Dict[
+        typing.Tuple[type, interfaces.typing.InterfaceType], VerificationResult
+    ] = {}
+    for cls_index, iface_index, attr_name, reason in rows:
+        cls, iface = classes[cls_index], ifaces[iface_index]
+        interfaces.util._record(cls, iface, attr_name, generations[iface_index])
+        matrix[cls, iface] = VerificationResult(cls, iface, attr_name, reason)
+
+    return matrix
+
+
+def _verify_chunk(
+    classes: typing.Sequence[type],
+    ifaces: typing.Sequence[interfaces.typing.InterfaceType],
+    offset: int,
+) -> typing.List[_Row]:
+    ifaces_specs = [interfaces.spec.interface_spec(iface) for iface in ifaces]
+    rows: typing.List[_Row] = []
+
+    for cls_index, cls in enumerate(classes, offset):
+        mro = interfaces.util._static_mro(cls)
+        cls_fingerprints: typing.Dict[str, typing.Any] = {}
+
+        for iface_index, iface_spec in enumerate(ifaces_specs):
+            attr_name, reason = None, None
+
+            for iface_attr_name, iface_fingerprint in iface_spec.fingerprints().items():
+                try:
+                    cls_fingerprint = cls_fingerprints[iface_attr_name]
+                except KeyError:
+                    cls_fingerprint = cls_fingerprints[
+                        iface_attr_name
+                    ] = interfaces.util._class_fingerprint(cls, mro, iface_attr_name)
+
+                if iface_fingerprint is None:
+                    attr_name, reason = iface_attr_name, 'unsupported'
+                elif cls_fingerprint is interfaces.util._MISSING:
+                    attr_name, reason = iface_attr_name, 'missing'
+                elif cls_fingerprint != iface_fingerprint and not (
+                    interfaces.spec.kinds_match(cls_fingerprint, iface_fingerprint)
+                    or iface_spec.variance
+                    and interfaces.util._compatible(
+                        cls, mro, iface_attr_name, iface_spec
+                    )
+                ):
+                    attr_name, reason = iface_attr_name, 'mismatch'
+                else:
+                    continue
+                break
+
+            rows.append((cls_index, iface_index, attr_name, reason))
+
+    return rows
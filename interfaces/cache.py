@@ -0,0 +1,246 @@
+"""Per-interface memo of conformance verdicts.
+
+A leaf module: `interfaces.base` creates a verdict cache for every interface,
+including the root one at import time, so this module must not import it back.
+"""
+from __future__ import annotations
+
+import operator
+import threading
+import typing
+import weakref
+
+
+_MISSING = object()
+
+# Identities of the raw members of a class, see `_members`
+Snapshot = typing.Tuple[int, ...]
+
+# Snapshot, keys of the members not supporting weak references by their index,
+# verdict and the weak references dropping the entry when a member is freed
+_OwnMembersGetter = typing.Callable[
+    [typing.Mapping[str, typing.Any]], typing.Tuple[typing.Any, ...]
+]
+
+_Entry = typing.Tuple[
+    Snapshot,
+    typing.Tuple[typing.Tuple[int, typing.Any], ...],
+    typing.Optional[str],
+    typing.List[weakref.ref],
+]
+
+
+class _VerdictCache:
+    """Per-interface memo of `interfaces.util._isimplementation` verdicts.
+
+    Entries are keyed weakly on the checked class and store the identities of the
+    class members the verdict was computed against, so a class mutated after the
+    check is re-verified instead of being served a stale verdict. An entry holds
+    weak references to those members and is dropped when any of them is freed,
+    so their identities cannot be reused by new members while it lives. Members
+    not supporting weak references are also compared by `_member_key`.
+
+    Reads take no locks: the members lookup and the entries are published
+    together as one tuple, so a reader always sees a consistent state, and a hit
+    is a dict lookup, an `operator.itemgetter` call and a tuple comparison. Writes and clears are
+    serialized by a per-interface lock; a verdict computed before a `clear`
+    (i.e. against the previous interface definition) is dropped by comparing
+    `generation`. `hits` and `misses` are updated without the lock and are
+    approximate under concurrent use.
+    """
+
+    __slots__ = ('_state', '_lock', 'generation', 'hits', 'misses')
+
+    def __init__(self) -> None:
+        self._state: typing.Tuple[
+            typing.Optional[_OwnMembersGetter],
+            typing.Tuple[str, ...],
+            typing.Dict[weakref.ref, _Entry],
+        ] = (None, (), {})
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cls: type) -> typing.Union[typing.Optional[str], object]:
+        own_members_getter, attr_names, entries = self._state
+        try:
+            entry = entries.get(weakref.ref(cls))
+        except TypeError:
+            entry = None
+
+        if entry is not None:
+            # `_members` inlined, this is the `isinstance` hot path;
+            # `own_members_getter` is always set while there are entries
+            try:
+                members = own_members_getter(_class_dict(cls))  # type: ignore
+            except (KeyError, TypeError):
+                members = _inherited_members(cls, attr_names)
+            if entry[0] == tuple(map(id, members)) and (
+                not entry[1] or _same_keys(members, entry[1])
+            ):
+                self.hits += 1
+                return entry[2]
+
+        self.misses += 1
+        return _MISSING
+
+    def set(
+        self,
+        cls: type,
+        attr_names: typing.Iterable[str],
+        failed_attr_name: typing.Optional[str],
+        generation: typing.Optional[int] = None,
+    ) -> None:
+        """Store a verdict unless the cache was cleared after `generation`.
+
+        `attr_names` are the member names of the interface, i.e. its spec.
+        """
+        if generation is None:
+            generation = self.generation
+
+        own_members_getter, names, _ = self._state
+        if own_members_getter is None:
+            names = tuple(attr_names)
+            own_members_getter = _own_members_getter(names)
+
+        try:
+            cls_ref = weakref.ref(cls, self._remove)
+        except TypeError:
+            return
+        entry = self._entry(
+            cls_ref, _members(cls, own_members_getter, names), failed_attr_name
+        )
+
+        with self._lock:
+            if generation != self.generation:
+                return
+            current_getter, current_names, entries = self._state
+            if current_getter is None:
+                self._state = (own_members_getter, names, entries)
+            elif current_getter is not own_members_getter:
+                # Another thread published its getter meanwhile, retake the snapshot
+                entry = self._entry(
+                    cls_ref,
+                    _members(cls, current_getter, current_names),
+                    failed_attr_name,
+                )
+            entries[cls_ref] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._state = (None, (), {})
+            self.hits = self.misses = 0
+
+    def info(self) -> typing.Tuple[int, int, int]:
+        return self.hits, self.misses, len(self._state[2])
+
+    def _remove(self, cls_ref: weakref.ref) -> None:
+        self._state[2].pop(cls_ref, None)
+
+    def _entry(
+        self,
+        cls_ref: weakref.ref,
+        members: typing.Tuple[typing.Any, ...],
+        failed_attr_name: typing.Optional[str],
+    ) -> _Entry:
+        def remove(member_ref: weakref.ref) -> None:
+            self._remove(cls_ref)
+
+        keys = []
+        guards = []
+        for index, member in enumerate(members):
+            try:
+                guards.append(weakref.ref(member, remove))
+            except TypeError:
+                keys.append((index, _member_key(member)))
+        return tuple(map(id, members)), tuple(keys), failed_attr_name, guards
+
+
+_class_dict = type.__dict__['__dict__'].__get__
+
+
+def _own_members_getter(attr_names: typing.Tuple[str, ...]) -> _OwnMembersGetter:
+    """Build a function returning the members `attr_names` of a class namespace.
+
+    It raises `KeyError` unless the namespace has all of them. A single name is
+    looked up twice, `operator.itemgetter` only returns a tuple for several.
+    """
+    if not attr_names:
+        return lambda namespace: ()
+    if len(attr_names) == 1:
+        attr_names *= 2
+    return operator.itemgetter(*attr_names)
+
+
+def _members(
+    cls: type, own_members_getter: _OwnMembersGetter, attr_names: typing.Tuple[str, ...]
+) -> typing.Tuple[typing.Any, ...]:
+    """Return the raw members `attr_names` of a class.
+
+    Members are looked up statically, so e.g. class methods are not bound anew on
+    every call. The common case of a class defining them all takes a single
+    `operator.itemgetter` call, see `_inherited_members` for the other.
+    """
+    try:
+        return own_members_getter(_class_dict(cls))
+    except (KeyError, TypeError):
+        # Missing members or e.g. instances checked as classes
+        return _inherited_members(cls, attr_names)
+
+
+def _inherited_members(
+    cls: type, attr_names: typing.Tuple[str, ...]
+) -> typing.Tuple[typing.Any, ...]:
+    # The classes of the MRO are part of the result, so changing `__bases__`
+    # changes it as well
+    mro = _static_mro(cls)
+    return mro + tuple(_lookup_static(mro, attr_name) for attr_name in attr_names)
+
+
+def _same_keys(
+    members: typing.Tuple[typing.Any, ...],
+    keys: typing.Tuple[typing.Tuple[int, typing.Any], ...],
+) -> bool:
+    return all(_member_key(members[index]) == key for index, key in keys)
+
+
+def _member_key(member: typing.Any) -> typing.Any:
+    """Return a key changing with what the fingerprint of `member` is based on.
+
+    Used for members which do not support weak references, whose identity may be
+    reused once they are freed. Class and static methods and properties are keyed
+    by their functions, other members by their type. Keys hold weak references
+    only, strong ones could keep the class of the member alive.
+    """
+    try:
+        return weakref.ref(member)
+    except TypeError:
+        pass
+
+    if isinstance(member, (classmethod, staticmethod)):
+        return (type(member), _member_key(member.__func__))
+    if isinstance(member, property):
+        return (
+            type(member),
+            _member_key(member.fget),
+            _member_key(member.fset),
+            _member_key(member.fdel),
+        )
+    return (weakref.ref(type(member)),)
+
+
+def _static_mro(cls: type) -> typing.Tuple[type, ...]:
+    try:
+        return type.__dict__['__mro__'].__get__(cls)
+    except TypeError:
+        return ()
+
+
+def _lookup_static(mro: typing.Tuple[type, ...], attr_name: str) -> typing.Any:
+    for klass in mro:
+        klass_dict = type.__dict__['__dict__'].__get__(klass)
+        if attr_name in klass_dict:
+            return klass_dict[attr_name]
+    return _MISSING
@@ -0,0 +1,899 @@
+"""Ahead-of-time conformance checks of source files, see `python -m interfaces check`.
+
+Source files are parsed with `ast` and never imported. Each file is summarized
+into plain data (imports, classes, their bases, `implements=` declarations and
+member fingerprints); summaries are computed in a process pool and cached per file
+in `__pycache__/interfaces` keyed by the file content. Classes are then checked
+against the interfaces they declare the same way `_isimplementation` does: the
+first member of the interface spec which is missing or has a different
+fingerprint is reported.
+
+Static fingerprints compare annotations and defaults by their source expression
+(`List[int]` and `typing.List[int]` differ) and cannot follow dynamic code.
+Whenever a verdict depends on something that cannot be known without importing
+(a base class from an unchecked module, an unknown decorator, a variance check)
+an `unknown` diagnostic is reported instead of an error.
+"""
+from __future__ import annotations
+
+import ast
+import concurrent.futures
+import hashlib
+import itertools
+import json
+import os
+import sys
+import tempfile
+import typing
+
+import interfaces.spec
+
+
+__all__ = ['Diagnostic', 'check', 'summarize']
+
+
+# Bump when the summary format changes
+_FORMAT = 4
+
+_INTERFACE_ROOTS = {
+    'interfaces.interface',
+    'interfaces.Interface',
+    'interfaces.base.Interface',
+}
+_OBJECT_ROOTS = {
+    'interfaces.object',
+    'interfaces.Object',
+    'interfaces.compat.Object',
+    'builtins.object',
+}
+_PROPERTY = 'builtins.property'
+_METHODS = {
+    'builtins.classmethod': 'classmethod',
+    'builtins.staticmethod': 'staticmethod',
+}
+_UNSUPPORTED_DECORATORS = {'functools.cached_property'}
+_TRANSPARENT_DECORATORS = {
+    'abc.abstractmethod',
+    'typing.final',
+    'typing.overload',
+    'typing_extensions.final',
+    'typing_extensions.overload',
+}
+_BUILTINS = {'classmethod', 'object', 'property', 'staticmethod'}
+
+# Static fingerprints are JSON-friendly versions of `spec.member_fingerprint`,
+# `None` for unsupported members and `['unknown']` for dynamic ones
+_UNKNOWN = ['unknown']
+# Plain values and slots, typed by the class annotations like `util._class_member`
+_VALUE = ['attribute', None]
+
+Summary = typing.Dict[str, typing.Any]
+
+
+class Diagnostic(typing.NamedTuple):
+    path: str
+    lineno: int
+    cls: str
+    iface: typing.Optional[str]
+    attr_name: typing.Optional[str]
+    # One of 'missing', 'mismatch', 'unsupported', 'overloading', 'invalid' or
+    # 'unknown'; only 'unknown' diagnostics are not errors
+    reason: str
+
+    @property
+    def error(self) -> bool:
+        return self.reason != 'unknown'
+
+    def __str__(self) -> str:
+        location = f"{self.path}:{self.lineno}"
+        if self.reason == 'overloading':
+            message = f"`{self.cls}` overloads `{self.attr_name}` of `{self.iface}`"
+        elif self.reason == 'invalid':
+            message = (
+                f"`{self.cls}` implements `{self.iface}` which is not an interface"
+            )
+        elif self.attr_name is None:
+            message = f"cannot resolve `{self.iface}` implemented by `{self.cls}`"
+        else:
+            message = (
+                f"`{self.cls}` must fully implement `{self.attr_name}` method of"
+                f" `{self.iface}` ({self.reason})"
+            )
+        return f"{location}: {'error' if self.error else 'note'}: {message}"
+
+
+def check(
+    paths: typing.Iterable[str],
+    *,
+    processes: typing.Optional[int] = None,
+    cache: bool = True,
+) -> typing.List[Diagnostic]:
+    """Check every `implements=` declaration found in `paths` (files or dirs)."""
+    files = sorted(_source_files(paths))
+    summaries: typing.List[typing.Optional[Summary]] = [None] * len(files)
+    misses = []
+
+    for index, path in enumerate(files):
+        summary = _load_summary(path) if cache else None
+        if summary is None:
+            misses.append(index)
+        summaries[index] = summary
+
+    if processes == 1 or len(misses) < 2:
+        computed: typing.Iterable[Summary] = map(
+            summarize, (files[index] for index in misses)
+        )
+        for index, summary in zip(misses, computed):
+            summaries[index] = summary
+    else:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            computed = executor.map(
+                summarize,
+                [files[index] for index in misses],
+                chunksize=max(
+                    1, len(misses) // (4 * (processes or os.cpu_count() or 1))
+                ),
+            )
+            for index, summary in zip(misses, computed):
+                summaries[index] = summary
+
+    if cache:
+        for index in misses:
+            _store_summary(files[index], summaries[index])  # type: ignore
+
+    return _Project(typing.cast(typing.List[Summary], summaries)).check()
+
+
+def summarize(path: str) -> Summary:
+    """Parse `path` into the plain data the checks are computed from."""
+    with open(path, 'rb') as source_file:
+        source = source_file.read()
+
+    module = _module_name(path)
+    summary: Summary = {
+        'path': path,
+        'hash': _source_hash(source),
+        'module': module,
+        'imports': {},
+        'classes': {},
+    }
+    try:
+        tree = ast.parse(source, path)
+    except (SyntaxError, ValueError):
+        return summary
+
+    _Summarizer(summary, os.path.basename(path) == '__init__.py').visit_body(
+        tree.body, ''
+    )
+    return summary
+
+
+class _Summarizer:
+    def __init__(self, summary: Summary, is_package: bool) -> None:
+        self.summary = summary
+        self.is_package = is_package
+        self.imports: typing.Dict[str, str] = summary['imports']
+        self.classes: typing.Dict[str, typing.Any] = summary['classes']
+        self.postponed = False
+
+    def visit_body(self, body: typing.List[ast.stmt], prefix: str) -> None:
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                self.visit_class(node, prefix)
+            elif prefix:
+                continue
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname is None:
+                        top = alias.name.split('.')[0]
+                        self.imports[top] = top
+                    else:
+                        self.imports[alias.asname] = alias.name
+            elif isinstance(node, ast.ImportFrom):
+                if node.module == '__future__' and any(
+                    alias.name == 'annotations' for alias in node.names
+                ):
+                    self.postponed = True
+                base = self.import_base(node)
+                for alias in node.names:
+                    if alias.name != '*':
+                        self.imports[alias.asname or alias.name] = (
+                            f'{base}.{alias.name}' if base else alias.name
+                        )
+            elif isinstance(node, (ast.If, ast.Try)):
+                for block in (
+                    node.body,
+                    node.orelse,
+                    getattr(node, 'finalbody', []),
+                    *(handler.body for handler in getattr(node, 'handlers', [])),
+                ):
+                    self.visit_body(block, prefix)
+
+    def import_base(self, node: ast.ImportFrom) -> str:
+        if not node.level:
+            return node.module or ''
+
+        parts = self.summary['module'].split('.')
+        drop = node.level - 1 if self.is_package else node.level
+        parts = parts[: len(parts) - drop] if drop else parts
+        return '.'.join(parts + ([node.module] if node.module else []))
+
+    def visit_class(self, node: ast.ClassDef, prefix: str) -> None:
+        qualname = f'{prefix}{node.name}'
+        keywords = {keyword.arg: keyword.value for keyword in node.keywords}
+
+        implements = None
+        if 'implements' in keywords:
+            value = keywords['implements']
+            elements = (
+                value.elts
+                if isinstance(value, (ast.List, ast.Tuple, ast.Set))
+                else [value]
+            )
+            implements = [_dotted(element) for element in elements]
+
+        variance = None
+        if 'variance' in keywords:
+            try:
+                variance = bool(ast.literal_eval(keywords['variance']))
+            except ValueError:
+                pass
+
+        members: typing.Dict[str, typing.Any] = {}
+        annotations: typing.Dict[str, typing.Optional[str]] = {}
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                members[item.name] = self.function_fingerprint(item, members)
+            elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                annotations[item.target.id] = _annotation(
+                    item.annotation, self.postponed
+                )
+                if item.value:
+                    members[item.target.id] = self.value_fingerprint(
+                        item.value, members
+                    )
+            elif isinstance(item, ast.Assign):
+                for target in item.targets:
+                    if isinstance(target, ast.Name):
+                        members[target.id] = self.value_fingerprint(item.value, members)
+                        if target.id == '__slots__':
+                            members.update(
+                                (slot, _VALUE) for slot in _slots(item.value)
+                            )
+
+        self.classes[qualname] = {
+            'lineno': node.lineno,
+            'bases': [_dotted(base) for base in node.bases],
+            'implements': implements,
+            'variance': variance,
+            'members': list(members.items()),
+            'annotations': annotations,
+        }
+        self.visit_body(node.body, f'{qualname}.')
+
+    def function_fingerprint(
+        self,
+        node: typing.Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        members: typing.Dict[str, typing.Any],
+    ) -> typing.Any:
+        fingerprint: typing.Any = _signature_fingerprint(
+            node.args, node.returns, self.postponed, _flavor(node)
+        )
+        for decorator in reversed(node.decorator_list):
+            dotted = _dotted(decorator)
+            name = self.qualify(dotted)
+            if name in _TRANSPARENT_DECORATORS:
+                continue
+            if not _is_function(fingerprint):
+                # Only decorators of plain functions are followed
+                fingerprint = _UNKNOWN
+            elif name == _PROPERTY:
+                fingerprint = ['property', fingerprint[3], False, False]
+            elif name in _METHODS:
+                fingerprint = [_METHODS[name]] + fingerprint[1:]
+            elif name in _UNSUPPORTED_DECORATORS:
+                fingerprint = None
+            elif _is_property_method(dotted, members):
+                member_name, method = dotted.split('.')  # type: ignore
+                fingerprint = _property_method(
+                    members[member_name], method, fingerprint
+                )
+            else:
+                fingerprint = _UNKNOWN
+        return fingerprint
+
+    def value_fingerprint(
+        self, value: ast.expr, members: typing.Dict[str, typing.Any]
+    ) -> typing.Any:
+        if isinstance(value, ast.Lambda):
+            return _signature_fingerprint(value.args, None, self.postponed, 'sync')
+        if isinstance(value, ast.Call):
+            name = self.qualify(_dotted(value.func))
+            if name == _PROPERTY:
+                return _property_call(value, members)
+            if name in _METHODS:
+                if len(value.args) == 1 and not value.keywords:
+                    func = _member_function(value.args[0], members)
+                    if func is not None:
+                        return [_METHODS[name]] + func[1:]
+                return _UNKNOWN
+            if name in _UNSUPPORTED_DECORATORS:
+                return None
+            return _UNKNOWN
+        try:
+            ast.literal_eval(value)
+        except ValueError:
+            return _UNKNOWN
+        return _VALUE
+
+    def qualify(self, dotted: typing.Optional[str]) -> typing.Optional[str]:
+        if dotted is None:
+            return None
+        head, _, tail = dotted.partition('.')
+        if head in self.imports:
+            return f'{self.imports[head]}.{tail}' if tail else self.imports[head]
+        if head in _BUILTINS and not tail:
+            return f'builtins.{head}'
+        return dotted
+
+
+def _signature_fingerprint(
+    args: ast.arguments,
+    returns: typing.Optional[ast.expr],
+    postponed: bool,
+    flavor: str,
+) -> typing.List[typing.Any]:
+    positional = [
+        (arg, 'POSITIONAL_ONLY') for arg in getattr(args, 'posonlyargs', [])
+    ] + [(arg, 'POSITIONAL_OR_KEYWORD') for arg in args.args]
+    defaults: typing.List[typing.Optional[ast.expr]] = [None] * (
+        len(positional) - len(args.defaults)
+    ) + list(args.defaults)
+
+    parameters = [
+        [arg.arg, kind, _expression(default), _annotation(arg.annotation, postponed)]
+        for (arg, kind), default in zip(positional, defaults)
+    ]
+    if args.vararg is not None:
+        parameters.append(
+            [
+                args.vararg.arg,
+                'VAR_POSITIONAL',
+                None,
+                _annotation(args.vararg.annotation, postponed),
+            ]
+        )
+    kwonly_parameters = sorted(
+        [
+            arg.arg,
+            'KEYWORD_ONLY',
+            _expression(default),
+            _annotation(arg.annotation, postponed),
+        ]
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults)
+    )
+    if args.kwarg is not None:
+        parameters.append(
+            [
+                args.kwarg.arg,
+                'VAR_KEYWORD',
+                None,
+                _annotation(args.kwarg.annotation, postponed),
+            ]
+        )
+
+    return [
+        'function',
+        parameters,
+        kwonly_parameters,
+        _annotation(returns, postponed),
+        flavor,
+    ]
+
+
+def _flavor(node: typing.Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> str:
+    """Static counterpart of `spec.function_flavor`."""
+    if not isinstance(node, ast.AsyncFunctionDef):
+        return 'sync'
+
+    pending: typing.List[ast.AST] = list(node.body)
+    while pending:
+        current = pending.pop()
+        if isinstance(current, ast.Yield):
+            return 'asyncgenerator'
+        # A `yield` in a nested scope belongs to that scope
+        if not isinstance(
+            current, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+        ):
+            pending.extend(ast.iter_child_nodes(current))
+    return 'coroutine'
+
+
+def _expression(node: typing.Optional[ast.AST]) -> typing.Optional[str]:
+    """Return a location independent representation of `node`."""
+    return None if node is None else ast.dump(node)
+
+
+def _annotation(
+    node: typing.Optional[ast.AST], postponed: bool
+) -> typing.Optional[str]:
+    """Represent `node` as the annotation object it evaluates to at runtime.
+
+    Postponed annotations and string literal annotations are both strings at
+    runtime, so `x: int` in a module with `from __future__ import annotations` and
+    `x: 'int'` in a module without it are equal.
+    """
+    if node is None:
+        return None
+    if postponed:
+        return f's:{ast.dump(node)}'
+    value = _constant(node)
+    if isinstance(value, str):
+        try:
+            return f's:{ast.dump(ast.parse(value, mode="eval").body)}'
+        except SyntaxError:
+            return f's:{value}'
+    return f'o:{ast.dump(node)}'
+
+
+def _constant(node: typing.Optional[ast.AST]) -> typing.Any:
+    """Return the value of a literal `node` or `_MISSING`."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    # Python 3.7 parses literals as e.g. `ast.Str` and `ast.NameConstant`
+    if sys.version_info < (3, 8):
+        if isinstance(node, ast.Str):
+            return node.s
+        if isinstance(node, ast.NameConstant):
+            return node.value
+    return _MISSING
+
+
+def _is_function(fingerprint: typing.Any) -> bool:
+    return isinstance(fingerprint, list) and fingerprint[0] == 'function'
+
+
+def _member_function(
+    node: typing.Optional[ast.expr], members: typing.Dict[str, typing.Any]
+) -> typing.Any:
+    """Return the fingerprint of the function `node` names in the class body."""
+    if isinstance(node, ast.Name) and _is_function(members.get(node.id)):
+        return members[node.id]
+    return None
+
+
+def _property_method(
+    fingerprint: typing.List[typing.Any], method: str, func: typing.List[typing.Any]
+) -> typing.List[typing.Any]:
+    """Return the fingerprint of e.g. `value.setter(func)`."""
+    if method == 'getter':
+        return ['property', func[3]] + fingerprint[2:]
+    if method == 'setter':
+        return fingerprint[:2] + [True, fingerprint[3]]
+    return fingerprint[:3] + [True]
+
+
+def _property_call(node: ast.Call, members: typing.Dict[str, typing.Any]) -> typing.Any:
+    """Return the fingerprint of `property(fget, fset, fdel, doc)`."""
+    arguments: typing.Dict[typing.Optional[str], ast.expr] = dict(
+        zip(('fget', 'fset', 'fdel', 'doc'), node.args)
+    )
+    arguments.update((keyword.arg, keyword.value) for keyword in node.keywords)
+    if None in arguments or any(
+        isinstance(argument, ast.Starred) for argument in arguments.values()
+    ):
+        return _UNKNOWN
+
+    present = {
+        name for name, argument in arguments.items() if _constant(argument) is not None
+    }
+    getter = _member_function(arguments.get('fget'), members)
+    if 'fget' in present and getter is None:
+        return _UNKNOWN
+    return [
+        'property',
+        None if getter is None else getter[3],
+        'fset' in present,
+        'fdel' in present,
+    ]
+
+
+def _slots(node: ast.expr) -> typing.List[str]:
+    try:
+        slots = ast.literal_eval(node)
+    except ValueError:
+        return []
+    if isinstance(slots, str):
+        return [slots]
+    try:
+        return [slot for slot in slots if isinstance(slot, str)]
+    except TypeError:
+        return []
+
+
+def _is_property_method(
+    dotted: typing.Optional[str], members: typing.Dict[str, typing.Any]
+) -> bool:
+    """Whether `dotted` is e.g. `value.setter` of an earlier `value` property."""
+    if dotted is None or dotted.count('.') != 1:
+        return False
+    member_name, method = dotted.split('.')
+    fingerprint = members.get(member_name)
+    return (
+        method in ('setter', 'getter', 'deleter')
+        and isinstance(fingerprint, list)
+        and fingerprint[0] == 'property'
+    )
+
+
+def _dotted(node: ast.expr) -> typing.Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _dotted(node.value)
+        return None if value is None else f'{value}.{node.attr}'
+    return None
+
+
+class _Project:
+    """Symbol table of all summarized modules."""
+
+    def __init__(self, summaries: typing.List[Summary]) -> None:
+        self.summaries = summaries
+        self.modules = {summary['module']: summary for summary in summaries}
+        self.classes: typing.Dict[str, typing.Tuple[Summary, str]] = {
+            f"{summary['module']}.{qualname}": (summary, qualname)
+            for summary in summaries
+            for qualname in summary['classes']
+        }
+        self._mros: typing.Dict[str, typing.List[str]] = {}
+        self._specs: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+
+    def check(self) -> typing.List[Diagnostic]:
+        diagnostics: typing.List[Diagnostic] = []
+        for summary in self.summaries:
+            for qualname, info in summary['classes'].items():
+                name = f"{summary['module']}.{qualname}"
+                if self.is_interface(name):
+                    diagnostics.extend(self.check_interface(summary, name, info))
+                elif info['implements'] is not None:
+                    diagnostics.extend(self.check_class(summary, name, info))
+        return diagnostics
+
+    def check_interface(
+        self, summary: Summary, name: str, info: typing.Dict[str, typing.Any]
+    ) -> typing.Iterator[Diagnostic]:
+        own_names = {
+            member
+            for member in itertools.chain(
+                (member for member, _ in info['members']), info['annotations']
+            )
+            if not _is_dunder(member)
+        }
+        for base in info['bases']:
+            base_name = self.resolve(summary, base)
+            if base_name is None or not self.is_interface(base_name):
+                continue
+            for attr_name in sorted(own_names & self.spec(base_name).keys()):
+                yield Diagnostic(
+                    summary['path'],
+                    info['lineno'],
+                    name,
+                    base_name,
+                    attr_name,
+                    'overloading',
+                )
+
+    def check_class(
+        self, summary: Summary, name: str, info: typing.Dict[str, typing.Any]
+    ) -> typing.Iterator[Diagnostic]:
+        for iface in info['implements']:
+            iface_name = self.resolve(summary, iface)
+            result = self.find_unimplemented(name, iface_name)
+            if result is not None:
+                attr_name, reason = result
+                yield Diagnostic(
+                    summary['path'],
+                    info['lineno'],
+                    name,
+                    iface_name or iface,
+                    attr_name,
+                    reason,
+                )
+
+    def find_unimplemented(
+        self, name: str, iface_name: typing.Optional[str]
+    ) -> typing.Optional[typing.Tuple[typing.Optional[str], str]]:
+        """Static counterpart of `util._find_unimplemented`."""
+        if iface_name is None or iface_name not in self.classes:
+            return None, 'unknown'
+        if not self.is_interface(iface_name):
+            return None, 'invalid'
+
+        mro = self.mro(name)
+        for attr_name, iface_fingerprint in self.spec(iface_name).items():
+            if iface_fingerprint is None:
+                return attr_name, 'unsupported'
+            if iface_fingerprint == _UNKNOWN:
+                return attr_name, 'unknown'
+
+            fingerprint = self.lookup(mro, attr_name)
+            if fingerprint is _MISSING:
+                return attr_name, 'missing'
+            if fingerprint == _UNKNOWN:
+                return attr_name, 'unknown'
+            if fingerprint != iface_fingerprint and not _kinds_match(
+                fingerprint, iface_fingerprint
+            ):
+                if self.variance(iface_name) and _same_shape(
+                    fingerprint, iface_fingerprint
+                ):
+                    # Subtype relations of annotations need the objects
+                    return attr_name, 'unknown'
+                return attr_name, 'mismatch'
+
+        return None
+
+    def resolve(
+        self, summary: Summary, dotted: typing.Optional[str]
+    ) -> typing.Optional[str]:
+        """Return the fully qualified name `dotted` refers to in `summary`."""
+        if dotted is None:
+            return None
+
+        head, _, tail = dotted.partition('.')
+        if head in summary['classes']:
+            name = f"{summary['module']}.{dotted}"
+        elif head in summary['imports']:
+            name = summary['imports'][head] + (f'.{tail}' if tail else '')
+        elif head in _BUILTINS:
+            name = f'builtins.{dotted}'
+        else:
+            return None
+
+        return self.canonical(name, set())
+
+    def canonical(self, name: str, seen: typing.Set[str]) -> str:
+        """Follow re-exports, e.g. `pkg.Class` imported from `pkg.module`."""
+        if name in self.classes or name in seen:
+            return name
+        seen.add(name)
+
+        module, _, rest = name.rpartition('.')
+        while module:
+            summary = self.modules.get(module)
+            if summary is not None:
+                head, _, tail = rest.partition('.')
+                if head in summary['imports']:
+                    target = summary['imports'][head] + (f'.{tail}' if tail else '')
+                    return self.canonical(target, seen)
+                return name
+            module, _, last = module.rpartition('.')
+            rest = f'{last}.{rest}'
+
+        return name
+
+    def is_interface(self, name: str) -> bool:
+        return any(base in _INTERFACE_ROOTS for base in self.mro(name)[1:])
+
+    def mro(self, name: str) -> typing.List[str]:
+        """C3 linearization, names not defined in the summaries stay opaque."""
+        try:
+            return self._mros[name]
+        except KeyError:
+            pass
+
+        self._mros[name] = [name]  # recursion guard for cyclic definitions
+        if name not in self.classes:
+            return self._mros[name]
+
+        summary, qualname = self.classes[name]
+        bases = []
+        for base in summary['classes'][qualname]['bases']:
+            base_name = self.resolve(summary, base)
+            bases.append(base_name if base_name is not None else f'<unknown {base}>')
+
+        sequences = [list(self.mro(base)) for base in bases] + [list(bases)]
+        result = [name]
+        while any(sequences):
+            for sequence in sequences:
+                if not sequence:
+                    continue
+                candidate = sequence[0]
+                if not any(candidate in other[1:] for other in sequences):
+                    break
+            else:
+                # Inconsistent hierarchy, fails at runtime anyway
+                break
+            result.append(candidate)
+            for other in sequences:
+                if other and other[0] == candidate:
+                    del other[0]
+
+        self._mros[name] = result
+        return result
+
+    def members(self, name: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        if name in _OBJECT_ROOTS or name in _INTERFACE_ROOTS:
+            return {}
+        if name not in self.classes:
+            return None
+        summary, qualname = self.classes[name]
+        return dict(summary['classes'][qualname]['members'])
+
+    def annotations(
+        self, name: str
+    ) -> typing.Optional[typing.Dict[str, typing.Optional[str]]]:
+        if name in _OBJECT_ROOTS or name in _INTERFACE_ROOTS:
+            return {}
+        if name not in self.classes:
+            return None
+        summary, qualname = self.classes[name]
+        return summary['classes'][qualname]['annotations']
+
+    def lookup(self, mro: typing.List[str], attr_name: str) -> typing.Any:
+        """Static counterpart of `util._class_member`."""
+        for name in mro:
+            members = self.members(name)
+            if members is None:
+                return _UNKNOWN
+            if attr_name in members:
+                fingerprint = members[attr_name]
+                if fingerprint == _VALUE:
+                    return self.attribute(mro, attr_name, _VALUE)
+                return fingerprint
+        # Instance attributes may only be declared with an annotation
+        return self.attribute(mro, attr_name, _MISSING)
+
+    def attribute(
+        self, mro: typing.List[str], attr_name: str, default: typing.Any
+    ) -> typing.Any:
+        for name in mro:
+            annotations = self.annotations(name)
+            if annotations is None:
+                return _UNKNOWN
+            if attr_name in annotations:
+                return ['attribute', annotations[attr_name]]
+        return default
+
+    def spec(self, name: str) -> typing.Dict[str, typing.Any]:
+        try:
+            return self._specs[name]
+        except KeyError:
+            pass
+
+        spec: typing.Dict[str, typing.Any] = {}
+        self._specs[name] = spec
+        summary, qualname = self.classes[name]
+        info = summary['classes'][qualname]
+        for base in reversed(info['bases']):
+            base_name = self.resolve(summary, base)
+            if base_name in self.classes and self.is_interface(base_name):
+                spec.update(self.spec(base_name))
+        # Annotated names are attributes unless they name another kind of member,
+        # plain values without an annotation are not supported
+        members = dict(info['members'])
+        annotations = info['annotations']
+        for member in itertools.chain(
+            members, (member for member in annotations if member not in members)
+        ):
+            if _is_dunder(member):
+                continue
+            fingerprint = members.get(member, _VALUE)
+            if fingerprint == _VALUE:
+                fingerprint = (
+                    ['attribute', annotations[member]]
+                    if member in annotations
+                    else None
+                )
+            spec[member] = fingerprint
+        return spec
+
+    def variance(self, name: str) -> bool:
+        for base in self.mro(name):
+            if base in self.classes:
+                summary, qualname = self.classes[base]
+                variance = summary['classes'][qualname]['variance']
+                if variance is not None:
+                    return variance
+        return False
+
+
+_MISSING = object()
+
+
+def _is_dunder(name: str) -> bool:
+    return name[:2] == name[-2:] == '__'
+
+
+def _kinds_match(fingerprint: typing.Any, iface_fingerprint: typing.Any) -> bool:
+    """Static counterpart of `spec.kinds_match`, missing annotations are `None`."""
+    if fingerprint is None:
+        return False
+    match = interfaces.spec._kind_matches.get((iface_fingerprint[0], fingerprint[0]))
+    return match is not None and match(fingerprint, iface_fingerprint, None)
+
+
+def _same_shape(fingerprint: typing.Any, iface_fingerprint: typing.Any) -> bool:
+    """Whether two function or method fingerprints differ in annotations only."""
+    if fingerprint[0] != iface_fingerprint[0] or fingerprint[0] not in (
+        'function',
+        'classmethod',
+        'staticmethod',
+    ):
+        return False
+    if fingerprint[4] != iface_fingerprint[4]:
+        return False
+    return all(
+        [parameter[:3] for parameter in parameters]
+        == [parameter[:3] for parameter in iface_parameters]
+        for parameters, iface_parameters in zip(
+            fingerprint[1:3], iface_fingerprint[1:3]
+        )
+    )
+
+
+def _source_files(paths: typing.Iterable[str]) -> typing.Iterator[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(
+                    dirname
+                    for dirname in dirnames
+                    if not dirname.startswith('.') and dirname != '__pycache__'
+                )
+                for filename in filenames:
+                    if filename.endswith('.py'):
+                        yield os.path.abspath(os.path.join(directory, filename))
+        else:
+            yield os.path.abspath(path)
+
+
+def _module_name(path: str) -> str:
+    directory, filename = os.path.split(os.path.abspath(path))
+    parts = [] if filename == '__init__.py' else [filename[:-3]]
+    while os.path.isfile(os.path.join(directory, '__init__.py')):
+        directory, package = os.path.split(directory)
+        parts.insert(0, package)
+    return '.'.join(parts)
+
+
+def _source_hash(source: bytes) -> str:
+    version = f'{_FORMAT}:{sys.version_info[0]}.{sys.version_info[1]}'.encode()
+    return hashlib.sha256(version + b'\0' + source).hexdigest()
+
+
+def _cache_path(path: str) -> str:
+    directory, filename = os.path.split(path)
+    return os.path.join(
+        directory, '__pycache__', 'interfaces', f'{filename}.check.json'
+    )
+
+
+def _load_summary(path: str) -> typing.Optional[Summary]:
+    try:
+        with open(path, 'rb') as source_file:
+            source_hash = _source_hash(source_file.read())
+        with open(_cache_path(path), encoding='utf-8') as cache_file:
+            summary = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(summary, dict) or summary.get('hash') != source_hash:
+        return None
+    # The same file may be reached through another path
+    summary['path'] = path
+    return summary
+
+
+def _store_summary(path: str, summary: Summary) -> None:
+    cache_path = _cache_path(path)
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as cache_file:
+            json.dump(summary, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
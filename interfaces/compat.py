@@ -1,13 +1,22 @@
 import collections.abc
+import os
 import typing
 
 import interfaces.base
 import interfaces.util
 
 
+if typing.TYPE_CHECKING:
+    import interfaces.contracts
+
+
 __all__ = ['Object']
 
 
+# Default for `Object(lazy=...)`, any non-empty value except "0" turns it on
+lazy_by_default = os.environ.get('INTERFACES_LAZY', '') not in ('', '0')
+
+
 class Object:
     def __init_subclass__(
         cls,
@@ -17,6 +26,8 @@ class Object:
                 typing.Type[interfaces.base.Interface],
             ]
         ] = None,
+        lazy: typing.Optional[bool] = None,
+        enforce: typing.Union[bool, int] = False,
     ) -> None:
         if implements is None:
             implements = ()
@@ -24,6 +35,8 @@ class Object:
         if not isinstance(implements, collections.abc.Iterable):
             implements = (implements,)
 
+        implements = tuple(implements)
+
         for iface in implements:
             if not isinstance(iface, interfaces.base._InterfaceMeta):
                 raise TypeError(
@@ -32,7 +45,50 @@ class Object:
                     iface,
                 )
 
-        for iface in implements:
-            interfaces.util._isimplementation(cls, iface, raise_errors=True)
+        if lazy is None:
+            lazy = lazy_by_default
+
+        if lazy and implements:
+            interfaces.util._defer(cls, implements)
+            _install_verify_on_new(cls)
+        else:
+            for iface in implements:
+                interfaces.util._isimplementation(cls, iface, raise_errors=True)
+
+        # `enforce=True` checks every call, `enforce=N` one call in N
+        if enforce is not False:
+            for iface in implements:
+                interfaces.contracts.enforce(
+                    cls, iface, every=1 if enforce is True else enforce
+                )
 
         super().__init_subclass__()
+
+
+def _install_verify_on_new(cls: type) -> None:
+    """Run the deferred checks of `cls` on its first instantiation.
+
+    The hook replaces `cls.__new__` until it is called once and then restores the
+    original, so later instantiations do not pay for it.
+    """
+    original_new = vars(cls).get('__new__')
+
+    def __new__(klass: type, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        interfaces.util._verify_pending(cls)
+
+        if vars(cls).get('__new__') is verify_on_new:
+            if original_new is None:
+                delattr(cls, '__new__')
+            else:
+                setattr(cls, '__new__', original_new)
+
+        if klass.__new__ is not object.__new__:
+            return klass.__new__(klass, *args, **kwargs)  # type: ignore
+
+        if (args or kwargs) and klass.__init__ is object.__init__:  # type: ignore
+            raise TypeError(f"{klass.__name__}() takes no arguments")
+
+        return object.__new__(klass)
+
+    verify_on_new = staticmethod(__new__)
+    setattr(cls, '__new__', verify_on_new)
@@ -0,0 +1,386 @@
+"""Dependency injection keyed by interfaces.
+
+A `Container` binds interfaces to providers: implementation classes or factories.
+Parameters of a provider annotated with a bound interface are injected. Resolving
+an interface the first time walks its dependency graph once, validating scopes
+and cycles, and compiles it into a function creating the whole graph with plain
+calls, so later resolutions do no reflection.
+
+Scopes decide how long a provided object is reused:
+
+- 'request': one object per `resolve` call, shared inside the graph it builds
+- 'task': one object per asyncio task
+- 'thread': one object per thread
+- 'singleton': one object per container
+
+An object may only depend on objects living at least as long as itself.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import typing
+import weakref
+
+import interfaces.adapters
+import interfaces.base
+import interfaces.contracts
+import interfaces.exceptions
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['Container']
+
+
+_Provider = typing.Callable[..., typing.Any]
+
+# Scopes ordered by the lifetime of their objects
+_SCOPES = {'request': 0, 'task': 1, 'thread': 2, 'singleton': 3}
+
+
+class _Binding:
+    __slots__ = ('iface', 'provider', 'scope', 'unchecked')
+
+    def __init__(
+        self,
+        iface: interfaces.typing.InterfaceType,
+        provider: _Provider,
+        scope: str,
+        unchecked: bool,
+    ) -> None:
+        self.iface = iface
+        self.provider = provider
+        self.scope = scope
+        # Whether results must be checked as the provider was not validated
+        self.unchecked = unchecked
+
+
+class _Function:
+    """Source of a generated function and the names it refers to."""
+
+    def __init__(self) -> None:
+        self.namespace: typing.Dict[str, typing.Any] = {}
+        self.lines: typing.List[str] = []
+        self.variables: typing.Dict[_Binding, str] = {}
+        self.count = 0
+
+    def name(self, value: typing.Any) -> str:
+        name = f'__interfaces_{len(self.namespace)}'
+        self.namespace[name] = value
+        return name
+
+    def variable(self) -> str:
+        self.count += 1
+        return f'__interfaces_value_{self.count}'
+
+    def compile(self, name: str) -> typing.Callable[[], typing.Any]:
+        source = f'def {name}():\n' + interfaces.contracts._indent(
+            '\n'.join(self.lines)
+        )
+        exec(compile(source, f'<interfaces container {name}>', 'exec'), self.namespace)
+        return self.namespace[name]
+
+
+class Container:
+    """Bindings of interfaces to providers and the objects they provided."""
+
+    def __init__(self) -> None:
+        self._bindings: typing.Dict[interfaces.typing.InterfaceType, _Binding] = {}
+        # Interfaces -> plans and bindings -> getters
+        self._plans = interfaces.util._Memo({})
+        self._getters = interfaces.util._Memo({})
+        self._singletons: typing.Dict[_Binding, typing.Any] = {}
+        self._threads = threading.local()
+        self._tasks: weakref.WeakKeyDictionary[
+            asyncio.Task, typing.Dict[_Binding, typing.Any]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+
+    def __contains__(self, iface: object) -> bool:
+        return iface in self._bindings
+
+    def bind(
+        self,
+        iface: interfaces.typing.InterfaceType,
+        provider: _Provider,
+        *,
+        scope: str = 'request',
+    ) -> None:
+        """Bind `iface` to a class or a factory creating its implementations.
+
+        Classes, and factories annotated to return a class, must implement `iface`
+        and are checked right away; results of other factories are checked when
+        they are created.
+        """
+        if not isinstance(iface, interfaces.base._InterfaceMeta):
+            raise TypeError(f"Only interfaces can be bound, not `{iface!r}`")
+        if scope not in _SCOPES:
+            raise ValueError(f"`scope` must be one of {', '.join(_SCOPES)}")
+        if not callable(provider):
+            raise TypeError(f"Provider must be callable, not `{provider!r}`")
+
+        provided_cls = interfaces.adapters._adapter_class(provider)
+        if provided_cls is not None:
+            interfaces.util._isimplementation(provided_cls, iface, raise_errors=True)
+
+        self._set(_Binding(iface, provider, scope, provided_cls is None))
+
+    def bind_instance(
+        self, iface: interfaces.typing.InterfaceType, obj: typing.Any
+    ) -> None:
+        """Bind `iface` to an existing implementation."""
+        interfaces.util._isimplementation(type(obj), iface, raise_errors=True)
+
+        binding = _Binding(iface, lambda: obj, 'singleton', False)
+        self._set(binding)
+        self._singletons[binding] = obj
+
+    def resolve(self, iface: interfaces.typing.InterfaceType) -> typing.Any:
+        """Return an implementation of `iface` with its dependencies injected."""
+        token = self._plans.refresh()
+        try:
+            plan = self._plans.data[iface]
+        except KeyError:
+            plan = self._compile(iface, token)
+        return plan()
+
+    def _set(self, binding: _Binding) -> None:
+        with self._lock:
+            previous = self._bindings.get(binding.iface)
+            if previous is not None:
+                self._singletons.pop(previous, None)
+            self._bindings[binding.iface] = binding
+            self._reset()
+
+    def _reset(self) -> None:
+        # Bindings changed, plans are validated and compiled again
+        with self._lock:
+            self._plans = interfaces.util._Memo({})
+            self._getters = interfaces.util._Memo({})
+
+    def _compile(
+        self, iface: interfaces.typing.InterfaceType, token: int
+    ) -> typing.Callable[[], typing.Any]:
+        with self._lock:
+            function = _Function()
+            result = self._emit(function, iface, ())
+            function.lines.append(f'return {result}')
+            plan = function.compile('resolve')
+            if self._plans.valid(token):
+                self._plans.data[iface] = plan
+            return plan
+
+    def _emit(
+        self,
+        function: _Function,
+        iface: interfaces.typing.InterfaceType,
+        stack: typing.Tuple[_Binding, ...],
+    ) -> str:
+        """Add the creation of `iface` to `function`, return the variable holding it."""
+        binding = self._bindings.get(iface)
+        if binding is None:
+            raise interfaces.exceptions.InterfaceResolutionError(
+                iface=iface, reason='it is not bound'
+            )
+        if binding in function.variables:
+            return function.variables[binding]
+        if binding in stack:
+            cycle = ' -> '.join(repr(item.iface) for item in stack + (binding,))
+            raise interfaces.exceptions.InterfaceResolutionError(
+                iface=stack[0].iface, reason=f'circular dependency {cycle}'
+            )
+        if stack and _SCOPES[binding.scope] < _SCOPES[stack[-1].scope]:
+            raise interfaces.exceptions.InterfaceResolutionError(
+                iface=stack[-1].iface,
+                reason=(
+                    f'a {stack[-1].scope} object cannot depend on the'
+                    f' {binding.scope} `{iface!r}`'
+                ),
+            )
+
+        variable = function.variable()
+        if binding.scope == 'request':
+            function.lines.extend(
+                self._creation(function, binding, stack + (binding,), variable)
+            )
+        else:
+            getter = self._getter(binding, stack + (binding,))
+            function.lines.append(f'{variable} = {function.name(getter)}()')
+
+        function.variables[binding] = variable
+        return variable
+
+    def _creation(
+        self,
+        function: _Function,
+        binding: _Binding,
+        stack: typing.Tuple[_Binding, ...],
+        variable: str,
+    ) -> typing.List[str]:
+        """Return the lines creating `binding` with its dependencies into `variable`."""
+        args = []
+        for name, kind, dependency, default in _dependencies(binding, self._bindings):
+            if dependency is not None:
+                value = self._emit(function, dependency, stack)
+            else:
+                value = function.name(default)
+            args.append(
+                value
+                if kind is inspect.Parameter.POSITIONAL_ONLY
+                else f'{name}={value}'
+            )
+
+        lines = [f'{variable} = {function.name(binding.provider)}({", ".join(args)})']
+        if binding.unchecked:
+            lines.append(
+                f'{function.name(_check)}({variable}, {function.name(binding.iface)})'
+            )
+        return lines
+
+    def _getter(
+        self, binding: _Binding, stack: typing.Tuple[_Binding, ...]
+    ) -> typing.Callable[[], typing.Any]:
+        """Compile a function returning the object of a scoped binding."""
+        token = self._getters.refresh()
+        try:
+            return self._getters.data[binding]
+        except KeyError:
+            pass
+
+        function = _Function()
+        cache = function.name(self._scope_cache(binding))
+        key = function.name(binding)
+        function.lines.extend(
+            [
+                f'__interfaces_cache = {cache}()',
+                'try:',
+                f'    return __interfaces_cache[{key}]',
+                'except KeyError:',
+                '    pass',
+            ]
+        )
+        creation = self._creation(function, binding, stack, '__interfaces_value')
+        creation.append(
+            f'return __interfaces_cache.setdefault({key}, __interfaces_value)'
+        )
+        # Only singletons are shared between threads
+        if binding.scope == 'singleton':
+            function.lines.append(f'with {function.name(self._lock)}:')
+            function.lines.extend(
+                f'    {line}'
+                for line in [
+                    f'if {key} in __interfaces_cache:',
+                    f'    return __interfaces_cache[{key}]',
+                ]
+                + creation
+            )
+        else:
+            function.lines.extend(creation)
+
+        getter = function.compile('get')
+        if self._getters.valid(token):
+            self._getters.data[binding] = getter
+        return getter
+
+    def _scope_cache(
+        self, binding: _Binding
+    ) -> typing.Callable[[], typing.Dict[_Binding, typing.Any]]:
+        if binding.scope == 'singleton':
+            singletons = self._singletons
+            return lambda: singletons
+
+        if binding.scope == 'thread':
+            threads = self._threads
+            # Objects are stored in the attributes of the thread local
+            return lambda: threads.__dict__  # type: ignore
+
+        tasks = self._tasks
+
+        def task_cache() -> typing.Dict[_Binding, typing.Any]:
+            try:
+                task = asyncio.current_task()
+            except RuntimeError:
+                task = None
+            if task is None:
+                raise interfaces.exceptions.InterfaceResolutionError(
+                    iface=binding.iface, reason='task scope outside of an asyncio task'
+                )
+            try:
+                return tasks[task]
+            except KeyError:
+                return tasks.setdefault(task, {})
+
+        return task_cache
+
+
+def _dependencies(
+    binding: _Binding, bindings: typing.Mapping[typing.Any, _Binding]
+) -> typing.Iterator[
+    typing.Tuple[
+        str,
+        inspect._ParameterKind,
+        typing.Optional[interfaces.typing.InterfaceType],
+        typing.Any,
+    ]
+]:
+    """Yield the name, kind, injected interface or else default of parameters.
+
+    Parameters annotated with an interface are injected unless they have a default
+    and the interface is not bound. Other parameters must have a default, which is
+    only passed for positional-only ones.
+    """
+    provider = binding.provider
+    try:
+        signature = inspect.signature(provider)
+        hints = typing.get_type_hints(
+            provider.__init__  # type: ignore
+            if isinstance(provider, type)
+            else provider
+        )
+    except (TypeError, ValueError, NameError) as error:
+        raise interfaces.exceptions.InterfaceResolutionError(
+            iface=binding.iface, reason=f'cannot inspect `{provider!r}`: {error}'
+        ) from None
+
+    for name, parameter in signature.parameters.items():
+        if parameter.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            continue
+
+        hint = _optional_of(hints.get(name))
+        if isinstance(hint, interfaces.base._InterfaceMeta) and (
+            parameter.default is inspect.Parameter.empty or hint in bindings
+        ):
+            yield name, parameter.kind, hint, None
+        elif parameter.default is not inspect.Parameter.empty:
+            if parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
+                yield name, parameter.kind, None, parameter.default
+        else:
+            raise interfaces.exceptions.InterfaceResolutionError(
+                iface=binding.iface,
+                reason=(
+                    f'parameter `{name}` of `{provider!r}` is neither annotated with'
+                    ' an interface nor has a default'
+                ),
+            )
+
+
+def _optional_of(hint: typing.Any) -> typing.Any:
+    """Return `X` of `typing.Optional[X]` or else `hint`.
+
+    Before Python 3.11 `typing.get_type_hints` makes `Optional[X]` of parameters
+    annotated with `X` and defaulting to `None`.
+    """
+    if getattr(hint, '__origin__', None) is typing.Union:
+        args = [arg for arg in hint.__args__ if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _check(obj: typing.Any, iface: interfaces.typing.InterfaceType) -> None:
+    interfaces.util._isimplementation(type(obj), iface, raise_errors=True)
@@ -0,0 +1,226 @@
+"""Runtime argument and return value checks for interface methods.
+
+`enforce` replaces the methods of a class with wrappers generated from the
+interface signature. Each wrapper has the exact parameter list of the method, so
+calls do not go through `*args, **kwargs` packing, and only checks annotations
+that are classes (interfaces included) or unions of classes; anything else is not
+checked. Coroutine methods are checked once awaited, async generators are not
+checked. With sampling, only one call in `every` is checked.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import itertools
+import types
+import typing
+
+import interfaces.exceptions
+import interfaces.spec
+import interfaces.typing
+
+
+__all__ = ['enforce']
+
+
+def enforce(cls: type, iface: interfaces.typing.InterfaceType, every: int = 1) -> None:
+    """Wrap the methods `cls` implements for `iface` with contract checks."""
+    if every < 1:
+        raise ValueError(f"`every` must be a positive number, not `{every!r}`")
+
+    for attr_name, iface_attr in interfaces.spec.interface_spec(iface).items():
+        if not inspect.isfunction(iface_attr):
+            continue
+
+        # Only methods matching the interface signature can be wrapped with it,
+        # mismatches are left to the conformance check to report
+        method = inspect.getattr_static(cls, attr_name, None)
+        if not inspect.isfunction(method) or interfaces.spec.member_fingerprint(
+            method
+        ) != interfaces.spec.member_fingerprint(iface_attr):
+            continue
+
+        wrapper = _make_wrapper(cls, iface, attr_name, iface_attr, method, every)
+        if wrapper is not None:
+            setattr(cls, attr_name, wrapper)
+
+
+def _make_wrapper(
+    cls: type,
+    iface: interfaces.typing.InterfaceType,
+    attr_name: str,
+    iface_attr: types.FunctionType,
+    method: types.FunctionType,
+    every: int,
+) -> typing.Optional[types.FunctionType]:
+    signature = inspect.signature(iface_attr)
+    expected = _expected_types(iface_attr)
+
+    namespace: typing.Dict[str, typing.Any] = {
+        '__interfaces_impl': method,
+        '__interfaces_fail': functools.partial(
+            _fail, cls, attr_name, iface  # type: ignore
+        ),
+        '__interfaces_counter': itertools.count(),
+    }
+    params, call_args = _parameters(signature, namespace)
+    checks = []
+
+    for name, parameter in signature.parameters.items():
+        if name not in expected:
+            continue
+
+        kind = parameter.kind
+        namespace[f'__interfaces_type_{name}'] = expected[name]
+        check = (
+            f'if not isinstance(__interfaces_value, __interfaces_type_{name}):\n'
+            f'    __interfaces_fail({name!r}, __interfaces_value,'
+            f' __interfaces_type_{name})'
+        )
+        # Variadic parameters are annotated with the type of each of their items
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            checks.append(f'for __interfaces_value in {name}:\n' + _indent(check))
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            checks.append(
+                f'for __interfaces_value in {name}.values():\n' + _indent(check)
+            )
+        else:
+            checks.append(f'__interfaces_value = {name}\n' + check)
+
+    flavor = interfaces.spec.function_flavor(iface_attr)
+    if flavor == 'asyncgenerator':
+        return None
+
+    # Coroutine methods get coroutine wrappers checking the awaited result
+    call = f'__interfaces_impl({", ".join(call_args)})'
+    if flavor == 'coroutine':
+        call = f'await {call}'
+    if 'return' in expected:
+        namespace['__interfaces_type_return'] = expected['return']
+        checks.append(
+            f'__interfaces_result = {call}\n'
+            'if not isinstance(__interfaces_result, __interfaces_type_return):\n'
+            '    __interfaces_fail('
+            'None, __interfaces_result, __interfaces_type_return)\n'
+            'return __interfaces_result'
+        )
+    elif checks:
+        checks.append(f'return {call}')
+    else:
+        return None
+
+    body = '\n'.join(checks)
+    if every > 1:
+        body = (
+            f'if next(__interfaces_counter) % {every}:\n' f'    return {call}\n' + body
+        )
+
+    source = f'def {attr_name}({", ".join(params)}):\n' + _indent(body)
+    if flavor == 'coroutine':
+        source = f'async {source}'
+    exec(compile(source, f'<interfaces contract {attr_name}>', 'exec'), namespace)
+
+    wrapper = namespace[attr_name]
+    functools.update_wrapper(wrapper, method)
+    return wrapper
+
+
+def _parameters(
+    signature: inspect.Signature, namespace: typing.Dict[str, typing.Any]
+) -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """Render the parameter list of `signature` and the arguments passing them on.
+
+    Defaults are stored in `namespace` the generated source is executed in.
+    """
+    params = []
+    call_args = []
+    previous_kind = None
+
+    for name, parameter in signature.parameters.items():
+        kind = parameter.kind
+        if previous_kind is inspect.Parameter.POSITIONAL_ONLY and (
+            kind is not inspect.Parameter.POSITIONAL_ONLY
+        ):
+            params.append('/')
+        if kind is inspect.Parameter.KEYWORD_ONLY and (
+            previous_kind is not inspect.Parameter.KEYWORD_ONLY
+            and previous_kind is not inspect.Parameter.VAR_POSITIONAL
+        ):
+            params.append('*')
+        previous_kind = kind
+
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            params.append(f'*{name}')
+            call_args.append(f'*{name}')
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            params.append(f'**{name}')
+            call_args.append(f'**{name}')
+        else:
+            param = name
+            if parameter.default is not inspect.Parameter.empty:
+                namespace[f'__interfaces_default_{name}'] = parameter.default
+                param += f'=__interfaces_default_{name}'
+            params.append(param)
+            call_args.append(
+                f'{name}={name}' if kind is inspect.Parameter.KEYWORD_ONLY else name
+            )
+
+    if previous_kind is inspect.Parameter.POSITIONAL_ONLY:
+        params.append('/')
+
+    return params, call_args
+
+
+def _expected_types(func: types.FunctionType) -> typing.Dict[str, typing.Any]:
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:
+        return {}
+
+    expected = {}
+    for name, hint in hints.items():
+        classes = _classes(hint)
+        if classes is not None:
+            expected[name] = classes
+    return expected
+
+
+def _classes(hint: typing.Any) -> typing.Optional[typing.Tuple[type, ...]]:
+    if hint is None or hint is type(None):
+        return (type(None),)
+
+    if getattr(hint, '__origin__', None) is typing.Union:
+        classes: typing.Tuple[type, ...] = ()
+        for arg in hint.__args__:
+            arg_classes = _classes(arg)
+            if arg_classes is None:
+                return None
+            classes += arg_classes
+        return classes
+
+    if isinstance(hint, type) and not getattr(hint, '__args__', None):
+        return (hint,)
+
+    return None
+
+
+def _fail(
+    cls: type,
+    attr_name: str,
+    iface: interfaces.typing.InterfaceType,
+    param_name: typing.Optional[str],
+    value: typing.Any,
+    expected: typing.Tuple[type, ...],
+) -> None:
+    raise interfaces.exceptions.InterfaceContractError(
+        klass=cls,
+        method_name=attr_name,
+        iface=iface,
+        param_name=param_name,
+        value=value,
+        expected=expected[0] if len(expected) == 1 else typing.Union[expected],
+    )
+
+
+def _indent(body: str) -> str:
+    return ''.join(f'    {line}\n' for line in body.splitlines())
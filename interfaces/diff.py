@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import inspect
+import itertools
+import typing
+
+import interfaces.spec
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['Explanation', 'MemberDiff', 'explain']
+
+
+class MemberDiff(typing.NamedTuple):
+    attr_name: str
+    # One of 'missing', 'mismatch' or 'unsupported' like `VerificationResult`
+    reason: str
+    expected: typing.Optional[interfaces.spec.Fingerprint]
+    actual: typing.Optional[interfaces.spec.Fingerprint]
+    details: typing.Tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        return f"{self.attr_name}: {'; '.join(self.details) or self.reason}"
+
+
+class Explanation(typing.NamedTuple):
+    cls: type
+    iface: interfaces.typing.InterfaceType
+    members: typing.Tuple[MemberDiff, ...]
+
+    @property
+    def ok(self) -> bool:
+        return not self.members
+
+    def __str__(self) -> str:
+        if self.ok:
+            return f"`{self.cls!r}` implements `{self.iface!r}`"
+        return f"`{self.cls!r}` does not implement `{self.iface!r}`:\n" + '\n'.join(
+            f"  {member}" for member in self.members
+        )
+
+
+def explain(cls: type, iface: interfaces.typing.InterfaceType) -> Explanation:
+    """Return every member of `iface` that `cls` does not implement and why.
+
+    A cached verdict is reused: members preceding the cached failing one in the
+    interface spec are known to match and are not compared again.
+    """
+    verdict_cache = iface.__interface_cache__
+    generation = verdict_cache.generation
+    verdict = verdict_cache.get(cls)
+    if verdict is None:
+        return Explanation(cls, iface, ())
+
+    iface_spec = interfaces.spec.interface_spec(iface)
+
+    fingerprints = iface_spec.fingerprints().items()
+    if verdict is not interfaces.util._MISSING:
+        fingerprints = itertools.dropwhile(  # type: ignore
+            lambda item: item[0] != verdict, fingerprints
+        )
+
+    mro = interfaces.util._static_mro(cls)
+    members = []
+    for attr_name, iface_fingerprint in fingerprints:
+        member = _member_diff(cls, mro, attr_name, iface_fingerprint, iface_spec)
+        if member is not None:
+            members.append(member)
+
+    if verdict is interfaces.util._MISSING:
+        interfaces.util._record(
+            cls, iface, members[0].attr_name if members else None, generation
+        )
+
+    return Explanation(cls, iface, tuple(members))
+
+
+def _member_diff(
+    cls: type,
+    mro: typing.Tuple[type, ...],
+    attr_name: str,
+    iface_fingerprint: typing.Optional[interfaces.spec.Fingerprint],
+    iface_spec: interfaces.spec.InterfaceSpec,
+) -> typing.Optional[MemberDiff]:
+    if iface_fingerprint is None:
+        return MemberDiff(
+            attr_name,
+            'unsupported',
+            None,
+            None,
+            ('the interface member is neither a function nor a data descriptor',),
+        )
+
+    fingerprint = interfaces.util._class_fingerprint(cls, mro, attr_name)
+    if fingerprint is interfaces.util._MISSING:
+        return MemberDiff(attr_name, 'missing', iface_fingerprint, None, ('missing',))
+
+    if (
+        fingerprint == iface_fingerprint
+        or interfaces.spec.kinds_match(fingerprint, iface_fingerprint)  # type: ignore
+        or iface_spec.variance
+        and interfaces.util._compatible(cls, mro, attr_name, iface_spec)
+    ):
+        return None
+
+    return MemberDiff(
+        attr_name,
+        'mismatch',
+        iface_fingerprint,
+        fingerprint,  # type: ignore
+        tuple(_differences(iface_fingerprint, fingerprint)),  # type: ignore
+    )
+
+
+def _differences(
+    expected: interfaces.spec.Fingerprint,
+    actual: typing.Optional[interfaces.spec.Fingerprint],
+) -> typing.Iterator[str]:
+    if actual is None:
+        yield 'neither a function nor a data descriptor'
+        return
+
+    if (
+        expected[0] != actual[0]
+        and (expected[0], actual[0]) not in interfaces.spec._kind_matches
+    ):
+        yield f"expected {_KINDS[expected[0]]}, got {_KINDS[actual[0]]}"
+        return
+
+    if expected[0] in ('function', 'classmethod', 'staticmethod'):
+        if expected[2] != actual[2]:
+            yield f"expected a {_FLAVORS[expected[2]]}, got a {_FLAVORS[actual[2]]}"
+        yield from _signature_differences(expected[1], actual[1])
+    elif expected[0] in ('property', 'attribute'):
+        yield from _typed_differences(expected, actual)
+    else:
+        for method_name, expected_method, actual_method in zip(
+            ('__get__', '__set__', '__delete__'), expected[1:], actual[1:]
+        ):
+            if actual_method is None:
+                yield f"descriptor has no `{method_name}`"
+            elif expected_method is None:
+                yield f"descriptor has an unexpected `{method_name}`"
+            elif expected_method != actual_method:
+                yield f"descriptor `{method_name}` has a different signature"
+
+
+def _typed_differences(
+    expected: interfaces.spec.Fingerprint, actual: interfaces.spec.Fingerprint
+) -> typing.Iterator[str]:
+    """Compare properties and attributes, which may implement each other."""
+    if expected[1] != actual[1] and not (
+        expected[0] == actual[0] == 'attribute' and actual[1] is inspect.Parameter.empty
+    ):
+        yield (
+            f"{'property returns' if actual[0] == 'property' else 'attribute is annotated'}"
+            f" {_annotation(actual[1])} instead of {_annotation(expected[1])}"
+        )
+
+    if actual[0] == 'property':
+        if (expected[0] == 'attribute' or expected[2]) and not actual[2]:
+            yield 'property has no setter'
+        if expected[0] == 'property' and expected[3] and not actual[3]:
+            yield 'property has no deleter'
+
+
+_KINDS = {
+    'function': 'a method',
+    'classmethod': 'a class method',
+    'staticmethod': 'a static method',
+    'property': 'a property',
+    'attribute': 'an attribute',
+    'datadescriptor': 'a data descriptor',
+}
+_FLAVORS = {
+    'sync': 'regular method',
+    'coroutine': 'coroutine method',
+    'asyncgenerator': 'async generator method',
+}
+
+
+def _signature_differences(
+    expected: interfaces.spec.Fingerprint, actual: interfaces.spec.Fingerprint
+) -> typing.Iterator[str]:
+    expected_parameters, expected_kwonly, expected_return = expected
+    actual_parameters, actual_kwonly, actual_return = actual
+
+    for position, (expected_parameter, actual_parameter) in enumerate(
+        itertools.zip_longest(expected_parameters, actual_parameters)
+    ):
+        if actual_parameter is None:
+            yield f"missing parameter `{expected_parameter[0]}`"
+        elif expected_parameter is None:
+            yield f"unexpected parameter `{actual_parameter[0]}`"
+        elif expected_parameter[0] != actual_parameter[0]:
+            yield (
+                f"parameter {position} is named `{actual_parameter[0]}` instead of"
+                f" `{expected_parameter[0]}`"
+            )
+        else:
+            yield from _parameter_differences(expected_parameter, actual_parameter)
+
+    expected_kwonly_by_name = {parameter[0]: parameter for parameter in expected_kwonly}
+    actual_kwonly_by_name = {parameter[0]: parameter for parameter in actual_kwonly}
+    for name, expected_parameter in expected_kwonly_by_name.items():
+        actual_parameter = actual_kwonly_by_name.get(name)
+        if actual_parameter is None:
+            yield f"missing keyword-only parameter `{name}`"
+        else:
+            yield from _parameter_differences(expected_parameter, actual_parameter)
+    for name in actual_kwonly_by_name.keys() - expected_kwonly_by_name.keys():
+        yield f"unexpected keyword-only parameter `{name}`"
+
+    if expected_return != actual_return:
+        yield (
+            f"returns {_annotation(actual_return)} instead of"
+            f" {_annotation(expected_return)}"
+        )
+
+
+def _parameter_differences(
+    expected: interfaces.spec.Fingerprint, actual: interfaces.spec.Fingerprint
+) -> typing.Iterator[str]:
+    name, expected_kind, expected_default, expected_annotation = expected
+    _, actual_kind, actual_default, actual_annotation = actual
+
+    if expected_kind != actual_kind:
+        yield (
+            f"parameter `{name}` is {_kind(actual_kind)} instead of"
+            f" {_kind(expected_kind)}"
+        )
+    if expected_default != actual_default:
+        yield (
+            f"parameter `{name}` has {_default(actual_default)} instead of"
+            f" {_default(expected_default)}"
+        )
+    if expected_annotation != actual_annotation:
+        yield (
+            f"parameter `{name}` is annotated {_annotation(actual_annotation)}"
+            f" instead of {_annotation(expected_annotation)}"
+        )
+
+
+def _kind(kind: inspect._ParameterKind) -> str:
+    return kind.name.lower().replace('_', ' ')
+
+
+def _annotation(annotation: typing.Any) -> str:
+    if annotation is inspect.Parameter.empty:
+        return 'nothing'
+    return f"`{inspect.formatannotation(annotation)}`"
+
+
+def _default(default: typing.Any) -> str:
+    if default is inspect.Parameter.empty:
+        return 'no default'
+    return f"default `{default!r}`"
@@ -0,0 +1,229 @@
+"""Persistent conformance verdicts shared between processes.
+
+A verdict is stored under a key derived from
+
+* the source hashes of the modules defining the class and all of its bases,
+* the class qualified name and, for each class member the interface requires,
+  its origin (module, qualified name, first line) and its fingerprint,
+* a hash of the interface spec fingerprints and of the interface module source.
+
+Editing any of the involved modules, monkeypatching a member with a function
+defined elsewhere, annotating members differently from the same source (e.g. in a
+class factory) or changing the interface produces a different key, so stale
+entries are never read; they are just left behind. Classes whose members do not
+come from a source file (e.g. created with `exec`) are never cached.
+
+Each entry is a separate file written atomically with `os.replace`, so concurrent
+writers at worst overwrite an entry with the same verdict.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import typing
+import weakref
+
+import interfaces.spec
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['DiskCache', 'disable_disk_cache', 'enable_disk_cache']
+
+
+_UNCACHEABLE = object()
+
+
+class DiskCache:
+    def __init__(self, directory: typing.Optional[str] = None) -> None:
+        self.directory = directory
+        self._source_hashes: typing.Dict[
+            str, typing.Tuple[typing.Tuple[int, int], str]
+        ] = {}
+        self._spec_hashes: weakref.WeakKeyDictionary[
+            interfaces.typing.InterfaceType,
+            typing.Tuple[interfaces.spec.InterfaceSpec, typing.Optional[str]],
+        ] = weakref.WeakKeyDictionary()
+
+    def get(
+        self, cls: type, iface: interfaces.typing.InterfaceType
+    ) -> typing.Union[typing.Optional[str], object]:
+        """Return the stored failing member name, `None` or `_MISSING`."""
+        path = self._entry_path(cls, iface)
+        if path is None:
+            return interfaces.util._MISSING
+
+        try:
+            with open(path, encoding='utf-8') as entry_file:
+                return json.load(entry_file)['attr_name']
+        except (OSError, ValueError, KeyError, TypeError):
+            return interfaces.util._MISSING
+
+    def set(
+        self,
+        cls: type,
+        iface: interfaces.typing.InterfaceType,
+        attr_name: typing.Optional[str],
+    ) -> None:
+        path = self._entry_path(cls, iface)
+        if path is None:
+            return
+
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as entry_file:
+                json.dump({'attr_name': attr_name}, entry_file)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _entry_path(
+        self, cls: type, iface: interfaces.typing.InterfaceType
+    ) -> typing.Optional[str]:
+        key = self._key(cls, iface)
+        if key is None:
+            return None
+
+        directory = self.directory
+        if directory is None:
+            module_file = getattr(sys.modules.get(cls.__module__), '__file__', None)
+            if module_file is None:
+                return None
+            directory = os.path.join(
+                os.path.dirname(module_file), '__pycache__', 'interfaces'
+            )
+
+        return os.path.join(directory, f'{key}.json')
+
+    def _key(
+        self, cls: type, iface: interfaces.typing.InterfaceType
+    ) -> typing.Optional[str]:
+        iface_spec = interfaces.spec.interface_spec(iface)
+        cached_spec, spec_hash = self._spec_hashes.get(iface, (None, None))
+        if cached_spec is not iface_spec:
+            spec_hash = self._spec_hash(iface, iface_spec)
+            self._spec_hashes[iface] = (iface_spec, spec_hash)
+
+        if spec_hash is None:
+            return None
+
+        mro = interfaces.util._static_mro(cls)
+        modules_hashes = tuple(self._module_hash(klass.__module__) for klass in mro)
+        members_origins = tuple(
+            self._member_origin(interfaces.util._lookup_static(mro, attr_name))
+            for attr_name in iface_spec
+        )
+        if _UNCACHEABLE in modules_hashes or _UNCACHEABLE in members_origins:
+            return None
+
+        # Origins tell missing members apart, `_MISSING` has no stable repr
+        members_fingerprints = tuple(
+            None if fingerprint is interfaces.util._MISSING else fingerprint
+            for fingerprint in (
+                interfaces.util._class_fingerprint(cls, mro, attr_name)
+                for attr_name in iface_spec
+            )
+        )
+        parts = (spec_hash, cls.__module__, cls.__qualname__)
+        return _hash(
+            repr(parts + modules_hashes + members_origins + members_fingerprints)
+        )
+
+    def _spec_hash(
+        self,
+        iface: interfaces.typing.InterfaceType,
+        iface_spec: interfaces.spec.InterfaceSpec,
+    ) -> typing.Optional[str]:
+        module_hash = self._module_hash(iface.__module__)
+        if module_hash is _UNCACHEABLE:
+            return None
+
+        return _hash(
+            repr(
+                (
+                    module_hash,
+                    iface.__module__,
+                    iface.__qualname__,
+                    iface_spec.variance,
+                    tuple(iface_spec.fingerprints().items()),
+                )
+            )
+        )
+
+    def _member_origin(self, member: typing.Any) -> typing.Any:
+        if member is interfaces.util._MISSING:
+            return None
+
+        origin: typing.Tuple[str, str, typing.Optional[int]]
+        if isinstance(member, (classmethod, staticmethod)):
+            member = member.__func__
+        elif isinstance(member, property) and member.fget is not None:
+            member = member.fget
+        if inspect.isfunction(member):
+            code = member.__code__
+            if code.co_filename.startswith('<'):
+                return _UNCACHEABLE
+            origin = (member.__module__, member.__qualname__, code.co_firstlineno)
+        else:
+            # Data descriptors are fingerprinted by their type, values by the
+            # annotation in the hashed modules
+            member_type = type(member)
+            origin = (member_type.__module__, member_type.__qualname__, None)
+
+        module_hash = self._module_hash(origin[0])
+        return _UNCACHEABLE if module_hash is _UNCACHEABLE else (module_hash,) + origin
+
+    def _module_hash(self, module_name: str) -> typing.Union[str, object]:
+        module = sys.modules.get(module_name)
+        if module is None:
+            return _UNCACHEABLE
+
+        path = getattr(module, '__file__', None)
+        if path is None:
+            # Built-in modules change together with the interpreter only
+            return sys.version if module_name == 'builtins' else _UNCACHEABLE
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return _UNCACHEABLE
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._source_hashes.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            with open(path, 'rb') as source_file:
+                source_hash = hashlib.sha256(source_file.read()).hexdigest()
+        except OSError:
+            return _UNCACHEABLE
+
+        self._source_hashes[path] = (stamp, source_hash)
+        return source_hash
+
+
+def enable_disk_cache(directory: typing.Optional[str] = None) -> DiskCache:
+    """Persist verdicts in `directory` or in `__pycache__/interfaces` by default.
+
+    Called on the first check with the `INTERFACES_CACHE_DIR` environment
+    variable, if set, unless the disk cache was enabled or disabled before.
+    """
+    interfaces.util._disk_cache = DiskCache(directory)
+    interfaces.util._disk_cache_configured = True
+    return interfaces.util._disk_cache
+
+
+def disable_disk_cache() -> None:
+    interfaces.util._disk_cache = None
+    interfaces.util._disk_cache_configured = True
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import functools
+import types
+import typing
+import weakref
+
+import interfaces.base
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['dispatch']
+
+
+_Func = typing.TypeVar('_Func', bound=typing.Callable[..., typing.Any])
+_Handler = typing.TypeVar('_Handler')
+
+
+def dispatch(func: _Func) -> _Func:
+    """Single-dispatch generic function keyed on interfaces and classes.
+
+    Works like `functools.singledispatch` but handlers can be registered for
+    interfaces which are matched structurally. A class registered in the MRO of
+    the argument type takes precedence over interfaces; among the implemented
+    interfaces the most derived one wins and unrelated matches are ambiguous.
+
+    The chosen handler is cached per argument type. The cache is dropped when a
+    handler is registered or an interface is mutated; call `cache_clear()` after
+    mutating classes that have already been dispatched on.
+    """
+    registry: typing.Dict[type, typing.Callable[..., typing.Any]] = {object: func}
+    dispatch_cache: weakref.WeakKeyDictionary[
+        type, typing.Callable[..., typing.Any]
+    ] = weakref.WeakKeyDictionary()
+    dispatch_memo = interfaces.util._Memo(dispatch_cache)
+
+    def dispatch(cls: type) -> typing.Callable[..., typing.Any]:
+        token = dispatch_memo.refresh()
+        try:
+            return dispatch_cache[cls]
+        except KeyError:
+            # `registry` always has a handler for `object`
+            impl = typing.cast(
+                typing.Callable[..., typing.Any], _find_impl(cls, registry)
+            )
+            if dispatch_memo.valid(token):
+                dispatch_cache[cls] = impl
+            return impl
+
+    def register(
+        cls: typing.Any, func: typing.Optional[typing.Callable[..., typing.Any]] = None
+    ) -> typing.Any:
+        if func is None:
+            if isinstance(cls, type):
+                return lambda func: register(cls, func)
+
+            # `@register` used with an annotated first parameter
+            func = cls
+            annotations = typing.get_type_hints(func)
+            annotations.pop('return', None)
+            if not annotations:
+                raise TypeError(
+                    f"Invalid first argument to `register()`: {cls!r}. Use either"
+                    " `@register(some_class)` or plain `@register` on an annotated"
+                    " function."
+                )
+            cls = next(iter(annotations.values()))
+
+        if not isinstance(cls, type):
+            raise TypeError(f"Invalid annotation for `register()`: {cls!r}")
+
+        registry[cls] = func
+        dispatch_cache.clear()
+        return func
+
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        if not args:
+            raise TypeError(f"{funcname} requires at least 1 positional argument")
+
+        return dispatch(args[0].__class__)(*args, **kwargs)
+
+    funcname = getattr(func, '__name__', 'dispatch function')
+    wrapper.register = register  # type: ignore
+    wrapper.dispatch = dispatch  # type: ignore
+    wrapper.registry = types.MappingProxyType(registry)  # type: ignore
+    wrapper.cache_clear = dispatch_cache.clear  # type: ignore
+    functools.update_wrapper(wrapper, func)
+    return typing.cast(_Func, wrapper)
+
+
+def _find_impl(
+    cls: type, registry: typing.Mapping[type, _Handler]
+) -> typing.Optional[_Handler]:
+    """Return the handler for `cls` or the one for `object` if there is any."""
+    for klass in cls.__mro__[:-1]:
+        if klass in registry:
+            return registry[klass]
+
+    matches = [
+        iface
+        for iface in registry
+        if isinstance(iface, interfaces.base._InterfaceMeta)
+        and interfaces.util._isimplementation(cls, iface)
+    ]
+    # Drop interfaces that are ancestors of other matches
+    matches = [
+        iface
+        for iface in matches
+        if not any(iface is not other and iface in other.__mro__ for other in matches)
+    ]
+
+    if len(matches) > 1:
+        raise RuntimeError(
+            f"Ambiguous dispatch for {cls!r}: {', '.join(map(repr, matches))}"
+        )
+
+    return registry.get(matches[0] if matches else object)
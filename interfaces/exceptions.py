@@ -5,10 +5,17 @@ import typing
 import interfaces.typing
 
 
+if typing.TYPE_CHECKING:
+    import interfaces.diff
+
+
 __all__ = [
+    'InterfaceAdaptationError',
+    'InterfaceContractError',
     'InterfaceNoInstanceAllowedError',
     'InterfaceNotImplementedError',
     'InterfaceOverloadingError',
+    'InterfaceResolutionError',
 ]
 
 
@@ -34,16 +41,21 @@ class InterfaceNotImplementedError(InterfaceError):
         klass: typing.Type,
         method_name: str,
         iface: interfaces.typing.InterfaceType,
+        explanation: typing.Optional[interfaces.diff.Explanation] = None,
     ) -> None:
         self._klass = klass
         self._method_name = method_name
         self._iface = iface
+        self.explanation = explanation
 
     def __str__(self) -> str:
-        return (
+        message = (
             f"`{self._klass!r}` must fully implement `{self._method_name!s}` method of"
             f" `{self._iface}`"
         )
+        if self.explanation is not None:
+            message += ''.join(f"\n  {member}" for member in self.explanation.members)
+        return message
 
 
 class InterfaceOverloadingError(InterfaceError):
@@ -63,3 +75,56 @@ class InterfaceOverloadingError(InterfaceError):
             f"Attempted to overload method(s) `{self._method_names!s}` of"
             f" `{self._ancestor_iface!r}` in `{self._descendant_iface!r}`"
         )
+
+
+class InterfaceContractError(InterfaceError, TypeError):
+    def __init__(
+        self,
+        *,
+        klass: typing.Type,
+        method_name: str,
+        iface: interfaces.typing.InterfaceType,
+        param_name: typing.Optional[str],
+        value: typing.Any,
+        expected: typing.Any,
+    ) -> None:
+        self._klass = klass
+        self._method_name = method_name
+        self._iface = iface
+        self._param_name = param_name
+        self._value = value
+        self._expected = expected
+
+    def __str__(self) -> str:
+        target = (
+            "return value"
+            if self._param_name is None
+            else f"argument `{self._param_name!s}`"
+        )
+        return (
+            f"`{self._klass!r}.{self._method_name!s}` got {target} {self._value!r}"
+            f" which is not `{self._expected!r}` as declared by `{self._iface!r}`"
+        )
+
+
+class InterfaceAdaptationError(InterfaceError, TypeError):
+    def __init__(
+        self, *, obj: typing.Any, iface: interfaces.typing.InterfaceType
+    ) -> None:
+        self._obj = obj
+        self._iface = iface
+
+    def __str__(self) -> str:
+        return (
+            f"`{self._obj!r}` does not implement `{self._iface!r}` and there is no"
+            " adapter registered for it"
+        )
+
+
+class InterfaceResolutionError(InterfaceError, LookupError):
+    def __init__(self, *, iface: interfaces.typing.InterfaceType, reason: str) -> None:
+        self._iface = iface
+        self._reason = reason
+
+    def __str__(self) -> str:
+        return f"Cannot resolve `{self._iface!r}`: {self._reason!s}"
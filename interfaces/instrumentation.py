@@ -0,0 +1,155 @@
+"""Opt-in counters and hooks for conformance checks and spec construction.
+
+Nothing is measured until `enable_instrumentation` is called: the checking code
+only tests whether a monitor is installed on cache misses, and cache hits are
+counted by the verdict caches regardless.
+"""
+from __future__ import annotations
+
+import heapq
+import typing
+import weakref
+
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = [
+    'CheckEvent',
+    'InterfaceStats',
+    'Monitor',
+    'disable_instrumentation',
+    'enable_instrumentation',
+]
+
+
+class CheckEvent(typing.NamedTuple):
+    # 'check' for a computed verdict, 'spec' for a built `InterfaceSpec`
+    kind: str
+    iface: interfaces.typing.InterfaceType
+    cls: typing.Optional[type]
+    duration: float
+    attr_name: typing.Optional[str] = None
+
+
+class InterfaceStats:
+    __slots__ = ('checks', 'check_time', 'specs', 'spec_time', '_slowest')
+
+    def __init__(self) -> None:
+        self.checks = 0
+        self.check_time = 0.0
+        self.specs = 0
+        self.spec_time = 0.0
+        self._slowest: typing.List[typing.Tuple[float, int, str]] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__!s}(checks={self.checks!r},"
+            f" check_time={self.check_time!r}, specs={self.specs!r},"
+            f" spec_time={self.spec_time!r})"
+        )
+
+    def slowest(self) -> typing.List[typing.Tuple[str, float]]:
+        """Return `(class qualified name, seconds)` of the slowest checks."""
+        return [
+            (cls_name, duration)
+            for duration, _, cls_name in sorted(self._slowest, reverse=True)
+        ]
+
+
+class Monitor:
+    def __init__(
+        self,
+        hooks: typing.Iterable[typing.Callable[[CheckEvent], typing.Any]] = (),
+        slowest: int = 10,
+    ) -> None:
+        self.hooks = list(hooks)
+        self._slowest = slowest
+        self._stats: weakref.WeakKeyDictionary[
+            interfaces.typing.InterfaceType, InterfaceStats
+        ] = weakref.WeakKeyDictionary()
+        self._sequence = 0
+
+    def stats(
+        self, iface: interfaces.typing.InterfaceType
+    ) -> typing.Optional[InterfaceStats]:
+        return self._stats.get(iface)
+
+    def all_stats(
+        self,
+    ) -> typing.Dict[interfaces.typing.InterfaceType, InterfaceStats]:
+        return dict(self._stats)
+
+    def report(
+        self,
+    ) -> typing.List[
+        typing.Tuple[
+            interfaces.typing.InterfaceType, InterfaceStats, interfaces.util.CacheInfo
+        ]
+    ]:
+        """Return `(interface, stats, cache info)` ordered by time spent checking."""
+        return sorted(
+            (
+                (iface, stats, interfaces.util.cache_info(iface))
+                for iface, stats in list(self._stats.items())
+            ),
+            key=lambda row: row[1].check_time + row[1].spec_time,
+            reverse=True,
+        )
+
+    def check(
+        self,
+        iface: interfaces.typing.InterfaceType,
+        cls: type,
+        duration: float,
+        attr_name: typing.Optional[str],
+    ) -> None:
+        stats = self._iface_stats(iface)
+        stats.checks += 1
+        stats.check_time += duration
+
+        self._sequence += 1
+        entry = (duration, self._sequence, getattr(cls, '__qualname__', repr(cls)))
+        if len(stats._slowest) < self._slowest:
+            heapq.heappush(stats._slowest, entry)
+        elif self._slowest:
+            heapq.heappushpop(stats._slowest, entry)
+
+        self._emit(CheckEvent('check', iface, cls, duration, attr_name))
+
+    def spec(self, iface: interfaces.typing.InterfaceType, duration: float) -> None:
+        stats = self._iface_stats(iface)
+        stats.specs += 1
+        stats.spec_time += duration
+
+        self._emit(CheckEvent('spec', iface, None, duration))
+
+    def _iface_stats(self, iface: interfaces.typing.InterfaceType) -> InterfaceStats:
+        try:
+            return self._stats[iface]
+        except KeyError:
+            return self._stats.setdefault(iface, InterfaceStats())
+
+    def _emit(self, event: CheckEvent) -> None:
+        for hook in self.hooks:
+            hook(event)
+
+
+_monitor: typing.Optional[Monitor] = None
+
+
+def enable_instrumentation(
+    *hooks: typing.Callable[[CheckEvent], typing.Any], slowest: int = 10
+) -> Monitor:
+    """Install a fresh `Monitor` calling `hooks` with every `CheckEvent`.
+
+    `slowest` is the number of slowest checked classes kept per interface.
+    """
+    global _monitor
+    _monitor = Monitor(hooks, slowest)
+    return _monitor
+
+
+def disable_instrumentation() -> None:
+    global _monitor
+    _monitor = None
@@ -0,0 +1,336 @@
+"""Forwarding implementations of interfaces.
+
+`proxy` generates, once per interface and hooks, a class with a method for every
+interface method. Each one has the exact signature of the interface method and
+calls the same method of the target, so proxies pass conformance checks and
+calls go neither through `__getattr__` nor through `*args, **kwargs` packing.
+
+`offload` generates the same kind of class for interfaces with coroutine methods
+and targets implementing them with blocking methods, which are then run in an
+executor instead of blocking the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+import types
+import typing
+import weakref
+
+import interfaces.contracts
+import interfaces.exceptions
+import interfaces.spec
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['offload', 'proxy', 'set_offload_executor']
+
+
+_Before = typing.Callable[[str, typing.Tuple[typing.Any, ...], typing.Dict], None]
+_After = typing.Callable[[str, typing.Any], typing.Any]
+# Hooks and whether coroutine methods are offloaded to an executor
+_Key = typing.Tuple[typing.Optional[_Before], typing.Optional[_After], bool]
+
+_proxy_classes: weakref.WeakKeyDictionary[
+    interfaces.typing.InterfaceType, typing.Dict[_Key, type]
+] = weakref.WeakKeyDictionary()
+_proxy_classes_memo = interfaces.util._Memo(_proxy_classes)
+
+# Used by `offload` without an executor, `None` is the event loop's default one
+_offload_executor: typing.Optional[concurrent.futures.Executor] = None
+
+
+def proxy(
+    iface: interfaces.typing.InterfaceType,
+    target_or_factory: typing.Any,
+    *,
+    before: typing.Optional[_Before] = None,
+    after: typing.Optional[_After] = None,
+) -> typing.Any:
+    """Return an implementation of `iface` forwarding its members to a target.
+
+    `target_or_factory` is either an object implementing `iface` or a callable
+    without arguments, e.g. a class, that creates the target on first use.
+    `before(method_name, args, kwargs)` is called ahead of every method call and
+    `after(method_name, result)` returns what the call returns, or each item for
+    async generators. Properties and attributes are forwarded without hooks.
+    """
+    return _instantiate(_proxy_class(iface, before, after, False), target_or_factory)
+
+
+def offload(
+    iface: interfaces.typing.InterfaceType,
+    target_or_factory: typing.Any,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    *,
+    before: typing.Optional[_Before] = None,
+    after: typing.Optional[_After] = None,
+) -> typing.Any:
+    """Return an implementation of `iface` running blocking methods in `executor`.
+
+    The target implements the coroutine methods of `iface` with regular methods of
+    the same signature, which are called with `loop.run_in_executor`. Other members
+    are forwarded as by `proxy`. Without `executor` the one set with
+    `set_offload_executor` is used, or else the event loop's default executor.
+    """
+    instance = _instantiate(_proxy_class(iface, before, after, True), target_or_factory)
+    instance.__interfaces_executor__ = executor
+    return instance
+
+
+def set_offload_executor(
+    executor: typing.Optional[concurrent.futures.Executor],
+) -> None:
+    """Set the executor `offload` uses by default, `None` for the loop's default."""
+    global _offload_executor
+    _offload_executor = executor
+
+
+def _instantiate(cls: typing.Any, target_or_factory: typing.Any) -> typing.Any:
+    instance = object.__new__(cls)
+
+    if _accepts(cls, type(target_or_factory)):
+        instance.__interfaces_target__ = target_or_factory
+    elif callable(target_or_factory):
+        instance.__interfaces_factory__ = target_or_factory
+        # Per proxy, factories may use other lazy proxies; reentrant so that one
+        # using its own proxy fails with a `RecursionError` rather than hangs
+        instance.__interfaces_lock__ = threading.RLock()
+    else:
+        _accepts(cls, type(target_or_factory), raise_errors=True)
+
+    return instance
+
+
+def _accepts(proxy_cls: typing.Any, cls: type, raise_errors: bool = False) -> bool:
+    """Return whether instances of `cls` can be the target of a `proxy_cls`."""
+    iface = proxy_cls.__interfaces_proxied__
+    if not proxy_cls.__interfaces_offloading__:
+        return interfaces.util._isimplementation(cls, iface, raise_errors=raise_errors)
+
+    # Offloaded targets implement coroutine methods with regular ones
+    mro = interfaces.util._static_mro(cls)
+    iface_fingerprints = interfaces.spec.interface_spec(iface).fingerprints()
+    for attr_name, iface_fingerprint in iface_fingerprints.items():
+        if iface_fingerprint is not None and iface_fingerprint[0] == 'function':
+            iface_fingerprint = iface_fingerprint[:2] + ('sync',)
+        fingerprint = interfaces.util._class_fingerprint(cls, mro, attr_name)
+        if fingerprint != iface_fingerprint and (
+            fingerprint is interfaces.util._MISSING
+            or not interfaces.spec.kinds_match(
+                fingerprint, iface_fingerprint  # type: ignore
+            )
+        ):
+            if raise_errors:
+                raise interfaces.exceptions.InterfaceNotImplementedError(
+                    klass=cls, method_name=attr_name, iface=iface
+                )
+            return False
+    return True
+
+
+def _proxy_class(
+    iface: interfaces.typing.InterfaceType,
+    before: typing.Optional[_Before],
+    after: typing.Optional[_After],
+    offloading: bool,
+) -> type:
+    token = _proxy_classes_memo.refresh()
+    key = (before, after, offloading)
+    try:
+        return _proxy_classes[iface][key]
+    except KeyError:
+        pass
+
+    cls = _make_class(iface, before, after, offloading)
+    if _proxy_classes_memo.valid(token):
+        _proxy_classes.setdefault(iface, {})[key] = cls
+    return cls
+
+
+def _make_class(
+    iface: interfaces.typing.InterfaceType,
+    before: typing.Optional[_Before],
+    after: typing.Optional[_After],
+    offloading: bool,
+) -> type:
+    cls_name = f'{iface.__name__}Proxy'
+    namespace: typing.Dict[str, typing.Any] = {
+        '__slots__': (
+            '__interfaces_target__',
+            '__interfaces_factory__',
+            '__interfaces_lock__',
+            '__interfaces_executor__',
+        ),
+        '__interfaces_proxied__': iface,
+        '__interfaces_offloading__': offloading,
+        '__getattr__': _resolve_target,
+        '__module__': iface.__module__,
+        '__qualname__': f'{iface.__qualname__}Proxy',
+    }
+
+    for attr_name, member in interfaces.spec.interface_spec(iface).items():
+        kind = interfaces.spec.member_kind(member)
+        if kind == 'function':
+            namespace[attr_name] = _forwarding_method(
+                cls_name, attr_name, member, before, after, offloading
+            )
+        elif kind in ('property', 'attribute'):
+            namespace[attr_name] = _forwarding_property(attr_name, member)
+        else:
+            raise TypeError(
+                f"Cannot proxy `{attr_name}` of `{iface!r}`, only methods,"
+                " properties and attributes can be forwarded"
+            )
+
+    cls = type(cls_name, (), namespace)
+    interfaces.util._isimplementation(cls, iface, raise_errors=True)
+    return cls
+
+
+def _forwarding_method(
+    cls_name: str,
+    attr_name: str,
+    member: types.FunctionType,
+    before: typing.Optional[_Before],
+    after: typing.Optional[_After],
+    offloading: bool,
+) -> types.FunctionType:
+    signature = inspect.signature(member)
+    parameters = list(signature.parameters.values())
+    if not parameters or parameters[0].kind not in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        raise TypeError(
+            f"Cannot proxy `{attr_name}` without a positional `self` parameter"
+        )
+
+    namespace: typing.Dict[str, typing.Any] = {
+        '__name__': __name__,
+        '__interfaces_before': before,
+        '__interfaces_after': after,
+        '__interfaces_partial': functools.partial,
+        '__interfaces_run': _run_in_executor,
+    }
+    params, call_args = interfaces.contracts._parameters(signature, namespace)
+    self_name = parameters[0].name
+    call_args = call_args[1:]
+
+    call = f'{self_name}.__interfaces_target__.{attr_name}({", ".join(call_args)})'
+    body = ''
+    if before is not None:
+        # The hook gets the arguments as the target would with `*args, **kwargs`
+        args = []
+        kwargs = []
+        for parameter in parameters[1:]:
+            if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+                args.append(f'*{parameter.name}')
+            elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                kwargs.append(f'**{parameter.name}')
+            elif parameter.kind is inspect.Parameter.KEYWORD_ONLY:
+                kwargs.append(f'{parameter.name!r}: {parameter.name}')
+            else:
+                args.append(parameter.name)
+        args_source = f'({", ".join(args)},)' if args else '()'
+        body += (
+            f'__interfaces_before({attr_name!r}, {args_source},'
+            f' {{{", ".join(kwargs)}}})\n'
+        )
+
+    # Async methods stay async so the proxy keeps the fingerprint of the interface
+    flavor = interfaces.spec.function_flavor(member)
+    if offloading and flavor == 'coroutine':
+        call = (
+            f'__interfaces_run({self_name}, __interfaces_partial('
+            f'{self_name}.__interfaces_target__.{attr_name}, {", ".join(call_args)}))'
+        )
+    elif offloading and flavor == 'asyncgenerator':
+        raise TypeError(f"Cannot offload async generator method `{attr_name}`")
+
+    if flavor == 'asyncgenerator':
+        item = '__interfaces_item'
+        if after is not None:
+            item = f'__interfaces_after({attr_name!r}, {item})'
+        body += f'async for __interfaces_item in {call}:\n    yield {item}\n'
+    else:
+        if flavor == 'coroutine':
+            call = f'await {call}'
+        if after is not None:
+            call = f'__interfaces_after({attr_name!r}, {call})'
+        body += f'return {call}\n'
+
+    body = interfaces.contracts._indent(body)
+    source = f'def {attr_name}({", ".join(params)}):\n{body}'
+    if flavor != 'sync':
+        source = f'async {source}'
+    exec(compile(source, f'<interfaces proxy {attr_name}>', 'exec'), namespace)
+
+    method = namespace[attr_name]
+    method.__annotations__ = dict(member.__annotations__)
+    method.__doc__ = member.__doc__
+    method.__qualname__ = f'{cls_name}.{attr_name}'
+    return method
+
+
+def _forwarding_property(
+    attr_name: str, member: typing.Union[property, interfaces.spec.Attribute]
+) -> property:
+    # Attributes are forwarded as properties that can be set, both kinds always
+    # have a fingerprint
+    fingerprint = typing.cast(
+        interfaces.spec.Fingerprint, interfaces.spec.member_fingerprint(member)
+    )
+    settable, deletable = (
+        fingerprint[2:] if fingerprint[0] == 'property' else (True, False)
+    )
+
+    source = f'def fget(self):\n    return self.__interfaces_target__.{attr_name}\n'
+    if settable:
+        source += (
+            'def fset(self, value):\n'
+            f'    self.__interfaces_target__.{attr_name} = value\n'
+        )
+    if deletable:
+        source += f'def fdel(self):\n    del self.__interfaces_target__.{attr_name}\n'
+
+    namespace: typing.Dict[str, typing.Any] = {'__name__': __name__}
+    exec(compile(source, f'<interfaces proxy {attr_name}>', 'exec'), namespace)
+
+    # The proxy property keeps the type of the interface member
+    fget = namespace['fget']
+    if fingerprint[1] is not inspect.Parameter.empty:
+        fget.__annotations__ = {'return': fingerprint[1]}
+
+    doc = member.__doc__ if isinstance(member, property) else None
+    return property(fget, namespace.get('fset'), namespace.get('fdel'), doc)
+
+
+def _resolve_target(self: typing.Any, name: str) -> typing.Any:
+    """Create the target with the factory on first use."""
+    if name != '__interfaces_target__':
+        raise AttributeError(name)
+
+    with self.__interfaces_lock__:
+        try:
+            return object.__getattribute__(self, '__interfaces_target__')
+        except AttributeError:
+            pass
+
+        target = self.__interfaces_factory__()
+        _accepts(type(self), type(target), raise_errors=True)
+        self.__interfaces_target__ = target
+        return target
+
+
+def _run_in_executor(
+    instance: typing.Any, call: typing.Callable[[], typing.Any]
+) -> asyncio.Future:
+    executor = instance.__interfaces_executor__
+    if executor is None:
+        executor = _offload_executor
+    return asyncio.get_running_loop().run_in_executor(executor, call)
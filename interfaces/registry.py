@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import typing
+import weakref
+
+import interfaces.base
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['implementations', 'interfaces_of']
+
+
+_implementations: weakref.WeakKeyDictionary[
+    interfaces.typing.InterfaceType, weakref.WeakSet[type]
+] = weakref.WeakKeyDictionary()
+_interfaces_of: weakref.WeakKeyDictionary[
+    type, weakref.WeakSet[interfaces.typing.InterfaceType]
+] = weakref.WeakKeyDictionary()
+
+
+def implementations(iface: interfaces.typing.InterfaceType) -> typing.FrozenSet[type]:
+    """Return the known classes implementing `iface`.
+
+    A class is known once it has been checked against `iface` or one of its
+    descendant interfaces, either explicitly with `implements` or implicitly by
+    `isimplementation`, `issubclass` or `isinstance`. Entries disappear when the
+    class is garbage collected or stops implementing the interface.
+    """
+    candidates: typing.Set[type] = set()
+    pending = [iface]
+    while pending:
+        current = pending.pop()
+        candidates.update(_implementations.get(current, ()))
+        pending.extend(type.__subclasses__(current))
+
+    return frozenset(
+        cls for cls in candidates if interfaces.util._isimplementation(cls, iface)
+    )
+
+
+def interfaces_of(cls: type) -> typing.FrozenSet[interfaces.typing.InterfaceType]:
+    """Return the known interfaces implemented by `cls` and their ancestors."""
+    try:
+        registered = list(_interfaces_of.get(cls, ()))
+    except TypeError:
+        return frozenset()
+
+    return frozenset(
+        ancestor
+        for iface in registered
+        if interfaces.util._isimplementation(cls, iface)
+        for ancestor in iface.__mro__
+        if isinstance(ancestor, interfaces.base._InterfaceMeta)
+        and ancestor is not interfaces.base.Interface
+    )
+
+
+def _register(
+    cls: type, iface: interfaces.typing.InterfaceType, implemented: bool
+) -> None:
+    try:
+        if implemented:
+            _implementations.setdefault(iface, weakref.WeakSet()).add(cls)
+            _interfaces_of.setdefault(cls, weakref.WeakSet()).add(iface)
+        else:
+            _implementations.get(iface, weakref.WeakSet()).discard(cls)
+            _interfaces_of.get(cls, weakref.WeakSet()).discard(iface)
+    except TypeError:
+        pass
@@ -0,0 +1,216 @@
+"""Interface specs as plain data, to check classes without importing interfaces.
+
+`dump_spec` turns the spec of an interface into a `SerializedSpec` made of strings,
+booleans and tuples only. It follows the layout of `spec.member_fingerprint` with
+parameter kinds as names, annotations formatted by `inspect.formatannotation` and
+defaults as their `repr`. String annotations are formatted as their `repr`, so
+`x: 'int'` and `x: int` differ as they do in live checks. Its JSON form, `SerializedSpec.dumps()`, keeps members
+in spec order and is the same for the same interface, so it can be cached, sent
+to other processes and services, or diffed between releases.
+
+Classes are checked against a serialized spec by comparing the serialized
+fingerprints of their members, which are cached like the fingerprints themselves,
+and members of different kinds implement each other as in live checks. Members of
+variance interfaces are compared exactly, as annotations are no longer types.
+"""
+from __future__ import annotations
+
+import inspect
+import json
+import types
+import typing
+import weakref
+
+import interfaces.spec
+import interfaces.typing
+import interfaces.util
+
+
+__all__ = ['SerializedSpec', 'dump_spec', 'load_spec']
+
+
+# Bump when the serialized format changes
+_FORMAT = 3
+
+
+class SerializedSpec(typing.NamedTuple):
+    # Qualified name of the interface, e.g. 'package.module.Interface'
+    interface: str
+    variance: bool
+    # Attribute names and serialized fingerprints, `None` for unsupported members
+    members: typing.Tuple[typing.Tuple[str, typing.Any], ...]
+
+    def dumps(self, *, indent: typing.Optional[int] = None) -> str:
+        """Return the JSON form, one member per line with `indent` set."""
+        return json.dumps(
+            {
+                'format': _FORMAT,
+                'interface': self.interface,
+                'variance': self.variance,
+                'members': self.members,
+            },
+            indent=indent,
+            separators=None if indent is not None else (',', ':'),
+        )
+
+    def find_unimplemented(self, cls: type) -> typing.Optional[str]:
+        """Return the first member `cls` does not implement or `None`."""
+        mro = interfaces.util._static_mro(cls)
+        for attr_name, fingerprint in self.members:
+            if fingerprint is None:
+                return attr_name
+
+            member = interfaces.util._class_member(cls, mro, attr_name)
+            if member is interfaces.util._MISSING:
+                return attr_name
+
+            serialized = serialize_member(member)
+            if serialized != fingerprint and not _kinds_match(serialized, fingerprint):
+                return attr_name
+        return None
+
+    def implemented_by(self, cls: type) -> bool:
+        return self.find_unimplemented(cls) is None
+
+    def changes(self, other: SerializedSpec) -> typing.List[str]:
+        """Return members added, removed or changed in `other`, old ones first."""
+        members = dict(self.members)
+        other_members = dict(other.members)
+        return [
+            attr_name
+            for attr_name, fingerprint in self.members
+            if other_members.get(attr_name, interfaces.util._MISSING) != fingerprint
+        ] + [attr_name for attr_name in other_members if attr_name not in members]
+
+
+def dump_spec(iface: interfaces.typing.InterfaceType) -> SerializedSpec:
+    iface_spec = interfaces.spec.interface_spec(iface)
+    return SerializedSpec(
+        f'{iface.__module__}.{iface.__qualname__}',
+        iface_spec.variance,
+        tuple(
+            (attr_name, serialize_member(member))
+            for attr_name, member in iface_spec.items()
+        ),
+    )
+
+
+def load_spec(data: typing.Union[str, bytes]) -> SerializedSpec:
+    """Load a spec dumped with `SerializedSpec.dumps`.
+
+    Raises `ValueError` for invalid data or data of another format version.
+    """
+    loaded = json.loads(data)
+    try:
+        if loaded['format'] != _FORMAT:
+            raise ValueError(
+                f"Unsupported spec format {loaded['format']!r}, expected {_FORMAT}"
+            )
+        return SerializedSpec(
+            str(loaded['interface']),
+            bool(loaded['variance']),
+            tuple((str(name), _freeze(value)) for name, value in loaded['members']),
+        )
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"Invalid serialized spec: {error!r}") from None
+
+
+_serialized: weakref.WeakKeyDictionary[
+    typing.Any, typing.Optional[typing.Tuple[typing.Any, ...]]
+] = weakref.WeakKeyDictionary()
+
+
+def serialize_member(
+    member: typing.Any,
+) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+    """Return `spec.member_fingerprint(member)` made of plain data."""
+    kind = interfaces.spec.member_kind(member)
+    if kind == 'function':
+        return _serialize_cached(member, member)
+    if kind in ('classmethod', 'staticmethod'):
+        serialized = (
+            _serialize_cached(member.__func__, member.__func__)
+            if isinstance(member.__func__, types.FunctionType)
+            else None
+        )
+        return None if serialized is None else (kind,) + serialized[1:]
+    if kind == 'datadescriptor':
+        return _serialize_cached(type(member), member)
+
+    fingerprint = interfaces.spec.member_fingerprint(member)
+    if fingerprint is None:
+        return None
+    if kind == 'property':
+        return ('property', _annotation(fingerprint[1])) + fingerprint[2:]
+    return ('attribute', _annotation(fingerprint[1]))
+
+
+def _serialize_cached(
+    key: typing.Any, member: typing.Any
+) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+    """Serialize functions and data descriptors, cached like their fingerprints."""
+    try:
+        return _serialized[key]
+    except KeyError:
+        pass
+
+    fingerprint = interfaces.spec.member_fingerprint(member)
+    serialized: typing.Optional[typing.Tuple[typing.Any, ...]] = None
+    if fingerprint is not None:
+        if fingerprint[0] == 'function':
+            serialized = ('function', _signature(fingerprint[1]), fingerprint[2])
+        else:
+            serialized = ('datadescriptor',) + tuple(
+                None if signature is None else _signature(signature)
+                for signature in fingerprint[1:]
+            )
+
+    _serialized[key] = serialized
+    return serialized
+
+
+def _kinds_match(
+    serialized: typing.Optional[typing.Tuple[typing.Any, ...]],
+    fingerprint: typing.Tuple[typing.Any, ...],
+) -> bool:
+    """Serialized counterpart of `spec.kinds_match`, missing annotations are `None`."""
+    if serialized is None:
+        return False
+    match = interfaces.spec._kind_matches.get((fingerprint[0], serialized[0]))
+    return match is not None and match(serialized, fingerprint, None)
+
+
+def _signature(
+    fingerprint: interfaces.spec.Fingerprint,
+) -> typing.Tuple[typing.Any, ...]:
+    parameters, kwonly_parameters, return_annotation = fingerprint
+    return (
+        tuple(_parameter(parameter) for parameter in parameters),
+        tuple(_parameter(parameter) for parameter in kwonly_parameters),
+        _annotation(return_annotation),
+    )
+
+
+def _parameter(
+    fingerprint: interfaces.spec.Fingerprint,
+) -> typing.Tuple[typing.Any, ...]:
+    name, kind, default, annotation = fingerprint
+    return (
+        name,
+        kind.name,
+        None if default is inspect.Parameter.empty else repr(default),
+        _annotation(annotation),
+    )
+
+
+def _annotation(annotation: typing.Any) -> typing.Optional[str]:
+    if annotation is inspect.Parameter.empty:
+        return None
+    return inspect.formatannotation(annotation)
+
+
+def _freeze(value: typing.Any) -> typing.Any:
+    """Turn the JSON lists of a serialized fingerprint back into tuples."""
+    if isinstance(value, list):
+        return tuple(map(_freeze, value))
+    return value
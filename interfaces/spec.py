@@ -1,52 +1,584 @@
 from __future__ import annotations
 
+import collections
 import collections.abc
-import functools
+import itertools
+import sys
+import threading
+import time
 import types
 import typing
+import weakref
 
 import interfaces.base
+import interfaces.instrumentation
 import interfaces.typing
 
 
-class InterfaceSpec(collections.abc.Mapping):
-    slots = ('_iface', '_iface_spec')
+Fingerprint = typing.Tuple[typing.Any, ...]
 
-    def __init__(self, iface: interfaces.typing.InterfaceType) -> None:
-        self._iface = iface
-        self._iface_spec = {
-            attr_name: getattr(iface, attr_name)
-            for attr_name in self._get_iface_attrs(iface)
-            if not (attr_name[:2] == attr_name[-2:] == '__')
-        }
 
-    def __getitem__(self, key: str) -> types.MethodType:
-        return self._iface_spec[key]
+class _LayeredMapping(collections.abc.Mapping):
+    """Read-only view over disjoint tables, a `ChainMap` without shadowing.
+
+    Iteration follows the tables order; lookups start from the last table.
+    """
+
+    __slots__ = ('_tables', '_len')
+
+    def __init__(self, tables: typing.Tuple[typing.Dict[str, typing.Any], ...]) -> None:
+        self._tables = tables
+        self._len = sum(map(len, tables))
+
+    def __getitem__(self, key: str) -> typing.Any:
+        for table in reversed(self._tables):
+            try:
+                return table[key]
+            except KeyError:
+                pass
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in table for table in self._tables)
 
     def __iter__(self) -> typing.Iterator[str]:
-        return iter(self._iface_spec)
+        return itertools.chain.from_iterable(self._tables)
 
     def __len__(self) -> int:
-        return len(self._iface_spec)
+        return self._len
+
+    def items(self) -> _LayeredItemsView:
+        return _LayeredItemsView(self)
+
+
+class _LayeredItemsView(collections.abc.ItemsView):
+    __slots__ = ()
+
+    _mapping: _LayeredMapping
+
+    def __iter__(self) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+        return itertools.chain.from_iterable(
+            table.items() for table in self._mapping._tables
+        )
+
+
+class InterfaceSpec(_LayeredMapping):
+    """Members of an interface including the ones inherited from its bases.
+
+    A spec only stores the interface's own members and fingerprints and shares
+    the tables of its bases' specs, so an interface hierarchy keeps one table per
+    interface no matter how deep it is. Interfaces cannot overload inherited
+    members, hence the tables are disjoint and a member is found in exactly one.
+
+    Members are classified by kind when the spec is built, annotated names become
+    `Attribute` members. Fingerprints need signatures and are only computed when
+    the spec is first used for a check, so declaring interfaces stays cheap.
+    """
+
+    __slots__ = ('_iface', '_fingerprints', 'variance')
+
+    def __init__(self, iface: interfaces.typing.InterfaceType) -> None:
+        self._iface = weakref.ref(iface)
+        self.variance: bool = iface.__interface_variance__
+
+        # Same order as updating a dict with the bases' specs from the last base
+        base_specs = [
+            interface_spec(base)
+            for base in reversed(iface.__bases__)
+            if isinstance(base, interfaces.base._InterfaceMeta)
+        ]
+
+        members_tables: typing.List[typing.Dict[str, typing.Any]] = []
+        fingerprints_tables: typing.List[
+            typing.Dict[str, typing.Optional[Fingerprint]]
+        ] = []
+        if len(base_specs) == 1:
+            members_tables.extend(base_specs[0]._tables)
+            fingerprints_tables.extend(base_specs[0]._fingerprints._tables)
+        else:
+            shared = set()
+            for base_spec in base_specs:
+                for members, fingerprints in zip(
+                    base_spec._tables, base_spec._fingerprints._tables
+                ):
+                    if id(members) not in shared:
+                        shared.add(id(members))
+                        members_tables.append(members)
+                        fingerprints_tables.append(fingerprints)
+
+        # Members are classified by kind here, signatures are only needed later
+        namespace = vars(iface)
+        annotations = own_annotations(iface)
+        own_members = {}
+        for attr_name in own_attr_names(iface):
+            member = namespace.get(attr_name, _MISSING)
+            if attr_name in annotations and (
+                member is _MISSING or member_kind(member) == 'value'
+            ):
+                member = Attribute(annotations[attr_name])
+            own_members[attr_name] = member
+        if own_members or not members_tables:
+            members_tables.append(own_members)
+            # Filled by `fingerprints()` on the first check
+            fingerprints_tables.append({})
+
+        super().__init__(tuple(members_tables))
+        self._fingerprints: _LayeredMapping = _LayeredMapping(
+            tuple(fingerprints_tables)
+        )
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__!s}({self._iface!r})"
+        return f"{self.__class__.__name__!s}({self._iface()!r})"
+
+    def fingerprints(self) -> typing.Mapping[str, typing.Optional[Fingerprint]]:
+        fingerprints = self._fingerprints
+        if fingerprints._len != self._len:
+            self._fingerprint_members()
+        return fingerprints
+
+    def _fingerprint_members(self) -> None:
+        # A table is shared with the specs of descendant interfaces and is filled
+        # once, before any spec reports it as complete, so readers never see one
+        # being updated
+        with _fingerprints_lock:
+            for members, fingerprints in zip(self._tables, self._fingerprints._tables):
+                if len(fingerprints) != len(members):
+                    fingerprints.update(
+                        {
+                            attr_name: member_fingerprint(member)
+                            for attr_name, member in members.items()
+                        }
+                    )
+            self._fingerprints._len = self._len
+
+
+def own_attr_names(iface: interfaces.typing.InterfaceType) -> typing.List[str]:
+    """Return the names of the members and annotated attributes `iface` declares."""
+    namespace = vars(iface)
+    return [
+        sys.intern(attr_name)
+        for attr_name in itertools.chain(
+            namespace,
+            (name for name in own_annotations(iface) if name not in namespace),
+        )
+        if not (attr_name[:2] == attr_name[-2:] == '__')
+    ]
+
+
+def own_annotations(cls: type) -> typing.Mapping[str, typing.Any]:
+    """Return the annotations of the `cls` body, not including inherited ones."""
+    namespace = type.__dict__['__dict__'].__get__(cls)
+    annotations = namespace.get('__annotations__')
+    if annotations is None and '__annotate__' in namespace:
+        # Evaluated on first access since Python 3.14
+        annotations = getattr(cls, '__annotations__', None)
+    # Metaclasses, e.g. `type`, have a descriptor instead
+    return annotations if isinstance(annotations, dict) else {}
+
+
+class RegistryInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: typing.Optional[int]
+    currsize: int
+
+
+class InterfaceSpecRegistry:
+    """Weakly keyed store of `InterfaceSpec` objects.
+
+    A spec lives as long as its interface does. With `maxsize` set the least
+    recently used specs are evicted and rebuilt on the next request.
+
+    Lookups take no locks. A missing spec is built outside of the lock and
+    published under it unless the registry was modified meanwhile, so a spec of
+    a mutated interface is never stored and concurrent builders agree on one spec.
+    """
+
+    def __init__(self, maxsize: typing.Optional[int] = None) -> None:
+        self._specs: weakref.WeakKeyDictionary[
+            interfaces.typing.InterfaceType, InterfaceSpec
+        ] = weakref.WeakKeyDictionary()
+        self._recent: collections.OrderedDict[
+            weakref.ref, None
+        ] = collections.OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, iface: interfaces.typing.InterfaceType) -> InterfaceSpec:
+        try:
+            iface_spec = self._specs[iface]
+        except KeyError:
+            return self._build(iface)
+
+        self.hits += 1
+        if self._maxsize is not None:
+            with self._lock:
+                try:
+                    self._recent.move_to_end(weakref.ref(iface))
+                except KeyError:
+                    pass
+
+        return iface_spec
+
+    def __contains__(self, iface: object) -> bool:
+        try:
+            return iface in self._specs
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    @property
+    def maxsize(self) -> typing.Optional[int]:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: typing.Optional[int]) -> None:
+        with self._lock:
+            if self._maxsize is None:
+                self._recent = collections.OrderedDict(
+                    (weakref.ref(iface, self._recent_remove), None)
+                    for iface in self._specs.keys()
+                )
+            self._maxsize = maxsize
+            if maxsize is None:
+                self._recent.clear()
+            else:
+                self._evict()
+
+    def registered(self) -> typing.List[interfaces.typing.InterfaceType]:
+        return list(self._specs.keys())
+
+    def discard(self, iface: interfaces.typing.InterfaceType) -> None:
+        with self._lock:
+            self._generation += 1
+            self._specs.pop(iface, None)
+            self._recent.pop(weakref.ref(iface), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._specs.clear()
+            self._recent.clear()
+            self.hits = self.misses = 0
+
+    cache_clear = clear
+
+    def cache_info(self) -> RegistryInfo:
+        return RegistryInfo(self.hits, self.misses, self._maxsize, len(self._specs))
+
+    def _build(self, iface: interfaces.typing.InterfaceType) -> InterfaceSpec:
+        self.misses += 1
+        generation = self._generation
+
+        monitor = interfaces.instrumentation._monitor
+        if monitor is None:
+            iface_spec = iface.__interface_spec__()
+        else:
+            started = time.perf_counter()
+            iface_spec = iface.__interface_spec__()
+            monitor.spec(iface, time.perf_counter() - started)
+
+        with self._lock:
+            if generation != self._generation:
+                return iface_spec
+
+            published = self._specs.get(iface)
+            if published is not None:
+                return published
+
+            self._specs[iface] = iface_spec
+            if self._maxsize is not None:
+                self._recent[weakref.ref(iface, self._recent_remove)] = None
+                self._evict()
+
+        return iface_spec
+
+    def _evict(self) -> None:
+        while self._maxsize is not None and len(self._recent) > self._maxsize:
+            iface_ref, _ = self._recent.popitem(last=False)
+            iface = iface_ref()
+            if iface is not None:
+                self._specs.pop(iface, None)
+
+    def _recent_remove(self, iface_ref: weakref.ref) -> None:
+        self._recent.pop(iface_ref, None)
+
+
+interface_spec: InterfaceSpecRegistry = InterfaceSpecRegistry()
+
+
+_fingerprints_lock = threading.Lock()
+
+_MISSING = object()
+
+_fingerprints: weakref.WeakKeyDictionary[
+    typing.Any, typing.Optional[Fingerprint]
+] = weakref.WeakKeyDictionary()
+
+
+class Attribute(typing.NamedTuple):
+    """An attribute declared with an annotation, e.g. `name: str`.
+
+    Interfaces declare attributes this way; plain class values and slots of
+    implementations are attributes typed by the class annotations, if any.
+    """
+
+    annotation: typing.Any
+
+
+# Types whose instances, including instances of subclasses, have a fixed kind
+_KINDS: typing.Dict[type, str] = {
+    types.FunctionType: 'function',
+    classmethod: 'classmethod',
+    staticmethod: 'staticmethod',
+    property: 'property',
+    Attribute: 'attribute',
+    types.MemberDescriptorType: 'value',
+}
+
+# Member type -> kind, other types are classified on first sight
+_kinds: typing.Dict[type, typing.Optional[str]] = dict(_KINDS)
+
+
+def member_kind(member: typing.Any) -> typing.Optional[str]:
+    """Return the kind of `member` or `None` if it is not supported.
+
+    One of 'function', 'classmethod', 'staticmethod', 'property', 'attribute',
+    'datadescriptor' for other data descriptors or 'value' for plain values and
+    slots, which are turned into attributes. The kind is looked up by type.
+    """
+    member_type = type(member)
+    try:
+        return _kinds[member_type]
+    except KeyError:
+        pass
+
+    kind = _classify(member_type)
+    _kinds[member_type] = kind
+    return kind
+
+
+def _classify(member_type: type) -> typing.Optional[str]:
+    for base in member_type.__mro__[1:]:
+        # E.g. subclasses of `property`
+        if base in _KINDS:
+            return _KINDS[base]
+    if hasattr(member_type, '__set__') or hasattr(member_type, '__delete__'):
+        return 'datadescriptor'
+    if hasattr(member_type, '__get__'):
+        return None
+    return 'value'
+
+
+def member_fingerprint(member: typing.Any) -> typing.Optional[Fingerprint]:
+    """Return a comparable summary of `member` or `None` if it is not supported.
+
+    The first item is the member kind. Functions, class and static methods are
+    fingerprinted by their signature and whether they are plain, coroutine or
+    async generator functions, properties by the return annotation of the getter
+    and whether they can be set and deleted, attributes by their annotation and
+    other data descriptors by the signatures of `__get__`, `__set__` and
+    `__delete__`. Fingerprints of functions and of data descriptor types are
+    cached, the others are assembled from them.
+    """
+    fingerprinter = _fingerprinters.get(member_kind(member))  # type: ignore
+    return None if fingerprinter is None else fingerprinter(member)
+
+
+def kinds_match(
+    fingerprint: typing.Optional[Fingerprint], iface_fingerprint: Fingerprint
+) -> bool:
+    """Return whether a member implements one with a different fingerprint.
+
+    Only some kinds implement others or differ in what they may add, see
+    `_kind_matches`.
+    """
+    if fingerprint is None:
+        return False
+    match = _kind_matches.get((iface_fingerprint[0], fingerprint[0]))
+    if match is None:
+        return False
+
+    import inspect
+
+    return match(fingerprint, iface_fingerprint, inspect.Parameter.empty)
+
+
+def _function_fingerprint(func: types.FunctionType) -> typing.Optional[Fingerprint]:
+    try:
+        return _fingerprints[func]
+    except KeyError:
+        pass
+
+    fingerprint: typing.Optional[Fingerprint]
+    try:
+        fingerprint = ('function', _signature_fingerprint(func), function_flavor(func))
+    except (TypeError, ValueError):
+        fingerprint = None
+
+    _fingerprints[func] = fingerprint
+    return fingerprint
+
+
+def _method_fingerprint(
+    method: typing.Union[classmethod, staticmethod]
+) -> typing.Optional[Fingerprint]:
+    func = method.__func__
+    if not isinstance(func, types.FunctionType):
+        return None
+    fingerprint = _function_fingerprint(func)
+    if fingerprint is None:
+        return None
+    return (member_kind(method),) + fingerprint[1:]
+
+
+def _property_fingerprint(member: property) -> Fingerprint:
+    getter = (
+        _function_fingerprint(member.fget)
+        if isinstance(member.fget, types.FunctionType)
+        else None
+    )
+    if getter is None:
+        import inspect
+
+        return_annotation = inspect.Parameter.empty
+    else:
+        return_annotation = getter[1][2]
+    return (
+        'property',
+        return_annotation,
+        member.fset is not None,
+        member.fdel is not None,
+    )
+
+
+def _attribute_fingerprint(member: Attribute) -> Fingerprint:
+    return ('attribute', member.annotation)
+
+
+def _descriptor_fingerprint(member: typing.Any) -> typing.Optional[Fingerprint]:
+    key = type(member)
+    try:
+        return _fingerprints[key]
+    except KeyError:
+        pass
+
+    fingerprint: typing.Optional[Fingerprint]
+    try:
+        fingerprint = ('datadescriptor',) + tuple(
+            _signature_fingerprint(method) if method is not None else None
+            for method in (
+                getattr(member, '__get__', None),
+                getattr(member, '__set__', None),
+                getattr(member, '__delete__', None),
+            )
+        )
+    except (TypeError, ValueError):
+        fingerprint = None
+
+    _fingerprints[key] = fingerprint
+    return fingerprint
+
+
+_fingerprinters: typing.Dict[
+    str, typing.Callable[[typing.Any], typing.Optional[Fingerprint]]
+] = {
+    'function': _function_fingerprint,
+    'classmethod': _method_fingerprint,
+    'staticmethod': _method_fingerprint,
+    'property': _property_fingerprint,
+    'attribute': _attribute_fingerprint,
+    'datadescriptor': _descriptor_fingerprint,
+}
+
+
+def _untyped_attribute(
+    fingerprint: Fingerprint, iface_fingerprint: Fingerprint, empty: typing.Any
+) -> bool:
+    return fingerprint[1] is empty
+
+
+def _settable_property(
+    fingerprint: Fingerprint, iface_fingerprint: Fingerprint, empty: typing.Any
+) -> bool:
+    return fingerprint[1] == iface_fingerprint[1] and fingerprint[2]
+
+
+def _typed_attribute(
+    fingerprint: Fingerprint, iface_fingerprint: Fingerprint, empty: typing.Any
+) -> bool:
+    return fingerprint[1] == iface_fingerprint[1]
+
+
+def _extended_property(
+    fingerprint: Fingerprint, iface_fingerprint: Fingerprint, empty: typing.Any
+) -> bool:
+    return (
+        fingerprint[1] == iface_fingerprint[1]
+        and fingerprint[2] >= iface_fingerprint[2]
+        and fingerprint[3] >= iface_fingerprint[3]
+    )
+
+
+# (interface kind, class kind) -> whether fingerprints that are not equal match,
+# given the value of missing annotations
+_kind_matches: typing.Dict[
+    typing.Tuple[str, str],
+    typing.Callable[[Fingerprint, Fingerprint, typing.Any], bool],
+] = {
+    # Plain class values and slots without annotations implement any attribute
+    ('attribute', 'attribute'): _untyped_attribute,
+    ('attribute', 'property'): _settable_property,
+    ('property', 'attribute'): _typed_attribute,
+    # A property may be settable or deletable even if the interface's is not
+    ('property', 'property'): _extended_property,
+}
+
+
+def function_flavor(func: typing.Callable) -> str:
+    """Return 'coroutine', 'asyncgenerator' or 'sync' for `func`.
+
+    Like signatures, the flavor of a decorated function is the one of the function
+    in its `__wrapped__` chain, so `functools.wraps` decorators keep it.
+    """
+    import inspect
+
+    func = inspect.unwrap(func)
+    if inspect.isasyncgenfunction(func):
+        return 'asyncgenerator'
+    if inspect.iscoroutinefunction(func):
+        return 'coroutine'
+    return 'sync'
+
 
-    @staticmethod
-    def _get_iface_attrs(
-        iface: interfaces.typing.InterfaceType
-    ) -> collections.abc.Iterable[str]:
-        return dir(iface)
+def _signature_fingerprint(obj: typing.Callable) -> Fingerprint:
+    """Flatten `inspect.signature(obj)` keeping `inspect.Signature` equality rules.
 
+    Keyword-only parameters are compared regardless of their order. `inspect` is
+    imported here, on the first signature comparison, as it is slow to import.
+    """
+    import inspect
 
-class _PartialInterfaceSpec(InterfaceSpec):
-    @staticmethod
-    def _get_iface_attrs(
-        iface: interfaces.typing.InterfaceType
-    ) -> collections.abc.Iterable[str]:
-        return vars(iface).keys()
+    signature = inspect.signature(obj)
+    parameters: typing.List[Fingerprint] = []
+    kwonly_parameters: typing.List[Fingerprint] = []
 
+    for parameter in signature.parameters.values():
+        (
+            kwonly_parameters
+            if parameter.kind is inspect.Parameter.KEYWORD_ONLY
+            else parameters
+        ).append(
+            (parameter.name, parameter.kind, parameter.default, parameter.annotation)
+        )
 
-@functools.lru_cache(maxsize=None)
-def interface_spec(iface: interfaces.typing.InterfaceType) -> InterfaceSpec:
-    return iface.__interface_spec__()
+    return (
+        tuple(parameters),
+        tuple(sorted(kwonly_parameters, key=lambda parameter: parameter[0])),
+        signature.return_annotation,
+    )
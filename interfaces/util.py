@@ -1,15 +1,40 @@
 from __future__ import annotations
 
 import collections.abc
-import inspect
+import os
+import threading
+import time
 import typing
+import weakref
 
+import interfaces.base
+import interfaces.cache
 import interfaces.exceptions
+import interfaces.instrumentation
+import interfaces.registry
 import interfaces.spec
 import interfaces.typing
 
 
-__all__ = ['isimplementation']
+if typing.TYPE_CHECKING:
+    import interfaces.diff
+    import interfaces.diskcache
+    import interfaces.variance
+
+
+__all__ = ['CacheInfo', 'cache_clear', 'cache_info', 'isimplementation', 'verify_all']
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+# Static lookups shared with the verdict caches
+_MISSING = interfaces.cache._MISSING
+_static_mro = interfaces.cache._static_mro
+_lookup_static = interfaces.cache._lookup_static
 
 
 def isimplementation(
@@ -30,48 +55,285 @@ def isimplementation(
     )
 
 
+def cache_info(
+    iface: typing.Optional[interfaces.typing.InterfaceType] = None
+) -> CacheInfo:
+    infos = [
+        iface.__interface_cache__.info()
+        for iface in ([iface] if iface is not None else _all_interfaces())
+    ]
+    return CacheInfo(*map(sum, zip(*infos)))
+
+
+def cache_clear(iface: typing.Optional[interfaces.typing.InterfaceType] = None) -> None:
+    for iface in [iface] if iface is not None else _all_interfaces():
+        iface.__interface_cache__.clear()
+
+
+# Set by `interfaces.diskcache.enable_disk_cache` and `disable_disk_cache`, or from
+# the `INTERFACES_CACHE_DIR` environment variable on the first check otherwise
+_disk_cache: typing.Optional[interfaces.diskcache.DiskCache] = None
+_disk_cache_configured = False
+
+_pending_checks: weakref.WeakKeyDictionary[
+    type, typing.Tuple[interfaces.typing.InterfaceType, ...]
+] = weakref.WeakKeyDictionary()
+
+
+def verify_all() -> None:
+    """Run every conformance check deferred by `Object(lazy=True)`."""
+    for cls in list(_pending_checks.keys()):
+        _verify_pending(cls)
+
+
+def _defer(cls: type, ifaces: typing.Iterable[interfaces.typing.InterfaceType]) -> None:
+    _pending_checks[cls] = _pending_checks.get(cls, ()) + tuple(ifaces)
+
+
+def _verify_pending(cls: type) -> None:
+    ifaces = _pending_checks.pop(cls, ())
+
+    try:
+        for iface in ifaces:
+            _isimplementation(cls, iface, raise_errors=True)
+    except interfaces.exceptions.InterfaceNotImplementedError:
+        _pending_checks[cls] = ifaces
+        raise
+
+
+def _settle_pending(cls: type, iface: interfaces.typing.InterfaceType) -> None:
+    """Drop the deferred check of `cls` against `iface` once it has passed.
+
+    Failed ones stay pending, so they are reported by instantiation and
+    `verify_all` and not by checks against other interfaces.
+    """
+    ifaces = tuple(
+        pending for pending in _pending_checks.get(cls, ()) if pending is not iface
+    )
+    if ifaces:
+        _pending_checks[cls] = ifaces
+    else:
+        _pending_checks.pop(cls, None)
+
+
+def _all_interfaces() -> typing.List[interfaces.typing.InterfaceType]:
+    result: typing.List[interfaces.typing.InterfaceType] = []
+    pending: typing.List[interfaces.typing.InterfaceType] = [interfaces.base.Interface]
+    while pending:
+        current = pending.pop()
+        result.append(current)
+        pending.extend(type.__subclasses__(current))
+    return result
+
+
+# Bumped whenever an interface is mutated, see `interfaces.dispatching`
+_invalidation_token = 0
+
+
+_invalidation_lock = threading.Lock()
+
+
+class _Memo:
+    """Entries derived from interfaces, dropped once any interface is mutated.
+
+    `refresh()` drops the entries if needed and returns the current invalidation
+    token; an entry computed afterwards is stored only if `valid(token)`. An
+    interface mutated meanwhile may have made it stale and another thread may
+    have dropped the entries already, so it would never be dropped otherwise.
+    """
+
+    __slots__ = ('data', '_token')
+
+    def __init__(self, data: typing.MutableMapping[typing.Any, typing.Any]) -> None:
+        self.data = data
+        self._token = _invalidation_token
+
+    def refresh(self) -> int:
+        token = _invalidation_token
+        if self._token != token:
+            self.data.clear()
+            self._token = token
+        return token
+
+    @staticmethod
+    def valid(token: int) -> bool:
+        return token == _invalidation_token
+
+
+def _invalidate(iface: interfaces.typing.InterfaceType) -> None:
+    """Drop everything derived from `iface` and from its descendant interfaces."""
+    global _invalidation_token
+    with _invalidation_lock:
+        _invalidation_token += 1
+
+    pending = [iface]
+    while pending:
+        current = pending.pop()
+        interfaces.spec.interface_spec.discard(current)
+        current.__interface_cache__.clear()
+        pending.extend(type.__subclasses__(current))
+
+
 def _isimplementation(
     cls: type, iface: interfaces.typing.InterfaceType, *, raise_errors: bool = False
 ) -> bool:
 
-    for attr_name, iface_attr in interfaces.spec.interface_spec(iface).items():
+    return _check_verdict(
+        cls, iface, iface.__interface_cache__.get(cls), raise_errors=raise_errors
+    )
+
+
+def _check_verdict(
+    cls: type,
+    iface: interfaces.typing.InterfaceType,
+    failed_attr_name: typing.Union[typing.Optional[str], object],
+    *,
+    raise_errors: bool = False,
+) -> bool:
+    """Finish a check given the verdict cache lookup, `_MISSING` on a miss."""
+    if failed_attr_name is _MISSING:
+        generation = iface.__interface_cache__.generation
+        monitor = interfaces.instrumentation._monitor
+        if monitor is None:
+            failed_attr_name = _compute(cls, iface)
+        else:
+            started = time.perf_counter()
+            failed_attr_name = _compute(cls, iface)
+            monitor.check(iface, cls, time.perf_counter() - started, failed_attr_name)
+
+        _record(cls, iface, failed_attr_name, generation)
+        if failed_attr_name is None and _pending_checks and cls in _pending_checks:
+            _settle_pending(cls, iface)
 
-        if attr_name[:2] == attr_name[-2:] == '__':
-            continue
+    if failed_attr_name is None:
+        return True
 
-        if not hasattr(cls, attr_name):
-            return _isimplementation_fail(cls, attr_name, iface, raise_errors)
+    return _isimplementation_fail(
+        cls, failed_attr_name, iface, raise_errors  # type: ignore
+    )
 
-        cls_attr = inspect.getattr_static(cls, attr_name)
 
-        if (
-            inspect.isdatadescriptor(iface_attr)
-            and inspect.isdatadescriptor(cls_attr)
-            and (
-                inspect.signature(cls_attr.__get__)
-                == inspect.signature(iface_attr.__get__)
-            )
-            and (
-                inspect.signature(cls_attr.__set__)
-                == inspect.signature(iface_attr.__set__)
-            )
+def _compute(cls: type, iface: interfaces.typing.InterfaceType) -> typing.Optional[str]:
+    if not _disk_cache_configured:
+        _configure_disk_cache()
+
+    disk_cache = _disk_cache
+    if disk_cache is not None:
+        failed_attr_name = disk_cache.get(cls, iface)
+        if failed_attr_name is not _MISSING:
+            return failed_attr_name  # type: ignore
+
+    failed_attr_name = _find_unimplemented(cls, interfaces.spec.interface_spec(iface))
+    if disk_cache is not None:
+        disk_cache.set(cls, iface, failed_attr_name)
+
+    return failed_attr_name
+
+
+def _configure_disk_cache() -> None:
+    global _disk_cache_configured
+    _disk_cache_configured = True
+
+    directory = os.environ.get('INTERFACES_CACHE_DIR')
+    if directory:
+        interfaces.diskcache.enable_disk_cache(directory)
+
+
+def _record(
+    cls: type,
+    iface: interfaces.typing.InterfaceType,
+    failed_attr_name: typing.Optional[str],
+    generation: typing.Optional[int] = None,
+) -> None:
+    iface.__interface_cache__.set(
+        cls, interfaces.spec.interface_spec(iface), failed_attr_name, generation
+    )
+    interfaces.registry._register(cls, iface, failed_attr_name is None)
+
+
+def _find_unimplemented(
+    cls: type, iface_spec: interfaces.spec.InterfaceSpec
+) -> typing.Optional[str]:
+
+    mro = _static_mro(cls)
+
+    for attr_name, iface_fingerprint in iface_spec.fingerprints().items():
+
+        if iface_fingerprint is None:
+            return attr_name
+
+        cls_fingerprint = _class_fingerprint(cls, mro, attr_name)
+        if cls_fingerprint != iface_fingerprint and not (
+            cls_fingerprint is not _MISSING
             and (
-                inspect.signature(cls_attr.__delete__)
-                == inspect.signature(iface_attr.__delete__)
+                interfaces.spec.kinds_match(
+                    cls_fingerprint, iface_fingerprint  # type: ignore
+                )
+                or iface_spec.variance
+                and _compatible(cls, mro, attr_name, iface_spec)
             )
         ):
-            continue
+            return attr_name
 
-        if (
-            inspect.isfunction(iface_attr)
-            and inspect.isfunction(cls_attr)
-            and inspect.signature(cls_attr) == inspect.signature(iface_attr)
-        ):
-            continue
+    return None
+
+
+def _compatible(
+    cls: type,
+    mro: typing.Tuple[type, ...],
+    attr_name: str,
+    iface_spec: interfaces.spec.InterfaceSpec,
+) -> bool:
+    """Check a member whose fingerprint differs from the interface in variance mode."""
+    return interfaces.variance.compatible(
+        _class_member(cls, mro, attr_name), iface_spec[attr_name]
+    )
+
+
+def _class_fingerprint(
+    cls: type, mro: typing.Tuple[type, ...], attr_name: str
+) -> typing.Union[typing.Optional[interfaces.spec.Fingerprint], object]:
+    """Return the fingerprint of `cls.attr_name` or `_MISSING` if there is none."""
+    cls_attr = _class_member(cls, mro, attr_name)
+    if cls_attr is _MISSING:
+        return _MISSING
+
+    return interfaces.spec.member_fingerprint(cls_attr)
+
+
+def _class_member(
+    cls: type, mro: typing.Tuple[type, ...], attr_name: str
+) -> typing.Any:
+    if not hasattr(cls, attr_name):
+        # Instance attributes may only be declared with an annotation
+        return _class_attribute(mro, attr_name, _MISSING)
+
+    cls_attr = _lookup_static(mro, attr_name)
+    if cls_attr is _MISSING:
+        # Only reached for attributes provided by the metaclass
+        import inspect
+
+        cls_attr = inspect.getattr_static(cls, attr_name)
+
+    if interfaces.spec.member_kind(cls_attr) == 'value':
+        import inspect
+
+        return _class_attribute(
+            mro, attr_name, interfaces.spec.Attribute(inspect.Parameter.empty)
+        )
+
+    return cls_attr
 
-        return _isimplementation_fail(cls, attr_name, iface, raise_errors)
 
-    return True
+def _class_attribute(
+    mro: typing.Tuple[type, ...], attr_name: str, default: typing.Any
+) -> typing.Any:
+    """Return `attr_name` as annotated in the MRO or else `default`."""
+    for klass in mro:
+        annotations = interfaces.spec.own_annotations(klass)
+        if attr_name in annotations:
+            return interfaces.spec.Attribute(annotations[attr_name])
+    return default
 
 
 def _isimplementation_fail(
@@ -81,8 +343,12 @@ def _isimplementation_fail(
     raise_errors: bool,
 ) -> bool:
     if raise_errors:
+        # Report every unimplemented member at once, failures are the slow path
         raise interfaces.exceptions.InterfaceNotImplementedError(
-            klass=cls, method_name=attr_name, iface=iface
+            klass=cls,
+            method_name=attr_name,
+            iface=iface,
+            explanation=interfaces.diff.explain(cls, iface),
         )
     else:
         return False
@@ -0,0 +1,279 @@
+"""Variance-aware member compatibility used by `Interface(variance=True)`.
+
+An implementation method is compatible with an interface method when both have
+the same parameters (names, kinds and defaults), every parameter of the method
+accepts at least what the interface parameter is annotated with (contravariance)
+and the method returns at most what the interface return is annotated with
+(covariance). Missing annotations and `typing.Any` are compatible with anything.
+
+Generic arguments follow the variance of their parameter: `Callable` parameters
+are contravariant and its return covariant, the arguments of immutable containers
+and other read-only protocols (`Sequence`, `Tuple`, `Mapping` values, ...) are
+covariant and those of mutable containers (`List`, `Dict`, `Set`, ...) are
+invariant. Other generic classes use the variance of their type variables.
+
+Annotations are resolved with `typing.get_type_hints` once per function, so
+string and forward-reference annotations compare as the objects they refer to.
+Subtype relations are memoized until any interface is mutated.
+"""
+from __future__ import annotations
+
+import collections.abc
+import inspect
+import itertools
+import types
+import typing
+import weakref
+
+import interfaces.spec
+import interfaces.util
+
+
+__all__ = ['compatible', 'issubtype']
+
+
+_EMPTY = inspect.Parameter.empty
+
+_NONE_TYPES = (None, type(None))
+
+# `int | str` unions are available since Python 3.10
+_UnionType = getattr(types, 'UnionType', None)
+
+_COVARIANT = 1
+_CONTRAVARIANT = -1
+_INVARIANT = 0
+
+# Variance of the arguments of standard generics, the last one applies to any
+# further argument, e.g. of `Tuple[int, str]`
+_variances: typing.Dict[typing.Any, typing.Tuple[int, ...]] = {
+    tuple: (_COVARIANT,),
+    frozenset: (_COVARIANT,),
+    type: (_COVARIANT,),
+    collections.abc.Awaitable: (_COVARIANT,),
+    collections.abc.AsyncIterable: (_COVARIANT,),
+    collections.abc.AsyncIterator: (_COVARIANT,),
+    collections.abc.Container: (_COVARIANT,),
+    collections.abc.Collection: (_COVARIANT,),
+    collections.abc.Iterable: (_COVARIANT,),
+    collections.abc.Iterator: (_COVARIANT,),
+    collections.abc.Reversible: (_COVARIANT,),
+    collections.abc.Sequence: (_COVARIANT,),
+    collections.abc.Set: (_COVARIANT,),
+    collections.abc.KeysView: (_COVARIANT,),
+    collections.abc.ValuesView: (_COVARIANT,),
+    collections.abc.ItemsView: (_COVARIANT, _COVARIANT),
+    collections.abc.Mapping: (_INVARIANT, _COVARIANT),
+    collections.abc.Generator: (_COVARIANT, _CONTRAVARIANT, _COVARIANT),
+    collections.abc.Coroutine: (_COVARIANT, _CONTRAVARIANT, _COVARIANT),
+    collections.abc.AsyncGenerator: (_COVARIANT, _CONTRAVARIANT),
+}
+
+_signatures: weakref.WeakKeyDictionary[
+    types.FunctionType, typing.Optional[interfaces.spec.Fingerprint]
+] = weakref.WeakKeyDictionary()
+
+_subtypes: typing.Dict[typing.Tuple[typing.Any, typing.Any], bool] = {}
+_subtypes_memo = interfaces.util._Memo(_subtypes)
+
+
+def compatible(member: typing.Any, iface_member: typing.Any) -> bool:
+    """Return whether `member` can stand in for the interface's `iface_member`."""
+    kind = interfaces.spec.member_kind(member)
+    if kind != interfaces.spec.member_kind(iface_member):
+        return False
+    if kind in ('classmethod', 'staticmethod'):
+        member, iface_member = member.__func__, iface_member.__func__
+    if not (inspect.isfunction(member) and inspect.isfunction(iface_member)):
+        return False
+    # A blocking method never stands in for a coroutine one and vice versa
+    if interfaces.spec.function_flavor(member) != interfaces.spec.function_flavor(
+        iface_member
+    ):
+        return False
+
+    signature = resolved_signature(member)
+    iface_signature = resolved_signature(iface_member)
+    if signature is None or iface_signature is None:
+        return False
+
+    parameters, kwonly_parameters, return_annotation = signature
+    iface_parameters, iface_kwonly_parameters, iface_return_annotation = iface_signature
+
+    return (
+        _compatible_parameters(parameters, iface_parameters)
+        and _compatible_parameters(kwonly_parameters, iface_kwonly_parameters)
+        and issubtype(return_annotation, iface_return_annotation)
+    )
+
+
+def resolved_signature(
+    func: types.FunctionType
+) -> typing.Optional[interfaces.spec.Fingerprint]:
+    """Return the signature fingerprint of `func` with resolved annotations.
+
+    Annotations that cannot be resolved are kept as they are and only compare
+    equal to the same annotation.
+    """
+    try:
+        return _signatures[func]
+    except KeyError:
+        pass
+
+    fingerprint = interfaces.spec.member_fingerprint(func)
+    if fingerprint is None:
+        _signatures[func] = None
+        return None
+
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:
+        hints = {}
+
+    parameters, kwonly_parameters, return_annotation = fingerprint[1]
+    signature = (
+        tuple(
+            (name, kind, default, hints.get(name, annotation))
+            for name, kind, default, annotation in parameters
+        ),
+        tuple(
+            (name, kind, default, hints.get(name, annotation))
+            for name, kind, default, annotation in kwonly_parameters
+        ),
+        hints.get('return', return_annotation),
+    )
+    _signatures[func] = signature
+    return signature
+
+
+def issubtype(sub: typing.Any, sup: typing.Any) -> bool:
+    """Return whether a value annotated with `sub` is acceptable as `sup`."""
+    if sub is sup:
+        return True
+
+    token = _subtypes_memo.refresh()
+    try:
+        return _subtypes[sub, sup]
+    except KeyError:
+        result = _issubtype(sub, sup)
+        if _subtypes_memo.valid(token):
+            _subtypes[sub, sup] = result
+    except TypeError:
+        # Unhashable annotations, e.g. the argument list of `typing.Callable`
+        result = _issubtype(sub, sup)
+
+    return result
+
+
+def _issubtype(sub: typing.Any, sup: typing.Any) -> bool:
+    if _is_any(sub) or _is_any(sup) or sup is object or sub == sup:
+        return True
+
+    if sub in _NONE_TYPES or sup in _NONE_TYPES:
+        sub = type(None) if sub in _NONE_TYPES else sub
+        sup = type(None) if sup in _NONE_TYPES else sup
+        if sub is sup:
+            return True
+
+    sub_origin = _origin(sub)
+    sup_origin = _origin(sup)
+
+    if sub_origin is typing.Union:
+        return all(issubtype(arg, sup) for arg in sub.__args__)
+    if sup_origin is typing.Union:
+        return any(issubtype(sub, arg) for arg in sup.__args__)
+
+    if sup_origin is not None:
+        sub_args = getattr(sub, '__args__', ())
+        sup_args = getattr(sup, '__args__', ())
+        if sub_origin is None or not _issubclass(sub_origin, sup_origin):
+            return False
+        if sup_origin is collections.abc.Callable:
+            return _callable_issubtype(sub_args, sup_args)
+        return len(sub_args) == len(sup_args) and all(
+            map(
+                _argument_issubtype, _argument_variances(sup_origin), sub_args, sup_args
+            )
+        )
+
+    if sub_origin is not None:
+        return _issubclass(sub_origin, sup)
+
+    return _issubclass(sub, sup)
+
+
+def _callable_issubtype(
+    sub_args: typing.Tuple[typing.Any, ...], sup_args: typing.Tuple[typing.Any, ...]
+) -> bool:
+    # The arguments are the parameters followed by the return annotation, the
+    # parameters are a single `...` when they are not specified
+    if not (sub_args and sup_args):
+        return True
+    sub_parameters, sup_parameters = sub_args[:-1], sup_args[:-1]
+    if Ellipsis not in sub_parameters + sup_parameters and not (
+        len(sub_parameters) == len(sup_parameters)
+        and all(map(issubtype, sup_parameters, sub_parameters))
+    ):
+        return False
+    return issubtype(sub_args[-1], sup_args[-1])
+
+
+def _argument_variances(origin: typing.Any) -> typing.Iterator[int]:
+    variances = _variances.get(origin)
+    if variances is None:
+        # Generic classes declare the variance of their type variables
+        variances = tuple(
+            _COVARIANT
+            if getattr(parameter, '__covariant__', False)
+            else _CONTRAVARIANT
+            if getattr(parameter, '__contravariant__', False)
+            else _INVARIANT
+            for parameter in getattr(origin, '__parameters__', ())
+        ) or (_INVARIANT,)
+    return itertools.chain(variances, itertools.repeat(variances[-1]))
+
+
+def _argument_issubtype(variance: int, sub: typing.Any, sup: typing.Any) -> bool:
+    if variance == _COVARIANT:
+        return issubtype(sub, sup)
+    if variance == _CONTRAVARIANT:
+        return issubtype(sup, sub)
+    return issubtype(sub, sup) and issubtype(sup, sub)
+
+
+def _origin(annotation: typing.Any) -> typing.Any:
+    if _UnionType is not None and isinstance(annotation, _UnionType):
+        return typing.Union
+    return getattr(annotation, '__origin__', None)
+
+
+def _is_any(annotation: typing.Any) -> bool:
+    return annotation is _EMPTY or annotation is typing.Any
+
+
+def _issubclass(sub: typing.Any, sup: typing.Any) -> bool:
+    if not (isinstance(sub, type) and isinstance(sup, type)):
+        return False
+
+    try:
+        return issubclass(sub, sup)
+    except TypeError:
+        return False
+
+
+def _compatible_parameters(
+    parameters: typing.Tuple[interfaces.spec.Fingerprint, ...],
+    iface_parameters: typing.Tuple[interfaces.spec.Fingerprint, ...],
+) -> bool:
+    if len(parameters) != len(iface_parameters):
+        return False
+
+    for (
+        (name, kind, default, annotation),
+        (iface_name, iface_kind, iface_default, iface_annotation),
+    ) in zip(parameters, iface_parameters):
+        if (name, kind, default) != (iface_name, iface_kind, iface_default):
+            return False
+        if not issubtype(iface_annotation, annotation):
+            return False
+
+    return True
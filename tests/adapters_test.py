@@ -0,0 +1,132 @@
+import pytest
+
+import interfaces
+
+
+class Reader(interfaces.interface):
+    def read(self) -> str:
+        pass
+
+
+class Sized(interfaces.interface):
+    def size(self) -> int:
+        pass
+
+
+class Text:
+    def __init__(self, text):
+        self.text = text
+
+
+class TextReader:
+    def __init__(self, text):
+        self.text = text
+
+    def read(self) -> str:
+        return self.text.text
+
+
+def test_010_adapt_registered_class():
+    class Source(Text):
+        pass
+
+    interfaces.register_adapter(Source, Reader, TextReader)
+
+    adapted = interfaces.adapt(Source('data'), Reader)
+    assert isinstance(adapted, TextReader)
+    assert adapted.read() == 'data'
+
+
+def test_020_adapt_returns_implementations_as_is():
+    reader = TextReader(Text('data'))
+
+    assert interfaces.adapt(reader, Reader) is reader
+
+
+def test_030_adapt_without_adapter():
+    class Source:
+        pass
+
+    with pytest.raises(interfaces.InterfaceAdaptationError):
+        interfaces.adapt(Source(), Reader)
+
+    assert interfaces.adapt(Source(), Reader, None) is None
+
+
+def test_040_adapt_walks_mro_and_interfaces():
+    class Base:
+        pass
+
+    class Derived(Base):
+        pass
+
+    class Measured:
+        def size(self) -> int:
+            return 4
+
+    class MeasuredDerived(Derived):
+        def size(self) -> int:
+            return 8
+
+    @interfaces.register_adapter(Base, Reader)
+    def base_reader(obj: Base) -> TextReader:
+        return TextReader(Text('base'))
+
+    @interfaces.register_adapter(Sized, Reader)
+    def sized_reader(obj: Sized) -> TextReader:
+        return TextReader(Text(str(obj.size())))
+
+    assert interfaces.adapt(Derived(), Reader).read() == 'base'
+    assert interfaces.adapt(Measured(), Reader).read() == '4'
+    # Classes in the MRO win over implemented interfaces
+    assert interfaces.adapt(MeasuredDerived(), Reader).read() == 'base'
+
+
+def test_050_adapt_caches_resolution():
+    class Source:
+        pass
+
+    interfaces.register_adapter(Source, Reader, TextReader)
+    interfaces.adapt(Source(), Reader)
+
+    assert interfaces.adapters._resolved[Source][Reader][0] is TextReader
+
+    class OtherReader(TextReader):
+        pass
+
+    interfaces.register_adapter(Source, Reader, OtherReader)
+    assert isinstance(interfaces.adapt(Source(), Reader), OtherReader)
+
+
+def test_060_register_adapter_validates_factory():
+    class Source:
+        pass
+
+    class BadReader:
+        def __init__(self, obj):
+            pass
+
+    def bad_factory(obj) -> BadReader:
+        return BadReader(obj)
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.register_adapter(Source, Reader, BadReader)
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.register_adapter(Source, Reader, bad_factory)
+    with pytest.raises(TypeError):
+        interfaces.register_adapter(Source, Source, TextReader)
+    with pytest.raises(TypeError):
+        interfaces.register_adapter(Source(), Reader, TextReader)
+
+
+def test_070_unannotated_factory_results_are_checked():
+    class Source:
+        pass
+
+    class BadReader:
+        pass
+
+    interfaces.register_adapter(Source, Reader, lambda obj: BadReader())
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.adapt(Source(), Reader)
@@ -0,0 +1,83 @@
+import interfaces
+
+
+class SampleInterfaceA(interfaces.interface):
+    def method_a(self, arg: int) -> int:
+        pass
+
+
+class SampleInterfaceB(interfaces.interface):
+    def method_b(self, arg: int) -> int:
+        pass
+
+    @property
+    def value(self):
+        pass
+
+
+class SampleClassA:
+    def method_a(self, arg: int) -> int:
+        pass
+
+
+class SampleClassB:
+    def method_a(self, arg: str) -> int:
+        pass
+
+    def method_b(self, arg: int) -> int:
+        pass
+
+    @property
+    def value(self):
+        pass
+
+
+def test_010_verify_matrix():
+    matrix = interfaces.verify_matrix(
+        [SampleClassA, SampleClassB], [SampleInterfaceA, SampleInterfaceB]
+    )
+
+    assert len(matrix) == 4
+    assert matrix[SampleClassA, SampleInterfaceA].ok
+    assert matrix[SampleClassA, SampleInterfaceB] == (
+        SampleClassA,
+        SampleInterfaceB,
+        'method_b',
+        'missing',
+    )
+    assert matrix[SampleClassB, SampleInterfaceA].reason == 'mismatch'
+    assert matrix[SampleClassB, SampleInterfaceB].ok
+
+
+def test_020_verify_matrix_populates_cache():
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    class TestClass:
+        def method(self):
+            pass
+
+    interfaces.verify_matrix([TestClass], [TestInterface])
+    assert issubclass(TestClass, TestInterface)
+    assert interfaces.cache_info(TestInterface) == (1, 0, 1)
+
+
+def test_030_verify_matrix_unsupported_member():
+    class TestInterface(interfaces.interface):
+        value = 42
+
+    class TestClass:
+        value = 42
+
+    matrix = interfaces.verify_matrix([TestClass], [TestInterface])
+    assert matrix[TestClass, TestInterface].reason == 'unsupported'
+
+
+def test_040_verify_matrix_process_pool():
+    classes = [SampleClassA, SampleClassB] * 3
+    ifaces = [SampleInterfaceA, SampleInterfaceB]
+
+    assert interfaces.verify_matrix(
+        classes, ifaces, processes=2, chunksize=2
+    ) == interfaces.verify_matrix(classes, ifaces)
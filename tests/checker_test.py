@@ -0,0 +1,443 @@
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+import interfaces
+import interfaces.__main__
+import interfaces.checker
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def write(files):
+        for name, source in files.items():
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(textwrap.dedent(source))
+        return tmp_path
+
+    yield write
+
+    for name in list(sys.modules):
+        if name.split('.')[0] in ('checkpkg', 'checkmod'):
+            del sys.modules[name]
+
+
+PACKAGE = {
+    'checkpkg/__init__.py': """
+        from .ifaces import Reader as Reader
+    """,
+    'checkpkg/ifaces.py': """
+        import typing
+
+        import interfaces
+
+
+        class Reader(interfaces.interface):
+            def read(self, size: int = -1) -> bytes:
+                pass
+
+            @property
+            def closed(self) -> bool:
+                pass
+
+
+        class Seekable(Reader):
+            def seek(self, offset: int, *, whence: int = 0) -> int:
+                pass
+    """,
+    'checkpkg/impls.py': """
+        import interfaces
+        from checkpkg import Reader
+        from checkpkg.ifaces import Seekable
+
+
+        class Base:
+            def read(self, size: int = -1) -> bytes:
+                pass
+
+            @property
+            def closed(self) -> bool:
+                pass
+
+
+        class Good(Base, interfaces.object, implements=[Reader]):
+            pass
+
+
+        class GoodSeekable(Base, interfaces.object, implements=Seekable):
+            def seek(self, offset: int, *, whence: int = 0) -> int:
+                pass
+
+
+        class Missing(interfaces.object, implements=[Reader]):
+            def read(self, size: int = -1) -> bytes:
+                pass
+    """,
+}
+
+
+def test_010_check_reports_missing_members(project):
+    root = project(PACKAGE)
+
+    diagnostics = interfaces.checker.check([str(root)], processes=1, cache=False)
+
+    assert [(d.cls, d.iface, d.attr_name, d.reason) for d in diagnostics] == [
+        ('checkpkg.impls.Missing', 'checkpkg.ifaces.Reader', 'closed', 'missing')
+    ]
+    assert str(diagnostics[0]).startswith(f"{root / 'checkpkg' / 'impls.py'}:25:")
+
+
+def test_020_check_reports_mismatches_and_unknowns(project):
+    root = project(
+        {
+            'checkmod.py': """
+                import functools
+
+                import interfaces
+                from external import Mixin
+
+
+                class TestInterface(interfaces.interface):
+                    def method(self, arg: int) -> int:
+                        pass
+
+
+                class Mismatch(interfaces.object, implements=[TestInterface]):
+                    def method(self, arg: str) -> int:
+                        pass
+
+
+                class Stringly(interfaces.object, implements=[TestInterface]):
+                    def method(self, arg: 'int') -> int:
+                        pass
+
+
+                class Decorated(interfaces.object, implements=[TestInterface]):
+                    @functools.lru_cache()
+                    def method(self, arg: int) -> int:
+                        pass
+
+
+                class External(Mixin, interfaces.object, implements=[TestInterface]):
+                    pass
+
+
+                class NotInterface(interfaces.object, implements=[Mismatch]):
+                    pass
+
+
+                class Overloading(TestInterface):
+                    def method(self, arg: int) -> int:
+                        pass
+            """
+        }
+    )
+
+    diagnostics = interfaces.checker.check([str(root)], processes=1, cache=False)
+
+    assert [(d.cls, d.attr_name, d.reason) for d in diagnostics] == [
+        ('checkmod.Mismatch', 'method', 'mismatch'),
+        ('checkmod.Stringly', 'method', 'mismatch'),
+        ('checkmod.Decorated', 'method', 'unknown'),
+        ('checkmod.External', 'method', 'unknown'),
+        ('checkmod.NotInterface', None, 'invalid'),
+        ('checkmod.Overloading', 'method', 'overloading'),
+    ]
+    assert [d.error for d in diagnostics] == [True, True, False, False, True, True]
+
+
+def test_030_check_matches_runtime(project):
+    root = project(PACKAGE)
+    importlib.import_module('checkpkg.ifaces')
+    source = (root / 'checkpkg' / 'impls.py').read_text()
+    runtime_source = source.replace(', implements=[Reader]', '').replace(
+        ', implements=Seekable', ''
+    )
+    (root / 'checkpkg' / 'impls.py').write_text(runtime_source)
+    impls = importlib.import_module('checkpkg.impls')
+    ifaces = sys.modules['checkpkg.ifaces']
+    (root / 'checkpkg' / 'impls.py').write_text(source)
+
+    static = {
+        (d.cls.rpartition('.')[2], d.iface.rpartition('.')[2]): d.attr_name
+        for d in interfaces.checker.check([str(root)], processes=1, cache=False)
+    }
+    for cls_name, iface_name in (
+        ('Good', 'Reader'),
+        ('GoodSeekable', 'Seekable'),
+        ('Missing', 'Reader'),
+    ):
+        cls, iface = getattr(impls, cls_name), getattr(ifaces, iface_name)
+        expected = interfaces.util._find_unimplemented(
+            cls, interfaces.interface_spec(iface)
+        )
+        assert static.get((cls_name, iface_name)) == expected
+
+
+def test_040_check_uses_file_cache(project, monkeypatch):
+    root = project(PACKAGE)
+    interfaces.checker.check([str(root)], processes=1)
+    assert (root / 'checkpkg' / '__pycache__' / 'interfaces').is_dir()
+
+    monkeypatch.setattr(interfaces.checker, 'summarize', None)
+    assert len(interfaces.checker.check([str(root)], processes=1)) == 1
+
+    (root / 'checkpkg' / 'impls.py').write_text('')
+    monkeypatch.undo()
+    assert interfaces.checker.check([str(root)], processes=1) == []
+
+
+def test_050_check_process_pool(project):
+    root = project(PACKAGE)
+
+    diagnostics = interfaces.checker.check([str(root)], processes=2, cache=False)
+
+    assert [d.cls for d in diagnostics] == ['checkpkg.impls.Missing']
+
+
+def test_060_command_line(project, capsys):
+    root = project(PACKAGE)
+
+    assert interfaces.__main__.main(['check', '--no-cache', str(root)]) == 1
+    assert 'checkpkg.impls.Missing' in capsys.readouterr().out
+
+    (root / 'checkpkg' / 'impls.py').write_text('')
+    assert interfaces.__main__.main(['check', '-j', '1', str(root)]) == 0
+
+
+def test_070_check_async_methods(project):
+    root = project(
+        {
+            'checkmod.py': """
+                import interfaces
+
+
+                class Fetcher(interfaces.interface):
+                    async def fetch(self, key: str) -> bytes:
+                        pass
+
+                    async def stream(self):
+                        def inner():
+                            yield
+                        yield b''
+
+
+                class Good(interfaces.object, implements=[Fetcher]):
+                    async def fetch(self, key: str) -> bytes:
+                        pass
+
+                    async def stream(self):
+                        yield b''
+
+
+                class Blocking(interfaces.object, implements=[Fetcher]):
+                    def fetch(self, key: str) -> bytes:
+                        pass
+
+                    async def stream(self):
+                        yield b''
+
+
+                class NotGenerator(interfaces.object, implements=[Fetcher]):
+                    async def fetch(self, key: str) -> bytes:
+                        pass
+
+                    async def stream(self):
+                        return [lambda: (yield)]
+            """
+        }
+    )
+    source = (root / 'checkmod.py').read_text()
+    (root / 'checkmod.py').write_text(source.replace(', implements=[Fetcher]', ''))
+    module = importlib.import_module('checkmod')
+    (root / 'checkmod.py').write_text(source)
+
+    static = {
+        d.cls.rpartition('.')[2]: (d.attr_name, d.reason)
+        for d in interfaces.checker.check([str(root)], processes=1, cache=False)
+    }
+
+    assert static == {
+        'Blocking': ('fetch', 'mismatch'),
+        'NotGenerator': ('stream', 'mismatch'),
+    }
+    for cls_name in ('Good', 'Blocking', 'NotGenerator'):
+        expected = interfaces.util._find_unimplemented(
+            getattr(module, cls_name), interfaces.interface_spec(module.Fetcher)
+        )
+        assert static.get(cls_name, (None,))[0] == expected
+
+
+def test_080_check_member_kinds(project):
+    root = project(
+        {
+            'checkmod.py': """
+                import interfaces
+
+
+                class Shape(interfaces.interface):
+                    name: str
+
+                    @property
+                    def area(self) -> float:
+                        pass
+
+                    @classmethod
+                    def unit(cls) -> 'Shape':
+                        pass
+
+                    @staticmethod
+                    def sides() -> int:
+                        pass
+
+
+                class Square(interfaces.object, implements=[Shape]):
+                    __slots__ = ('name',)
+                    name: str
+                    area: float = 1.0
+
+                    def _unit(cls) -> 'Shape':
+                        pass
+
+                    unit = classmethod(_unit)
+
+                    @staticmethod
+                    def sides() -> int:
+                        pass
+
+
+                class Circle(interfaces.object, implements=[Shape]):
+                    name = 'circle'
+
+                    def _area(self) -> float:
+                        pass
+
+                    def _set_area(self, value: float) -> None:
+                        pass
+
+                    area = property(_area, _set_area)
+
+                    @classmethod
+                    def unit(cls) -> 'Shape':
+                        pass
+
+                    def sides() -> int:
+                        pass
+
+
+                class Typed(interfaces.object, implements=[Shape]):
+                    name: bytes
+
+                    @property
+                    def area(self) -> float:
+                        pass
+
+                    @area.setter
+                    def area(self, value: float) -> None:
+                        pass
+
+                    @classmethod
+                    def unit(cls) -> 'Shape':
+                        pass
+
+                    @staticmethod
+                    def sides() -> int:
+                        pass
+            """
+        }
+    )
+    source = (root / 'checkmod.py').read_text()
+    (root / 'checkmod.py').write_text(source.replace(', implements=[Shape]', ''))
+    module = importlib.import_module('checkmod')
+    (root / 'checkmod.py').write_text(source)
+
+    static = {
+        d.cls.rpartition('.')[2]: (d.attr_name, d.reason)
+        for d in interfaces.checker.check([str(root)], processes=1, cache=False)
+    }
+
+    assert static == {'Circle': ('sides', 'mismatch'), 'Typed': ('name', 'mismatch')}
+    for cls_name in ('Square', 'Circle', 'Typed'):
+        expected = interfaces.util._find_unimplemented(
+            getattr(module, cls_name), interfaces.interface_spec(module.Shape)
+        )
+        assert static.get(cls_name, (None,))[0] == expected
+
+
+def test_090_check_string_annotations(project):
+    root = project(
+        {
+            'checkmod.py': """
+                from __future__ import annotations
+
+                import interfaces
+
+
+                class TestInterface(interfaces.interface):
+                    def method(self, arg: int) -> None:
+                        pass
+            """,
+            'checkpkg/__init__.py': """
+                import interfaces
+                from checkmod import TestInterface
+
+
+                class Quoted(interfaces.object, implements=[TestInterface]):
+                    def method(self, arg: 'int') -> 'None':
+                        pass
+
+
+                class Mismatch(interfaces.object, implements=[TestInterface]):
+                    def method(self, arg: 'str') -> 'None':
+                        pass
+            """,
+        }
+    )
+
+    diagnostics = interfaces.checker.check([str(root)], processes=1, cache=False)
+
+    assert [(d.cls, d.attr_name, d.reason) for d in diagnostics] == [
+        ('checkpkg.Mismatch', 'method', 'mismatch')
+    ]
+
+
+def test_100_check_property_calls(project):
+    root = project(
+        {
+            'checkmod.py': """
+                import interfaces
+
+
+                class TestInterface(interfaces.interface):
+                    name: str
+
+
+                class ReadOnly(interfaces.object, implements=[TestInterface]):
+                    def _name(self) -> str:
+                        pass
+
+                    name = property(_name, None, doc=None)
+
+
+                class Settable(interfaces.object, implements=[TestInterface]):
+                    def _name(self) -> str:
+                        pass
+
+                    def _set_name(self, value: str) -> None:
+                        pass
+
+                    name = property(_name, _set_name, None)
+            """
+        }
+    )
+
+    diagnostics = interfaces.checker.check([str(root)], processes=1, cache=False)
+
+    assert [(d.cls, d.attr_name, d.reason) for d in diagnostics] == [
+        ('checkmod.ReadOnly', 'name', 'mismatch')
+    ]
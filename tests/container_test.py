@@ -0,0 +1,222 @@
+import asyncio
+import threading
+
+import pytest
+
+import interfaces
+
+
+class Clock(interfaces.interface):
+    def now(self) -> float:
+        pass
+
+
+class Store(interfaces.interface):
+    def get(self, key: str) -> int:
+        pass
+
+
+class Service(interfaces.interface):
+    def run(self) -> None:
+        pass
+
+
+class FixedClock:
+    def now(self) -> float:
+        return 0.0
+
+
+class MemoryStore:
+    def __init__(self, clock: Clock, size: int = 10):
+        self.clock = clock
+        self.size = size
+
+    def get(self, key: str) -> int:
+        return 0
+
+
+class Worker:
+    def __init__(self, store: Store, clock: Clock):
+        self.store = store
+        self.clock = clock
+
+    def run(self) -> None:
+        pass
+
+
+def test_010_resolve_injects_dependencies():
+    container = interfaces.Container()
+    container.bind(Clock, FixedClock)
+    container.bind(Store, MemoryStore)
+    container.bind(Service, Worker)
+
+    service = container.resolve(Service)
+
+    assert isinstance(service, Worker)
+    assert isinstance(service.store, MemoryStore)
+    assert service.store.size == 10
+    # Request scoped objects are shared inside one resolution only
+    assert service.clock is service.store.clock
+    assert container.resolve(Service).clock is not service.clock
+    assert Service in container
+    assert Service not in interfaces.Container()
+
+
+def test_020_bindings_are_validated_once():
+    class Broken:
+        def now(self) -> int:
+            pass
+
+    container = interfaces.Container()
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        container.bind(Clock, Broken)
+
+    def typed_factory() -> Broken:
+        return Broken()
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        container.bind(Clock, typed_factory)
+
+    # Results of factories without a return class are checked on creation
+    container.bind(Clock, lambda: Broken())
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        container.resolve(Clock)
+
+    with pytest.raises(TypeError):
+        container.bind(FixedClock, FixedClock)
+    with pytest.raises(ValueError):
+        container.bind(Clock, FixedClock, scope='session')
+
+
+def test_030_singleton_and_instance_bindings():
+    container = interfaces.Container()
+    clock = FixedClock()
+    container.bind_instance(Clock, clock)
+    container.bind(Store, MemoryStore, scope='singleton')
+    container.bind(Service, Worker)
+
+    first = container.resolve(Service)
+    second = container.resolve(Service)
+
+    assert first is not second
+    assert first.store is second.store
+    assert first.clock is clock
+
+    container.bind(Store, MemoryStore, scope='singleton')
+    assert container.resolve(Store) is not first.store
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        container.bind_instance(Clock, object())
+
+
+def test_040_thread_scope():
+    container = interfaces.Container()
+    container.bind(Clock, FixedClock, scope='thread')
+
+    clocks = [container.resolve(Clock), container.resolve(Clock)]
+    thread = threading.Thread(target=lambda: clocks.append(container.resolve(Clock)))
+    thread.start()
+    thread.join()
+
+    assert clocks[0] is clocks[1]
+    assert clocks[2] is not clocks[0]
+
+
+def test_050_task_scope():
+    container = interfaces.Container()
+    container.bind(Clock, FixedClock, scope='task')
+
+    async def resolve_twice():
+        return container.resolve(Clock), container.resolve(Clock)
+
+    async def main():
+        return await asyncio.gather(resolve_twice(), resolve_twice())
+
+    (first, same), (other, _) = asyncio.run(main())
+
+    assert first is same
+    assert other is not first
+    with pytest.raises(interfaces.InterfaceResolutionError):
+        container.resolve(Clock)
+
+
+def test_060_resolution_errors():
+    container = interfaces.Container()
+    container.bind(Service, Worker)
+
+    with pytest.raises(interfaces.InterfaceResolutionError, match='not bound'):
+        container.resolve(Service)
+    with pytest.raises(LookupError):
+        container.resolve(Clock)
+
+    class Cyclic:
+        def __init__(self, store: Store):
+            pass
+
+        def now(self) -> float:
+            pass
+
+    container.bind(Clock, Cyclic)
+    container.bind(Store, MemoryStore)
+    with pytest.raises(interfaces.InterfaceResolutionError, match='circular'):
+        container.resolve(Service)
+
+    class Unknown:
+        def __init__(self, name: str):
+            pass
+
+        def now(self) -> float:
+            pass
+
+    container.bind(Clock, Unknown)
+    with pytest.raises(interfaces.InterfaceResolutionError, match='`name`'):
+        container.resolve(Clock)
+
+
+def test_070_longer_scopes_cannot_depend_on_shorter_ones():
+    container = interfaces.Container()
+    container.bind(Clock, FixedClock, scope='thread')
+    container.bind(Store, MemoryStore, scope='singleton')
+
+    with pytest.raises(interfaces.InterfaceResolutionError, match='singleton'):
+        container.resolve(Store)
+
+    container.bind(Clock, FixedClock, scope='singleton')
+    assert container.resolve(Store).clock is container.resolve(Clock)
+
+
+def test_080_optional_dependencies():
+    class Cached:
+        def __init__(self, clock: Clock = None):
+            self.clock = clock
+
+        def get(self, key: str) -> int:
+            pass
+
+    container = interfaces.Container()
+    container.bind(Store, Cached)
+    assert container.resolve(Store).clock is None
+
+    container.bind(Clock, FixedClock)
+    assert isinstance(container.resolve(Store).clock, FixedClock)
+
+
+def test_090_plans_follow_interface_changes():
+    class Named(interfaces.interface):
+        def name(self) -> str:
+            pass
+
+    class Impl:
+        def name(self) -> str:
+            pass
+
+    container = interfaces.Container()
+    container.bind(Named, lambda: Impl())
+    container.resolve(Named)
+
+    def title(self) -> str:
+        pass
+
+    Named.title = title
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        container.resolve(Named)
@@ -0,0 +1,167 @@
+import asyncio
+import typing
+
+import pytest
+
+import interfaces
+
+
+class Storage(interfaces.interface):
+    def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+        pass
+
+    def get(self, key: str, *, default: int = 0) -> int:
+        pass
+
+
+class Clock(interfaces.interface):
+    def now(self) -> 'Timestamp':
+        pass
+
+
+class Timestamp:
+    pass
+
+
+def test_010_enforce_accepts_valid_calls():
+    class Memory(interfaces.object, implements=[Storage], enforce=True):
+        def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+            return True
+
+        def get(self, key: str, *, default: int = 0) -> int:
+            return default
+
+    memory = Memory()
+    assert memory.put('a') is True
+    assert memory.put('a', 1) is True
+    assert memory.get('a', default=2) == 2
+
+
+def test_020_enforce_rejects_arguments():
+    class Memory(interfaces.object, implements=[Storage], enforce=True):
+        def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+            return True
+
+        def get(self, key: str, *, default: int = 0) -> int:
+            return default
+
+    with pytest.raises(interfaces.InterfaceContractError) as exc_info:
+        Memory().put(1)
+    assert 'argument `key`' in str(exc_info.value)
+
+    with pytest.raises(TypeError):
+        Memory().put('a', 'b')
+
+
+def test_030_enforce_rejects_return_value():
+    class Memory(interfaces.object, implements=[Storage], enforce=True):
+        def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+            return None
+
+        def get(self, key: str, *, default: int = 0) -> int:
+            return default
+
+    with pytest.raises(interfaces.InterfaceContractError) as exc_info:
+        Memory().put('a')
+    assert 'return value' in str(exc_info.value)
+
+
+def test_040_enforce_resolves_forward_references():
+    class SystemClock(interfaces.object, implements=[Clock], enforce=True):
+        def now(self) -> 'Timestamp':
+            return self.value
+
+    clock = SystemClock()
+    clock.value = Timestamp()
+    assert isinstance(clock.now(), Timestamp)
+
+    clock.value = 0
+    with pytest.raises(interfaces.InterfaceContractError):
+        clock.now()
+
+
+def test_050_enforce_sampling():
+    class Memory(interfaces.object, implements=[Storage], enforce=3):
+        def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+            return True
+
+        def get(self, key: str, *, default: int = 0) -> int:
+            return default
+
+    memory = Memory()
+    failures = 0
+    for _ in range(9):
+        try:
+            memory.put(1)
+        except interfaces.InterfaceContractError:
+            failures += 1
+
+    assert failures == 3
+
+
+def test_060_enforce_keeps_conformance():
+    class Memory(interfaces.object, implements=[Storage], enforce=True):
+        def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+            return True
+
+        def get(self, key: str, *, default: int = 0) -> int:
+            return default
+
+    assert Memory.put.__name__ == 'put'
+    assert Memory.put.__wrapped__ is not Memory.put
+    assert issubclass(Memory, Storage)
+    assert isinstance(Memory(), Storage)
+
+
+def test_070_enforce_off_does_not_wrap():
+    class Memory(interfaces.object, implements=[Storage]):
+        def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+            return True
+
+        def get(self, key: str, *, default: int = 0) -> int:
+            return default
+
+    assert not hasattr(Memory.put, '__wrapped__')
+    assert Memory().put(1) is True
+
+
+def test_080_enforce_varargs():
+    class Formatter(interfaces.interface):
+        def format(self, template: str, *args: int, sep: str = ' ', **kw) -> str:
+            pass
+
+    class Simple(interfaces.object, implements=[Formatter], enforce=True):
+        def format(self, template: str, *args: int, sep: str = ' ', **kw) -> str:
+            return sep.join([template] + [str(arg) for arg in args])
+
+    assert Simple().format('a', 1, 2, sep='-') == 'a-1-2'
+    with pytest.raises(interfaces.InterfaceContractError):
+        Simple().format('a', sep=1)
+
+
+def test_090_enforce_invalid_sampling():
+    with pytest.raises(ValueError):
+
+        class Memory(interfaces.object, implements=[Storage], enforce=0):
+            def put(self, key: str, value: typing.Optional[int] = None) -> bool:
+                return True
+
+            def get(self, key: str, *, default: int = 0) -> int:
+                return default
+
+
+def test_100_enforce_coroutine_methods():
+    class AsyncStorage(interfaces.interface):
+        async def get(self, key: str) -> int:
+            pass
+
+    class Memory(interfaces.object, implements=[AsyncStorage], enforce=True):
+        async def get(self, key: str) -> int:
+            return 1 if key == 'a' else 'missing'
+
+    assert interfaces.isimplementation(Memory, AsyncStorage)
+    assert asyncio.run(Memory().get('a')) == 1
+    with pytest.raises(interfaces.InterfaceContractError):
+        asyncio.run(Memory().get('b'))
+    with pytest.raises(interfaces.InterfaceContractError):
+        asyncio.run(Memory().get(1))
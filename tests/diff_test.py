@@ -0,0 +1,218 @@
+import pytest
+
+import interfaces
+
+
+class Store(interfaces.interface):
+    def get(self, key: str, *, default: int = 0) -> int:
+        pass
+
+    def put(self, key: str, value: int) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def size(self) -> int:
+        pass
+
+
+class MemoryStore:
+    def get(self, key: str, *, default: int = 0) -> int:
+        pass
+
+    def put(self, key: str, value: int) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def size(self) -> int:
+        pass
+
+
+def test_010_explain_implementation():
+    explanation = interfaces.explain(MemoryStore, Store)
+
+    assert explanation.ok
+    assert explanation.members == ()
+    assert explanation.cls is MemoryStore
+    assert explanation.iface is Store
+
+
+def test_020_explain_collects_every_member():
+    class Broken:
+        def get(self, key: bytes, *, fallback: int = 0) -> int:
+            pass
+
+        def put(self, key: str, value: int = 0, extra=None):
+            pass
+
+        size = 0
+
+    explanation = interfaces.explain(Broken, Store)
+
+    assert not explanation.ok
+    members = {member.attr_name: member for member in explanation.members}
+    assert [member.attr_name for member in explanation.members] == [
+        'get',
+        'put',
+        'close',
+        'size',
+    ]
+    assert {name: member.reason for name, member in members.items()} == {
+        'get': 'mismatch',
+        'put': 'mismatch',
+        'close': 'missing',
+        'size': 'mismatch',
+    }
+    assert members['get'].details == (
+        "parameter `key` is annotated `bytes` instead of `str`",
+        "missing keyword-only parameter `default`",
+        "unexpected keyword-only parameter `fallback`",
+    )
+    assert members['put'].details == (
+        "parameter `value` has default `0` instead of no default",
+        "unexpected parameter `extra`",
+        "returns nothing instead of `None`",
+    )
+    assert members['close'].actual is None
+    assert members['size'].details == (
+        'attribute is annotated nothing instead of `int`',
+    )
+
+
+def test_030_explain_kinds():
+    class Other(interfaces.interface):
+        def method(self, arg):
+            pass
+
+        @property
+        def value(self):
+            pass
+
+    class Impl:
+        def method(self, *arg):
+            pass
+
+        def value(self):
+            pass
+
+    members = interfaces.explain(Impl, Other).members
+
+    assert members[0].details == (
+        "parameter `arg` is var positional instead of positional or keyword",
+    )
+    assert members[1].details == ('expected a property, got a method',)
+
+
+def test_040_explain_reuses_and_fills_verdict_cache():
+    class Partial:
+        def get(self, key: str, *, default: int = 0) -> int:
+            pass
+
+        def put(self, key: str, value: int) -> None:
+            pass
+
+    interfaces.cache_clear(Store)
+    members = interfaces.explain(Partial, Store).members
+    assert [member.attr_name for member in members] == ['close', 'size']
+    assert interfaces.cache_info(Store).currsize == 1
+
+    misses = interfaces.cache_info(Store).misses
+    assert not interfaces.isimplementation(Partial, Store)
+    assert interfaces.cache_info(Store).misses == misses
+
+    assert interfaces.explain(MemoryStore, Store).ok
+    assert interfaces.isimplementation(MemoryStore, Store)
+
+
+def test_050_not_implemented_error_lists_every_member():
+    with pytest.raises(interfaces.InterfaceNotImplementedError) as excinfo:
+
+        class Broken(interfaces.object, implements=[Store]):
+            def get(self, key: str) -> int:
+                pass
+
+    explanation = excinfo.value.explanation
+    assert [member.attr_name for member in explanation.members] == [
+        'get',
+        'put',
+        'close',
+        'size',
+    ]
+    message = str(excinfo.value)
+    assert 'get: missing keyword-only parameter `default`' in message
+    assert 'close: missing' in message
+
+
+def test_060_explain_variance():
+    class Covariant(interfaces.interface, variance=True):
+        def make(self) -> int:
+            pass
+
+    class Impl:
+        def make(self) -> bool:
+            pass
+
+    class Wrong:
+        def make(self) -> str:
+            pass
+
+    assert interfaces.explain(Impl, Covariant).ok
+    assert interfaces.explain(Wrong, Covariant).members[0].details == (
+        "returns `str` instead of `int`",
+    )
+
+
+def test_070_explain_async_methods():
+    class Async(interfaces.interface):
+        async def fetch(self, key: str) -> int:
+            pass
+
+    class Blocking:
+        def fetch(self, key: str) -> int:
+            pass
+
+    assert interfaces.explain(Blocking, Async).members[0].details == (
+        'expected a coroutine method, got a regular method',
+    )
+
+
+def test_080_explain_members_matching_by_kind():
+    class Shape(interfaces.interface):
+        name: str
+        label: str
+
+        @property
+        def area(self) -> float:
+            pass
+
+    class Square:
+        name = 'square'
+        label: str
+
+        @property
+        def area(self) -> float:
+            pass
+
+        @area.setter
+        def area(self, value: float) -> None:
+            pass
+
+    class Settable(Square):
+        @property
+        def label(self) -> str:
+            pass
+
+        @label.setter
+        def label(self, value: str) -> None:
+            pass
+
+    # Explaining first records the verdict used by later checks
+    for cls in (Square, Settable):
+        assert interfaces.explain(cls, Shape).ok
+        assert interfaces.isimplementation(cls, Shape)
+        assert issubclass(cls, Shape)
@@ -0,0 +1,224 @@
+import importlib
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+
+import interfaces
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    yield interfaces.enable_disk_cache(str(tmp_path))
+    interfaces.disable_disk_cache()
+
+
+def test_010_verdict_is_persisted(disk_cache, tmp_path, monkeypatch):
+    class TestInterface(interfaces.interface):
+        def method(self, arg: int) -> int:
+            pass
+
+    class TestClassA:
+        def method(self, arg: int) -> int:
+            pass
+
+    class TestClassB:
+        pass
+
+    assert interfaces.isimplementation(TestClassA, TestInterface)
+    assert not interfaces.isimplementation(TestClassB, TestInterface)
+    assert len(list(tmp_path.glob('*.json'))) == 2
+
+    # A fresh process only has the entries on disk
+    interfaces.cache_clear()
+    interfaces.enable_disk_cache(str(tmp_path))
+    monkeypatch.setattr(interfaces.util, '_find_unimplemented', None)
+
+    assert interfaces.isimplementation(TestClassA, TestInterface)
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.util._isimplementation(TestClassB, TestInterface, raise_errors=True)
+
+
+def test_020_monkeypatched_member_is_not_served_from_disk(disk_cache, tmp_path):
+    class TestInterface(interfaces.interface):
+        def method(self, arg: int) -> int:
+            pass
+
+    class TestClass:
+        def method(self, arg: int) -> int:
+            pass
+
+    def method(self, arg: str) -> int:
+        pass
+
+    assert interfaces.isimplementation(TestClass, TestInterface)
+
+    TestClass.method = method
+    interfaces.cache_clear()
+    assert not interfaces.isimplementation(TestClass, TestInterface)
+    assert len(list(tmp_path.glob('*.json'))) == 2
+
+
+def test_030_edited_module_is_not_served_from_disk(disk_cache, tmp_path):
+    source = '''
+        import interfaces
+
+        class SampleInterface(interfaces.interface):
+            def method(self, arg: int) -> int:
+                pass
+
+        class SampleClass:
+            def method(self, arg: {arg_type}) -> int:
+                pass
+    '''
+    module_path = tmp_path / 'diskcache_sample.py'
+    sys.path.insert(0, str(tmp_path))
+
+    try:
+        module_path.write_text(textwrap.dedent(source.format(arg_type='int')))
+        module = importlib.import_module('diskcache_sample')
+        assert interfaces.isimplementation(module.SampleClass, module.SampleInterface)
+
+        module_path.write_text(textwrap.dedent(source.format(arg_type='str')))
+        module = importlib.reload(module)
+        assert not interfaces.isimplementation(
+            module.SampleClass, module.SampleInterface
+        )
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop('diskcache_sample', None)
+
+
+def test_040_dynamic_members_are_not_cached(disk_cache, tmp_path):
+    namespace = {}
+    exec('def method(self): pass', namespace)
+
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    TestClass = type('TestClass', (), {'method': namespace['method']})
+
+    assert interfaces.isimplementation(TestClass, TestInterface)
+    assert not list(tmp_path.glob('*.json'))
+
+
+def test_050_concurrent_writers(disk_cache, tmp_path):
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    class TestClass:
+        def method(self):
+            pass
+
+    def write():
+        for _ in range(50):
+            disk_cache.set(TestClass, TestInterface, None)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [path.suffix for path in tmp_path.iterdir()] == ['.json']
+    assert disk_cache.get(TestClass, TestInterface) is None
+
+
+def test_060_directory_from_environment(tmp_path):
+    source = '''
+        import interfaces
+
+        class SampleInterface(interfaces.interface):
+            def method(self, arg: int) -> int:
+                pass
+
+        class SampleClass:
+            def method(self, arg: int) -> int:
+                pass
+
+        assert interfaces.isimplementation(SampleClass, SampleInterface)
+    '''
+    module_path = tmp_path / 'diskcache_sample.py'
+    module_path.write_text(textwrap.dedent(source))
+    cache_path = tmp_path / 'cache'
+
+    # Nothing imports `interfaces.diskcache` in the checking process
+    subprocess.run(
+        [sys.executable, str(module_path)],
+        env=dict(
+            os.environ,
+            INTERFACES_CACHE_DIR=str(cache_path),
+            PYTHONPATH=str(pathlib.Path(__file__).parents[1]),
+        ),
+        check=True,
+    )
+
+    assert len(list(cache_path.glob('*.json'))) == 1
+
+
+def make_class(arg_type):
+    class TestClass:
+        def method(self, arg: arg_type) -> int:
+            pass
+
+    return TestClass
+
+
+def test_070_factory_classes_do_not_share_verdicts(disk_cache, tmp_path):
+    class TestInterface(interfaces.interface):
+        def method(self, arg: int) -> int:
+            pass
+
+    assert interfaces.isimplementation(make_class(int), TestInterface)
+
+    interfaces.cache_clear()
+    interfaces.enable_disk_cache(str(tmp_path))
+
+    assert not interfaces.isimplementation(make_class(str), TestInterface)
+    assert len(list(tmp_path.glob('*.json'))) == 2
+
+
+def test_080_factory_classes_do_not_share_verdicts_between_processes(tmp_path):
+    source = '''
+        import sys
+
+        import interfaces
+
+        class SampleInterface(interfaces.interface):
+            def method(self, arg: int) -> int:
+                pass
+
+        def make_class(arg_type):
+            class SampleClass:
+                def method(self, arg: arg_type) -> int:
+                    pass
+
+            return SampleClass
+
+        arg_type = {'int': int, 'str': str}[sys.argv[1]]
+        assert interfaces.isimplementation(
+            make_class(arg_type), SampleInterface
+        ) is (arg_type is int)
+    '''
+    module_path = tmp_path / 'diskcache_sample.py'
+    module_path.write_text(textwrap.dedent(source))
+    cache_path = tmp_path / 'cache'
+
+    for arg_type in ('int', 'str'):
+        subprocess.run(
+            [sys.executable, str(module_path), arg_type],
+            env=dict(
+                os.environ,
+                INTERFACES_CACHE_DIR=str(cache_path),
+                PYTHONPATH=str(pathlib.Path(__file__).parents[1]),
+            ),
+            check=True,
+        )
+
+    assert len(list(cache_path.glob('*.json'))) == 2
@@ -0,0 +1,96 @@
+import pytest
+
+import interfaces
+
+
+class SampleInterfaceA(interfaces.interface):
+    def method_a(self):
+        pass
+
+
+class SampleInterfaceB(SampleInterfaceA):
+    def method_b(self):
+        pass
+
+
+class SampleInterfaceC(interfaces.interface):
+    def method_c(self):
+        pass
+
+
+class SampleClassA:
+    def method_a(self):
+        pass
+
+
+class SampleClassB(SampleClassA):
+    def method_b(self):
+        pass
+
+
+@pytest.fixture
+def handle():
+    @interfaces.dispatch
+    def handle(obj):
+        return 'default'
+
+    @handle.register(SampleInterfaceA)
+    def _(obj):
+        return 'a'
+
+    @handle.register
+    def _(obj: SampleInterfaceB):
+        return 'b'
+
+    return handle
+
+
+def test_010_dispatch(handle):
+    assert handle(42) == 'default'
+    assert handle(SampleClassA()) == 'a'
+    assert handle(SampleClassB()) == 'b'
+
+
+def test_020_dispatch_class_takes_precedence(handle):
+    handle.register(SampleClassA, lambda obj: 'class')
+
+    assert handle(SampleClassA()) == 'class'
+    assert handle(SampleClassB()) == 'class'
+
+
+def test_030_dispatch_cache(handle):
+    assert handle.dispatch(SampleClassA) is handle.registry[SampleInterfaceA]
+    assert handle.dispatch(SampleClassA) is handle.dispatch(SampleClassA)
+
+    handle.register(SampleClassA, lambda obj: 'class')
+    assert handle(SampleClassA()) == 'class'
+
+
+def test_040_dispatch_interface_mutation(handle):
+    class TestInterface(interfaces.interface):
+        pass
+
+    class TestClass:
+        pass
+
+    handle.register(TestInterface, lambda obj: 'test')
+    assert handle(TestClass()) == 'test'
+
+    TestInterface.method = lambda self: None
+    assert handle(TestClass()) == 'default'
+
+
+def test_050_dispatch_ambiguous(handle):
+    class TestClass(SampleClassA):
+        def method_c(self):
+            pass
+
+    handle.register(SampleInterfaceC, lambda obj: 'c')
+
+    with pytest.raises(RuntimeError):
+        handle(TestClass())
+
+
+def test_060_dispatch_requires_argument(handle):
+    with pytest.raises(TypeError):
+        handle()
@@ -0,0 +1,50 @@
+import pytest
+
+import interfaces
+
+
+@pytest.fixture
+def events():
+    events = []
+    yield interfaces.enable_instrumentation(events.append, slowest=1), events
+    interfaces.disable_instrumentation()
+
+
+def test_010_instrumentation_is_disabled_by_default():
+    assert interfaces.instrumentation._monitor is None
+
+
+def test_020_check_events(events):
+    monitor, events = events
+
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    class TestClassA:
+        def method(self):
+            pass
+
+    class TestClassB:
+        pass
+
+    assert issubclass(TestClassA, TestInterface)
+    assert issubclass(TestClassA, TestInterface)
+    assert not issubclass(TestClassB, TestInterface)
+
+    assert [(event.kind, event.cls, event.attr_name) for event in events] == [
+        ('spec', None, None),
+        ('check', TestClassA, None),
+        ('check', TestClassB, 'method'),
+    ]
+
+    stats = monitor.stats(TestInterface)
+    assert stats.checks == 2
+    assert stats.specs == 1
+    assert stats.check_time > 0
+    assert len(stats.slowest()) == 1
+
+    [(iface, stats, cache_info)] = [
+        row for row in monitor.report() if row[0] is TestInterface
+    ]
+    assert cache_info == (1, 2, 2)
@@ -1,3 +1,7 @@
+import pathlib
+import subprocess
+import sys
+
 import pytest
 
 import interfaces
@@ -226,3 +230,142 @@ def test_180_error_mixing_bases_interface_object():
 
         class TestClassB(TestInterface, TestClassA):
             pass
+
+
+def test_190_lazy_implementation_is_not_checked_on_definition():
+    class TestInterface(interfaces.interface):
+        def method(self, arg):
+            pass
+
+    class TestClass(interfaces.object, implements=[TestInterface], lazy=True):
+        pass
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.verify_all()
+
+    TestClass.method = TestInterface.method
+    interfaces.verify_all()
+
+
+def test_200_lazy_implementation_is_checked_on_instantiation():
+    class TestInterface(interfaces.interface):
+        def method(self, arg):
+            pass
+
+    class TestClassA(interfaces.object, implements=[TestInterface], lazy=True):
+        def method(self, arg):
+            pass
+
+    class TestClassB(interfaces.object, implements=[TestInterface], lazy=True):
+        def __init__(self, value):
+            self.value = value
+
+    assert isinstance(TestClassA(), TestClassA)
+    assert '__new__' not in vars(TestClassA)
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        TestClassB(42)
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        TestClassB(42)
+
+    TestClassB.method = TestInterface.method
+    assert TestClassB(42).value == 42
+
+
+def test_210_lazy_implementation_is_settled_by_isimplementation():
+    class TestInterfaceA(interfaces.interface):
+        def method_a(self):
+            pass
+
+    class TestInterfaceB(interfaces.interface):
+        def method_b(self):
+            pass
+
+    class TestClass(
+        interfaces.object, implements=[TestInterfaceA, TestInterfaceB], lazy=True
+    ):
+        def method_b(self):
+            pass
+
+    # Only the queried interface is settled and predicates do not raise
+    assert interfaces.isimplementation(TestClass, TestInterfaceB)
+    assert not interfaces.isimplementation(TestClass, TestInterfaceA)
+    assert not issubclass(TestClass, TestInterfaceA)
+    assert isinstance(object.__new__(TestClass), TestInterfaceB)
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.verify_all()
+
+    TestClass.method_a = TestInterfaceA.method_a
+    assert interfaces.isimplementation(TestClass, TestInterfaceA)
+    assert TestClass not in interfaces.util._pending_checks
+
+
+def test_220_public_names_are_loaded_lazily():
+    for name in dir(interfaces):
+        assert getattr(interfaces, name) is not None
+
+    assert interfaces.Interface is interfaces.base.Interface
+    assert interfaces.object is interfaces.compat.Object
+    assert interfaces.explain is interfaces.diff.explain
+    with pytest.raises(AttributeError):
+        interfaces.missing
+
+
+def test_230_declaring_interfaces_does_not_import_inspect():
+    source = """
+import interfaces
+
+class TestInterfaceA(interfaces.interface):
+    def method_a(self, arg: int) -> int:
+        pass
+
+class TestInterfaceB(TestInterfaceA):
+    def method_b(self) -> None:
+        pass
+"""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', source],
+        cwd=pathlib.Path(__file__).parents[1],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+    imported = {
+        line.split('|')[-1].strip()
+        for line in stderr.splitlines()
+        if line.startswith('import time:')
+    }
+
+    assert 'interfaces.base' in imported
+    assert not imported & {
+        'inspect',
+        'concurrent.futures',
+        'hashlib',
+        'interfaces.batch',
+        'interfaces.contracts',
+        'interfaces.diskcache',
+        'interfaces.variance',
+    }
+
+
+@pytest.mark.parametrize(
+    'source',
+    [
+        'import interfaces; interfaces.isimplementation',
+        'import interfaces; interfaces.cache_clear',
+        'import interfaces; interfaces.explain',
+        'import interfaces; interfaces.InterfaceNotImplementedError',
+        'import interfaces.util',
+        'import interfaces.instrumentation',
+        'import interfaces.spec',
+        'import interfaces.registry',
+    ],
+)
+def test_240_any_public_name_or_submodule_can_be_loaded_first(source):
+    subprocess.run(
+        [sys.executable, '-c', source],
+        cwd=pathlib.Path(__file__).parents[1],
+        check=True,
+    )
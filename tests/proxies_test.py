@@ -0,0 +1,295 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+import interfaces
+
+
+class Store(interfaces.interface):
+    def get(self, key: str, *keys: str, default: int = 0, **options) -> int:
+        """Return the value of `key`."""
+
+    def put(self, key: str, value: int = 1) -> None:
+        pass
+
+    @property
+    def size(self) -> int:
+        pass
+
+
+class MemoryStore:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key: str, *keys: str, default: int = 0, **options) -> int:
+        return self.data.get(key, default)
+
+    def put(self, key: str, value: int = 1) -> None:
+        self.data[key] = value
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+def test_010_proxy_forwards_to_target():
+    store = MemoryStore()
+    proxy = interfaces.proxy(Store, store)
+
+    proxy.put('a', 2)
+    proxy.put(key='b')
+
+    assert store.data == {'a': 2, 'b': 1}
+    assert proxy.get('a') == 2
+    assert proxy.get('missing', default=5) == 5
+    assert proxy.size == 2
+
+
+def test_020_proxy_implements_interface():
+    proxy = interfaces.proxy(Store, MemoryStore())
+
+    assert isinstance(proxy, Store)
+    assert interfaces.isimplementation(type(proxy), Store)
+    assert not hasattr(proxy, '__dict__')
+    assert type(proxy).get.__doc__ == Store.get.__doc__
+    assert interfaces.explain(type(proxy), Store).ok
+
+
+def test_030_proxy_classes_are_cached_per_hooks():
+    def before(method_name, args, kwargs):
+        pass
+
+    first = interfaces.proxy(Store, MemoryStore())
+    second = interfaces.proxy(Store, MemoryStore())
+    hooked = interfaces.proxy(Store, MemoryStore(), before=before)
+
+    assert type(first) is type(second)
+    assert type(hooked) is not type(first)
+    assert type(interfaces.proxy(Store, MemoryStore(), before=before)) is type(hooked)
+
+
+def test_040_proxy_hooks():
+    calls = []
+
+    def before(method_name, args, kwargs):
+        calls.append((method_name, args, kwargs))
+
+    def after(method_name, result):
+        return -result if method_name == 'get' else result
+
+    proxy = interfaces.proxy(Store, MemoryStore(), before=before, after=after)
+    proxy.put('a', 2)
+
+    assert proxy.get('a', 'b', 'c', default=1, strict=True) == -2
+    assert calls == [
+        ('put', ('a', 2), {}),
+        ('get', ('a', 'b', 'c'), {'default': 1, 'strict': True}),
+    ]
+
+
+def test_050_proxy_factory_is_called_once_on_first_use():
+    created = []
+
+    def factory():
+        created.append(MemoryStore())
+        return created[-1]
+
+    proxy = interfaces.proxy(Store, factory)
+    assert created == []
+
+    proxy.put('a')
+    assert proxy.get('a') == 1
+    assert len(created) == 1
+
+    class Wrong:
+        pass
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.proxy(Store, Wrong).put('a')
+
+
+def test_060_proxy_errors():
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.proxy(Store, 42)
+
+    class Static(interfaces.interface):
+        @staticmethod
+        def method():
+            pass
+
+    with pytest.raises(TypeError):
+        interfaces.proxy(Static, lambda: None)
+
+
+def test_070_proxy_follows_interface_changes():
+    class Counter(interfaces.interface):
+        def count(self) -> int:
+            pass
+
+    class Impl:
+        def count(self) -> int:
+            return 1
+
+        def reset(self) -> None:
+            pass
+
+    proxy_cls = type(interfaces.proxy(Counter, Impl()))
+
+    def reset(self) -> None:
+        pass
+
+    Counter.reset = reset
+    proxy = interfaces.proxy(Counter, Impl())
+
+    assert type(proxy) is not proxy_cls
+    proxy.reset()
+    assert isinstance(proxy, Counter)
+
+
+class AsyncStore(interfaces.interface):
+    async def get(self, key: str, *, default: int = 0) -> int:
+        pass
+
+    async def keys(self):
+        yield ''
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncMemoryStore:
+    async def get(self, key: str, *, default: int = 0) -> int:
+        return default
+
+    async def keys(self):
+        yield 'a'
+        yield 'b'
+
+    def close(self) -> None:
+        pass
+
+
+class BlockingStore:
+    def __init__(self):
+        self.threads = []
+
+    def get(self, key: str, *, default: int = 0) -> int:
+        self.threads.append(threading.current_thread())
+        return default
+
+    def close(self) -> None:
+        self.threads.append(threading.current_thread())
+
+
+def test_080_proxy_async_methods():
+    items = []
+
+    def after(method_name, result):
+        items.append(result)
+        return result
+
+    proxy = interfaces.proxy(AsyncStore, AsyncMemoryStore(), after=after)
+
+    async def use():
+        return await proxy.get('a', default=3), [key async for key in proxy.keys()]
+
+    assert isinstance(proxy, AsyncStore)
+    assert asyncio.run(use()) == (3, ['a', 'b'])
+    assert items == [3, 'a', 'b']
+
+
+class AsyncGetter(interfaces.interface):
+    async def get(self, key: str, *, default: int = 0) -> int:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_090_offload_runs_blocking_methods_in_executor():
+    store = BlockingStore()
+    executor = concurrent.futures.ThreadPoolExecutor(1, 'offload_test')
+    offloaded = interfaces.offload(AsyncGetter, store, executor)
+
+    assert isinstance(offloaded, AsyncGetter)
+    assert asyncio.run(offloaded.get('a', default=2)) == 2
+    offloaded.close()
+
+    assert store.threads[0].name.startswith('offload_test')
+    assert store.threads[1] is threading.current_thread()
+
+    interfaces.set_offload_executor(executor)
+    try:
+        assert asyncio.run(interfaces.offload(AsyncGetter, BlockingStore).get('b')) == 0
+    finally:
+        interfaces.set_offload_executor(None)
+    executor.shutdown()
+
+
+def test_100_offload_errors():
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.offload(AsyncGetter, 42)
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+        interfaces.offload(AsyncGetter, AsyncMemoryStore).close()
+
+    with pytest.raises(TypeError):
+        interfaces.offload(AsyncStore, BlockingStore)
+
+
+def test_110_proxy_forwards_attributes_and_settable_properties():
+    class Config(interfaces.interface):
+        name: str
+
+        @property
+        def level(self) -> int:
+            pass
+
+        @level.setter
+        def level(self, value: int) -> None:
+            pass
+
+    class Impl:
+        name: str
+
+        def __init__(self):
+            self.name = 'impl'
+            self._level = 0
+
+        @property
+        def level(self) -> int:
+            return self._level
+
+        @level.setter
+        def level(self, value: int) -> None:
+            self._level = value
+
+    impl = Impl()
+    proxy = interfaces.proxy(Config, impl)
+
+    assert proxy.name == 'impl'
+    proxy.name = 'renamed'
+    proxy.level = 3
+    assert (impl.name, impl.level) == ('renamed', 3)
+    assert isinstance(proxy, Config)
+
+
+def test_120_proxy_factory_uses_other_lazy_proxy():
+    inner = interfaces.proxy(Store, MemoryStore)
+
+    def factory():
+        inner.put('a', 2)
+        return MemoryStore()
+
+    outer = interfaces.proxy(Store, factory)
+    results = []
+    # Run aside so that a deadlock fails the test instead of hanging it
+    thread = threading.Thread(target=lambda: results.append(outer.get('a')))
+    thread.daemon = True
+    thread.start()
+    thread.join(5)
+
+    assert results == [0]
+    assert inner.get('a') == 2
@@ -0,0 +1,79 @@
+import gc
+
+import interfaces
+
+
+def test_010_explicit_implementations(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassA(interfaces.object, implements=TestInterface):
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassB(TestClassA):
+        pass
+
+    assert interfaces.implementations(TestInterface) == {TestClassA}
+    assert interfaces.interfaces_of(TestClassA) == {TestInterface}
+    assert interfaces.interfaces_of(TestClassB) == set()
+
+
+def test_020_implicit_implementations(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassA:
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassB:
+        pass
+
+    assert isinstance(TestClassA(), TestInterface)
+    assert not issubclass(TestClassB, TestInterface)
+
+    assert interfaces.implementations(TestInterface) == {TestClassA}
+    assert interfaces.interfaces_of(TestClassB) == set()
+
+
+def test_030_implementations_of_descendant_interfaces(typeT1, typeT2):
+    class TestInterfaceA(interfaces.interface):
+        def method_a(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestInterfaceB(TestInterfaceA):
+        def method_b(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestClass(interfaces.object, implements=TestInterfaceB):
+        def method_a(self, arg: typeT1) -> typeT2:
+            pass
+
+        def method_b(self, arg: typeT1) -> typeT2:
+            pass
+
+    assert interfaces.implementations(TestInterfaceA) == {TestClass}
+    assert interfaces.interfaces_of(TestClass) == {TestInterfaceA, TestInterfaceB}
+
+
+def test_040_implementations_are_kept_current(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassA(interfaces.object, implements=TestInterface):
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassB(interfaces.object, implements=TestInterface):
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+    del TestClassA.method
+    del TestClassB
+    gc.collect()
+
+    assert interfaces.implementations(TestInterface) == set()
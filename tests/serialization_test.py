@@ -0,0 +1,209 @@
+import inspect
+import pickle
+import typing
+
+import pytest
+
+import interfaces
+
+
+class Store(interfaces.interface):
+    def get(self, key: str, *, default: typing.Optional[int] = None) -> int:
+        pass
+
+    async def fetch(self, key: str) -> bytes:
+        pass
+
+    @property
+    def size(self) -> int:
+        pass
+
+
+class MemoryStore:
+    def get(self, key: str, *, default: typing.Optional[int] = None) -> int:
+        pass
+
+    async def fetch(self, key: str) -> bytes:
+        pass
+
+    @property
+    def size(self) -> int:
+        pass
+
+
+def test_010_dump_spec():
+    serialized = interfaces.dump_spec(Store)
+
+    assert serialized.interface == 'serialization_test.Store'
+    assert not serialized.variance
+    assert dict(serialized.members) == {
+        'get': (
+            'function',
+            (
+                (
+                    ('self', 'POSITIONAL_OR_KEYWORD', None, None),
+                    ('key', 'POSITIONAL_OR_KEYWORD', None, 'str'),
+                ),
+                (
+                    (
+                        'default',
+                        'KEYWORD_ONLY',
+                        'None',
+                        # `Union[int, NoneType]` before Python 3.9
+                        inspect.formatannotation(typing.Optional[int]),
+                    ),
+                ),
+                'int',
+            ),
+            'sync',
+        ),
+        'fetch': (
+            'function',
+            (
+                (
+                    ('self', 'POSITIONAL_OR_KEYWORD', None, None),
+                    ('key', 'POSITIONAL_OR_KEYWORD', None, 'str'),
+                ),
+                (),
+                'bytes',
+            ),
+            'coroutine',
+        ),
+        'size': ('property', 'int', False, False),
+    }
+
+
+def test_020_dumps_and_load_spec_round_trip():
+    serialized = interfaces.dump_spec(Store)
+    data = serialized.dumps()
+
+    assert data == interfaces.dump_spec(Store).dumps()
+    assert '\n' not in data
+    assert interfaces.load_spec(data) == serialized
+    assert interfaces.load_spec(data.encode()) == serialized
+    assert interfaces.load_spec(serialized.dumps(indent=2)) == serialized
+    assert pickle.loads(pickle.dumps(serialized)) == serialized
+    assert hash(interfaces.load_spec(data)) == hash(serialized)
+
+
+def test_030_load_spec_errors():
+    with pytest.raises(ValueError):
+        interfaces.load_spec('{"format": 0}')
+    with pytest.raises(ValueError):
+        interfaces.load_spec('{"format": 3}')
+    with pytest.raises(ValueError):
+        interfaces.load_spec('not json')
+
+
+def test_040_validate_against_serialized_spec():
+    serialized = interfaces.load_spec(interfaces.dump_spec(Store).dumps())
+
+    class Blocking(MemoryStore):
+        def fetch(self, key: str) -> bytes:
+            pass
+
+    class Partial:
+        def get(self, key: str, *, default: typing.Optional[int] = None) -> int:
+            pass
+
+    assert serialized.implemented_by(MemoryStore)
+    assert serialized.find_unimplemented(MemoryStore) is None
+    assert serialized.find_unimplemented(Blocking) == 'fetch'
+    assert serialized.find_unimplemented(Partial) == 'fetch'
+    assert not serialized.implemented_by(int)
+
+
+def test_050_changes_between_releases():
+    class Release1(interfaces.interface):
+        def get(self, key: str) -> int:
+            pass
+
+        def put(self, key: str, value: int) -> None:
+            pass
+
+        def close(self) -> None:
+            pass
+
+    class Release2(interfaces.interface):
+        def get(self, key: str) -> int:
+            pass
+
+        def put(self, key: str, value: int, *, ttl: float = 0.0) -> None:
+            pass
+
+        def flush(self) -> None:
+            pass
+
+    old = interfaces.dump_spec(Release1)
+    new = interfaces.dump_spec(Release2)
+
+    assert old.changes(new) == ['put', 'close', 'flush']
+    assert old.changes(old) == []
+
+
+def test_060_member_kinds():
+    class Shape(interfaces.interface):
+        name: str
+
+        @classmethod
+        def unit(cls) -> 'Shape':
+            pass
+
+        @property
+        def area(self) -> float:
+            pass
+
+    class Square:
+        __slots__ = ('name',)
+
+        @classmethod
+        def unit(cls) -> 'Shape':
+            pass
+
+        @property
+        def area(self) -> float:
+            pass
+
+        @area.setter
+        def area(self, value: float) -> None:
+            pass
+
+    class Typed(Square):
+        __slots__ = ()
+        name: bytes
+
+    class Static(Square):
+        __slots__ = ()
+
+        @staticmethod
+        def unit() -> 'Shape':
+            pass
+
+    serialized = interfaces.load_spec(interfaces.dump_spec(Shape).dumps())
+
+    assert dict(serialized.members)['name'] == ('attribute', 'str')
+    assert dict(serialized.members)['unit'][0] == 'classmethod'
+    assert serialized.implemented_by(Square)
+    assert serialized.find_unimplemented(Typed) == 'name'
+    assert serialized.find_unimplemented(Static) == 'unit'
+
+
+def test_070_string_annotations_differ_from_objects():
+    class Quoted(interfaces.interface):
+        def get(self, key: 'str') -> 'int':
+            pass
+
+    class QuotedStore:
+        def get(self, key: 'str') -> 'int':
+            pass
+
+    serialized = interfaces.load_spec(interfaces.dump_spec(Quoted).dumps())
+
+    assert dict(serialized.members)['get'][1][2] == "'int'"
+    # Like live checks, which do not resolve string annotations
+    for cls in (QuotedStore, MemoryStore):
+        assert serialized.implemented_by(cls) == interfaces.isimplementation(
+            cls, Quoted
+        )
+    assert serialized.implemented_by(QuotedStore)
+    assert not serialized.implemented_by(MemoryStore)
@@ -0,0 +1,304 @@
+import functools
+import operator
+import sys
+
+import interfaces
+
+
+def test_010_fingerprint_function(typeT1, typeT2):
+    def method_a(self, arg: typeT1, *, a: int, b: int = 0) -> typeT2:
+        pass
+
+    def method_b(self, arg: typeT1, *, b: int = 0, a: int) -> typeT2:
+        pass
+
+    def method_c(self, arg: typeT2, *, a: int, b: int = 0) -> typeT2:
+        pass
+
+    fingerprint_a = interfaces.spec.member_fingerprint(method_a)
+
+    assert fingerprint_a == interfaces.spec.member_fingerprint(method_b)
+    assert fingerprint_a != interfaces.spec.member_fingerprint(method_c)
+    assert hash(fingerprint_a)
+
+
+def test_020_fingerprint_data_descriptor():
+    assert interfaces.spec.member_fingerprint(
+        property()
+    ) == interfaces.spec.member_fingerprint(property(lambda self: None))
+    assert interfaces.spec.member_fingerprint(property())[0] == 'property'
+
+
+def test_030_fingerprint_unsupported_member():
+    assert interfaces.spec.member_fingerprint(42) is None
+
+
+def test_040_spec_fingerprints(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(self, arg: typeT1) -> typeT2:
+            pass
+
+        @property
+        def value(self):
+            pass
+
+    fingerprints = interfaces.interface_spec(TestInterface).fingerprints()
+
+    assert fingerprints.keys() == {'method', 'value'}
+    assert fingerprints['method'] == interfaces.spec.member_fingerprint(
+        TestInterface.method
+    )
+
+
+def test_050_registry_weak_keys():
+    import gc
+
+    registry = interfaces.InterfaceSpecRegistry()
+
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    assert registry(TestInterface) is registry(TestInterface)
+    assert TestInterface in registry
+    assert registry.cache_info() == (1, 1, None, 1)
+
+    del TestInterface
+    gc.collect()
+    assert len(registry) == 0
+
+
+def test_060_registry_bounded():
+    registry = interfaces.InterfaceSpecRegistry(maxsize=2)
+
+    class TestInterfaceA(interfaces.interface):
+        pass
+
+    class TestInterfaceB(interfaces.interface):
+        pass
+
+    class TestInterfaceC(interfaces.interface):
+        pass
+
+    registry(TestInterfaceA)
+    registry(TestInterfaceB)
+    registry(TestInterfaceA)
+    registry(TestInterfaceC)
+
+    assert set(registry.registered()) == {TestInterfaceA, TestInterfaceC}
+
+    registry.maxsize = 1
+    assert registry.registered() == [TestInterfaceC]
+
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_070_global_registry_does_not_leak():
+    import gc
+
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    class TestClass(interfaces.object, implements=TestInterface):
+        def method(self):
+            pass
+
+    assert TestInterface in interfaces.interface_spec
+    size = len(interfaces.interface_spec)
+
+    del TestInterface, TestClass
+    gc.collect()
+    assert len(interfaces.interface_spec) == size - 1
+
+
+def test_080_spec_incremental_inheritance(typeT1, typeT2):
+    class TestInterfaceA(interfaces.interface):
+        def method_a(arg: typeT1) -> typeT1:
+            pass
+
+    class TestInterfaceB(interfaces.interface):
+        def method_b(arg: typeT2) -> typeT2:
+            pass
+
+    class TestInterfaceC(TestInterfaceA, TestInterfaceB):
+        def method_c(arg: typeT1) -> typeT2:
+            pass
+
+    spec_a = interfaces.interface_spec(TestInterfaceA)
+    spec_c = interfaces.interface_spec(TestInterfaceC)
+
+    assert list(spec_c) == ['method_b', 'method_a', 'method_c']
+    assert spec_c.fingerprints()['method_a'] is spec_a.fingerprints()['method_a']
+
+
+def test_090_spec_deep_hierarchy():
+    iface = interfaces.interface
+    for depth in range(200):
+        iface = type(iface)(
+            f'TestInterface{depth}', (iface,), {f'method_{depth}': lambda self: None}
+        )
+
+    assert len(interfaces.interface_spec(iface)) == 200
+
+
+def test_100_spec_compact():
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    spec = interfaces.interface_spec(TestInterface)
+
+    assert not hasattr(spec, '__dict__')
+    name = ''.join(['met', 'hod'])
+    assert next(iter(spec)) is sys.intern(name)
+
+
+def test_110_spec_shares_inherited_tables():
+    class TestInterfaceA(interfaces.interface):
+        def method_a(self):
+            pass
+
+    class TestInterfaceB(TestInterfaceA):
+        def method_b(self):
+            pass
+
+    class TestInterfaceC(TestInterfaceA):
+        def method_c(self):
+            pass
+
+    class TestInterfaceD(TestInterfaceB, TestInterfaceC):
+        def method_d(self):
+            pass
+
+    spec_a = interfaces.interface_spec(TestInterfaceA)
+    spec_d = interfaces.interface_spec(TestInterfaceD)
+
+    assert list(spec_d) == ['method_a', 'method_c', 'method_b', 'method_d']
+    assert dict(spec_d.fingerprints().items()).keys() == set(spec_d)
+    assert len(spec_d) == 4
+    assert 'method_a' in spec_d and 'method_e' not in spec_d
+    assert spec_d['method_a'] is spec_a['method_a']
+    assert spec_d._tables[0] is spec_a._tables[0]
+
+
+def make_chain(depth):
+    iface = interfaces.interface
+    for level in range(depth):
+        iface = type(iface)(
+            f'TestInterface{level}',
+            (iface,),
+            {
+                f'method_{level}_{index}': eval('lambda self: None')
+                for index in range(10)
+            },
+        )
+    return iface
+
+
+def test_120_spec_shares_tables_at_any_depth():
+    iface = make_chain(40)
+
+    spec = interfaces.interface_spec(iface)
+    base_spec = interfaces.interface_spec(iface.__bases__[0])
+    spec.fingerprints()
+
+    # One table per interface, the inherited ones are the base's very tables
+    assert len(spec._tables) == len(spec._fingerprints._tables) == 41
+    assert all(map(operator.is_, spec._tables[:-1], base_spec._tables))
+    assert all(
+        map(
+            operator.is_,
+            spec._fingerprints._tables[:-1],
+            base_spec._fingerprints._tables,
+        )
+    )
+    assert spec.__slots__ == ('_iface', '_fingerprints', 'variance')
+
+
+def test_125_spec_own_layer_holds_own_members():
+    iface = make_chain(40)
+
+    spec = interfaces.interface_spec(iface)
+    spec.fingerprints()
+
+    assert list(spec._tables[-1]) == [f'method_39_{index}' for index in range(10)]
+    assert spec._fingerprints._tables[-1].keys() == spec._tables[-1].keys()
+    assert 'method_0_0' in spec and 'method_39_9' in spec and 'method' not in spec
+
+
+def test_130_fingerprint_function_flavor():
+    def method(self, arg: int) -> int:
+        pass
+
+    async def coroutine_method(self, arg: int) -> int:
+        pass
+
+    async def async_generator_method(self, arg: int) -> int:
+        yield
+
+    @functools.wraps(coroutine_method)
+    def decorated(*args, **kwargs):
+        return coroutine_method(*args, **kwargs)
+
+    fingerprints = [
+        interfaces.spec.member_fingerprint(member)
+        for member in (method, coroutine_method, async_generator_method, decorated)
+    ]
+
+    assert [fingerprint[2] for fingerprint in fingerprints] == [
+        'sync',
+        'coroutine',
+        'asyncgenerator',
+        'coroutine',
+    ]
+    assert len({fingerprint[1] for fingerprint in fingerprints}) == 1
+    assert len(set(fingerprints)) == 3
+
+
+def test_140_member_kinds():
+    def func(self, arg: int) -> int:
+        pass
+
+    class Slotted:
+        __slots__ = ('slot',)
+
+    class TestInterface(interfaces.interface):
+        name: str
+        size: int = 0
+        untyped = 0
+        method = func
+        create = classmethod(func)
+        check = staticmethod(func)
+
+        @property
+        def value(self) -> int:
+            pass
+
+    spec = interfaces.interface_spec(TestInterface)
+
+    assert {
+        attr_name: interfaces.spec.member_kind(member)
+        for attr_name, member in spec.items()
+    } == {
+        'name': 'attribute',
+        'size': 'attribute',
+        'untyped': 'value',
+        'method': 'function',
+        'create': 'classmethod',
+        'check': 'staticmethod',
+        'value': 'property',
+    }
+    assert interfaces.spec.member_kind(vars(Slotted)['slot']) == 'value'
+    # Non-data descriptors like `functools.cached_property` (Python 3.8+) are not
+    assert interfaces.spec.member_kind(functools.partialmethod(func)) is None
+
+    fingerprints = spec.fingerprints()
+    assert fingerprints['name'] == ('attribute', str)
+    assert fingerprints['size'] == ('attribute', int)
+    assert fingerprints['untyped'] is None
+    assert fingerprints['create'][0] == 'classmethod'
+    assert fingerprints['create'][1:] == fingerprints['method'][1:]
+    assert fingerprints['check'][1:] == fingerprints['method'][1:]
+    assert fingerprints['value'] == ('property', int, False, False)
@@ -1,3 +1,8 @@
+import functools
+import sys
+import threading
+import typing
+
 import pytest
 
 import interfaces
@@ -165,3 +170,377 @@ def test_100_isimplementation_multi_false_all(typeT1, typeT2, isimplementation):
         pass
 
     assert not isimplementation(TestClass, (TestInterfaceA, TestInterfaceB))
+
+
+def test_110_isimplementation_cache_hit(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    class TestClass:
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    assert interfaces.isimplementation(TestClass, TestInterface)
+    assert interfaces.cache_info(TestInterface) == (0, 1, 1)
+
+    assert issubclass(TestClass, TestInterface)
+    assert interfaces.cache_info(TestInterface) == (1, 1, 1)
+
+
+def test_120_isimplementation_cache_class_mutation(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    class TestClass:
+        pass
+
+    assert not interfaces.isimplementation(TestClass, TestInterface)
+
+    def method(arg: typeT1) -> typeT2:
+        pass
+
+    TestClass.method = method
+    assert interfaces.isimplementation(TestClass, TestInterface)
+
+    del TestClass.method
+    assert not interfaces.isimplementation(TestClass, TestInterface)
+
+
+def test_130_isimplementation_cache_interface_mutation(typeT1, typeT2):
+    class TestInterfaceA(interfaces.interface):
+        def method_a(arg: typeT1) -> typeT1:
+            pass
+
+    class TestInterfaceB(TestInterfaceA):
+        pass
+
+    class TestClass:
+        def method_a(arg: typeT1) -> typeT1:
+            pass
+
+    assert interfaces.isimplementation(TestClass, (TestInterfaceA, TestInterfaceB))
+
+    def method_b(arg: typeT2) -> typeT2:
+        pass
+
+    TestInterfaceA.method_b = method_b
+    assert not interfaces.isimplementation(TestClass, TestInterfaceA)
+    assert not interfaces.isimplementation(TestClass, TestInterfaceB)
+
+
+def test_140_isimplementation_cache_weak_keys(typeT1, typeT2):
+    import gc
+
+    class TestInterface(interfaces.interface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    class TestClass:
+        pass
+
+    assert not interfaces.isimplementation(TestClass, TestInterface)
+    assert interfaces.cache_info(TestInterface).currsize == 1
+
+    del TestClass
+    gc.collect()
+    assert interfaces.cache_info(TestInterface).currsize == 0
+
+
+def test_150_isimplementation_cache_clear(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    class TestClass(interfaces.object, implements=TestInterface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    assert interfaces.cache_info(TestInterface).currsize == 1
+
+    interfaces.cache_clear(TestInterface)
+    assert interfaces.cache_info(TestInterface) == (0, 0, 0)
+    assert interfaces.isimplementation(TestClass, TestInterface)
+
+
+def test_160_isinstance(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassA:
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    class TestClassB:
+        pass
+
+    assert isinstance(TestClassA(), TestInterface)
+    assert not isinstance(TestClassB(), TestInterface)
+    assert not isinstance(TestClassA, TestInterface)
+
+    # Verdicts are looked up once per check, conforming or not
+    assert isinstance(TestClassA(), TestInterface)
+    assert not isinstance(TestClassB(), TestInterface)
+    assert interfaces.cache_info(TestInterface) == (2, 3, 3)
+
+
+def test_170_isinstance_reuses_class_verdict(typeT1, typeT2):
+    class TestInterface(interfaces.interface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    class TestClass(interfaces.object, implements=TestInterface):
+        def method(arg: typeT1) -> typeT2:
+            pass
+
+    assert isinstance(TestClass(), TestInterface)
+    assert isinstance(TestClass(), (int, TestInterface))
+    assert interfaces.cache_info(TestInterface) == (2, 1, 1)
+
+
+def test_180_concurrent_checks_and_mutations():
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def method_a(self, arg: int) -> int:
+        pass
+
+    def method_b(self, arg: str) -> int:
+        pass
+
+    class TestInterface(interfaces.interface):
+        method = method_a
+
+    class TestClassA:
+        method = method_a
+
+    class TestClassB:
+        method = method_b
+
+    stop = threading.Event()
+    errors = []
+
+    def check():
+        try:
+            while not stop.is_set():
+                interfaces.isimplementation(TestClassA, TestInterface)
+                isinstance(TestClassB(), TestInterface)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=check) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    try:
+        for index in range(2000):
+            TestInterface.method = method_b if index % 2 else method_a
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(switch_interval)
+
+    assert not errors
+    # The last definition wins, no verdict of an earlier one is served
+    assert interfaces.isimplementation(TestClassB, TestInterface)
+    assert not interfaces.isimplementation(TestClassA, TestInterface)
+
+
+def test_190_isimplementation_async_methods():
+    class AsyncReader(interfaces.interface):
+        async def read(self, size: int) -> bytes:
+            pass
+
+    class AsyncLines(interfaces.interface):
+        async def lines(self) -> typing.AsyncIterator[str]:
+            yield ''
+
+    class Blocking:
+        def read(self, size: int) -> bytes:
+            pass
+
+    class Async:
+        async def read(self, size: int) -> bytes:
+            pass
+
+        async def lines(self) -> typing.AsyncIterator[str]:
+            yield ''
+
+    class AsyncList:
+        async def lines(self) -> typing.AsyncIterator[str]:
+            pass
+
+    assert interfaces.isimplementation(Async, [AsyncReader, AsyncLines])
+    assert not interfaces.isimplementation(Blocking, AsyncReader)
+    assert not interfaces.isimplementation(AsyncList, AsyncLines)
+
+    with pytest.raises(interfaces.InterfaceNotImplementedError):
+
+        class Wrong(interfaces.object, implements=[AsyncReader]):
+            def read(self, size: int) -> bytes:
+                pass
+
+
+def test_200_isimplementation_member_kinds():
+    class Shape(interfaces.interface):
+        name: str
+
+        @property
+        def area(self) -> float:
+            pass
+
+        @classmethod
+        def unit(cls) -> 'Shape':
+            pass
+
+        @staticmethod
+        def sides() -> int:
+            pass
+
+    class Square:
+        __slots__ = ('name',)
+        area: float = 1.0
+
+        @classmethod
+        def unit(cls) -> 'Shape':
+            pass
+
+        @staticmethod
+        def sides() -> int:
+            pass
+
+    class Record(Square):
+        __slots__ = ()
+        name: str
+
+    class Named(Square):
+        __slots__ = ()
+        name: bytes
+
+    class Circle(Record):
+        __slots__ = ()
+
+        @property
+        def area(self) -> float:
+            pass
+
+        @area.setter
+        def area(self, value: float) -> None:
+            pass
+
+    class Instance(Circle):
+        __slots__ = ()
+
+        def unit(self) -> 'Shape':
+            pass
+
+    class Static(Circle):
+        __slots__ = ()
+
+        @classmethod
+        def sides(cls) -> int:
+            pass
+
+    # Untyped slots implement any attribute, typed ones the same annotation only
+    assert interfaces.isimplementation(Square, Shape)
+    assert interfaces.isimplementation(Record, Shape)
+    assert not interfaces.isimplementation(Named, Shape)
+    # Properties may add a setter
+    assert interfaces.isimplementation(Circle, Shape)
+    assert not interfaces.isimplementation(Instance, Shape)
+    assert not interfaces.isimplementation(Static, Shape)
+
+
+def test_210_isimplementation_attributes():
+    class Point(interfaces.interface):
+        x: int
+
+        @property
+        def y(self) -> int:
+            pass
+
+    class Annotated:
+        # Instance attributes declared with annotations only, like dataclasses
+        x: int
+        y: int
+
+    class ReadOnly:
+        @property
+        def x(self) -> int:
+            pass
+
+        @property
+        def y(self) -> int:
+            pass
+
+    class Settable(ReadOnly):
+        @ReadOnly.x.setter
+        def x(self, value: int) -> None:
+            pass
+
+    assert interfaces.isimplementation(Annotated, Point)
+    # A read-only property cannot stand in for an attribute
+    assert not interfaces.isimplementation(ReadOnly, Point)
+    assert interfaces.isimplementation(Settable, Point)
+    assert (
+        interfaces.util._find_unimplemented(object, interfaces.interface_spec(Point))
+        == 'y'
+    )
+
+
+@pytest.mark.parametrize('decorator', [lambda method: method, classmethod])
+def test_220_isimplementation_cache_member_reuse(decorator):
+    class TestInterface(interfaces.interface):
+        @decorator
+        def method(arg: int) -> int:
+            pass
+
+    class TestClass:
+        pass
+
+    def method(arg_type):
+        def method(arg):
+            pass
+
+        method.__annotations__ = {'arg': arg_type, 'return': int}
+        return decorator(method)
+
+    # Freed members may leave their ids to new ones
+    for _ in range(200):
+        TestClass.method = method(int)
+        assert interfaces.isimplementation(TestClass, TestInterface)
+        del TestClass.method
+
+        TestClass.method = method(str)
+        assert not interfaces.isimplementation(TestClass, TestInterface)
+        del TestClass.method
+
+
+def test_230_isimplementation_cache_hit_class_method():
+    class TestInterface(interfaces.interface):
+        @classmethod
+        def method(cls) -> None:
+            pass
+
+    class TestClass:
+        @classmethod
+        def method(cls) -> None:
+            pass
+
+    assert interfaces.isimplementation(TestClass, TestInterface)
+    assert interfaces.isimplementation(TestClass, TestInterface)
+    assert interfaces.cache_info(TestInterface) == (1, 1, 1)
+
+
+def test_240_isimplementation_non_class():
+    class TestInterface(interfaces.interface):
+        def method(self):
+            pass
+
+    # Weakly referenceable, so its verdict is cached like the ones of classes
+    obj = functools.partial(print)
+
+    assert not interfaces.isimplementation(obj, TestInterface)
+    assert not interfaces.isimplementation(obj, TestInterface)
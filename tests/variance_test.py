@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import typing
+
+import interfaces
+import interfaces.variance
+
+
+class Animal:
+    pass
+
+
+class Dog(Animal):
+    pass
+
+
+class Puppy(Dog):
+    pass
+
+
+class Shelter(interfaces.interface, variance=True):
+    def adopt(self, name: str) -> Animal:
+        pass
+
+    def admit(self, animal: Dog) -> None:
+        pass
+
+
+def resolved(func):
+    func.__annotations__ = typing.get_type_hints(func)
+    return func
+
+
+def test_010_variance_resolves_string_annotations():
+    class StrictShelter(interfaces.interface):
+        def adopt(self, name: str) -> Animal:
+            pass
+
+    class TestClass:
+        @resolved
+        def adopt(self, name: str) -> Animal:
+            pass
+
+        @resolved
+        def admit(self, animal: Dog) -> None:
+            pass
+
+    assert not interfaces.isimplementation(TestClass, StrictShelter)
+    assert interfaces.isimplementation(TestClass, Shelter)
+
+
+def test_020_variance_covariant_return():
+    class TestClass:
+        def adopt(self, name: str) -> Dog:
+            pass
+
+        def admit(self, animal: Dog) -> None:
+            pass
+
+    class TestClassWrong:
+        def adopt(self, name: str) -> object:
+            pass
+
+        def admit(self, animal: Dog) -> None:
+            pass
+
+    assert interfaces.isimplementation(TestClass, Shelter)
+    assert not interfaces.isimplementation(TestClassWrong, Shelter)
+
+
+def test_030_variance_contravariant_parameters():
+    class TestClass:
+        def adopt(self, name: str) -> Animal:
+            pass
+
+        def admit(self, animal: typing.Optional[Animal]) -> None:
+            pass
+
+    class TestClassWrong:
+        def adopt(self, name: str) -> Animal:
+            pass
+
+        def admit(self, animal: Puppy) -> None:
+            pass
+
+    assert interfaces.isimplementation(TestClass, Shelter)
+    assert not interfaces.isimplementation(TestClassWrong, Shelter)
+
+
+def test_040_variance_keeps_parameters_structure():
+    class TestClassRenamed:
+        def adopt(self, title: str) -> Animal:
+            pass
+
+        def admit(self, animal: Dog) -> None:
+            pass
+
+    class TestClassDefault:
+        def adopt(self, name: str = 'Rex') -> Animal:
+            pass
+
+        def admit(self, animal: Dog) -> None:
+            pass
+
+    assert not interfaces.isimplementation(TestClassRenamed, Shelter)
+    assert not interfaces.isimplementation(TestClassDefault, Shelter)
+
+
+def test_050_variance_is_inherited():
+    class TestInterface(Shelter):
+        def release(self, animal: Animal) -> typing.Sequence[Animal]:
+            pass
+
+    class TestClass:
+        def adopt(self, name: str) -> Dog:
+            pass
+
+        def admit(self, animal: Dog) -> None:
+            pass
+
+        def release(self, animal: typing.Any) -> typing.List[Dog]:
+            pass
+
+    assert interfaces.isimplementation(TestClass, TestInterface)
+    assert issubclass(TestClass, TestInterface)
+
+
+def test_060_variance_explicit_implementation():
+    class TestClass(interfaces.object, implements=[Shelter]):
+        def adopt(self, name: str) -> Puppy:
+            pass
+
+        def admit(self, animal: Animal) -> None:
+            pass
+
+    assert isinstance(TestClass(), Shelter)
+
+
+def test_070_variance_verify_matrix():
+    class TestClass:
+        def adopt(self, name: str) -> Dog:
+            pass
+
+        def admit(self, animal: Dog) -> None:
+            pass
+
+    class TestClassWrong:
+        def adopt(self, name: str) -> int:
+            pass
+
+        def admit(self, animal: Dog) -> None:
+            pass
+
+    matrix = interfaces.verify_matrix([TestClass, TestClassWrong], [Shelter])
+    assert matrix[TestClass, Shelter].ok
+    assert matrix[TestClassWrong, Shelter].reason == 'mismatch'
+
+
+def test_080_issubtype():
+    issubtype = interfaces.variance.issubtype
+
+    assert issubtype(Dog, Animal)
+    assert not issubtype(Animal, Dog)
+    assert issubtype(None, typing.Optional[Dog])
+    assert issubtype(typing.Union[Dog, Puppy], Animal)
+    assert not issubtype(typing.Union[Dog, int], Animal)
+    assert issubtype(typing.List[Dog], typing.Sequence[Animal])
+    assert not issubtype(typing.List[Animal], typing.List[Dog])
+    assert issubtype(typing.Dict[str, Dog], typing.Mapping[str, typing.Any])
+    assert issubtype(typing.List[int], list)
+    assert not issubtype(list, typing.List[int])
+    assert issubtype(typing.Callable[[int], str], typing.Callable[[int], str])
+    assert issubtype('Unresolved', 'Unresolved')
+    assert not issubtype('Unresolved', Animal)
+
+
+def test_090_resolved_signature_cached():
+    # Postponed annotations are strings already, quoting them again is only
+    # resolved by `typing.get_type_hints` since Python 3.9
+    def method(self, animal: Dog) -> Animal:
+        pass
+
+    signature = interfaces.variance.resolved_signature(method)
+    assert interfaces.variance.resolved_signature(method) is signature
+    assert signature[0][1][3] is Dog
+    assert signature[2] is Animal
+
+
+T_co = typing.TypeVar('T_co', covariant=True)
+
+
+class Box(typing.Generic[T_co]):
+    pass
+
+
+def test_100_issubtype_generic_variance():
+    issubtype = interfaces.variance.issubtype
+
+    # Callable parameters are contravariant, its return covariant
+    assert issubtype(typing.Callable[[Animal], None], typing.Callable[[Dog], None])
+    assert not issubtype(typing.Callable[[Dog], None], typing.Callable[[Animal], None])
+    assert issubtype(typing.Callable[[], Dog], typing.Callable[[], Animal])
+    assert not issubtype(typing.Callable[[], Animal], typing.Callable[[], Dog])
+    assert issubtype(typing.Callable[[Dog], Dog], typing.Callable[..., Animal])
+    # Mutable containers are invariant, read-only ones covariant
+    assert not issubtype(typing.List[Dog], typing.List[Animal])
+    assert not issubtype(typing.Dict[str, Dog], typing.Dict[str, Animal])
+    assert issubtype(typing.Mapping[str, Dog], typing.Mapping[str, Animal])
+    assert not issubtype(typing.Mapping[Dog, str], typing.Mapping[Animal, str])
+    assert issubtype(typing.Tuple[Dog, Puppy], typing.Tuple[Animal, Dog])
+    assert issubtype(typing.List[typing.Any], typing.List[Dog])
+    assert issubtype(Box[Dog], Box[Animal])
+
+
+def test_110_variance_generic_arguments():
+    class Kennel(interfaces.interface, variance=True):
+        def feeder(self) -> typing.Callable[[Dog], None]:
+            pass
+
+        def dogs(self) -> typing.List[Animal]:
+            pass
+
+    class TestClass:
+        def feeder(self) -> typing.Callable[[Animal], None]:
+            pass
+
+        def dogs(self) -> typing.List[Animal]:
+            pass
+
+    class TestClassWrongCallable:
+        def feeder(self) -> typing.Callable[[Puppy], None]:
+            pass
+
+        def dogs(self) -> typing.List[Animal]:
+            pass
+
+    class TestClassWrongList:
+        def feeder(self) -> typing.Callable[[Dog], None]:
+            pass
+
+        def dogs(self) -> typing.List[Dog]:
+            pass
+
+    assert interfaces.isimplementation(TestClass, Kennel)
+    assert not interfaces.isimplementation(TestClassWrongCallable, Kennel)
+    assert not interfaces.isimplementation(TestClassWrongList, Kennel)